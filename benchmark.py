@@ -0,0 +1,75 @@
+import argparse
+import sys
+from benchmarks.cases import CASES
+from benchmarks.harness import Report, compare, environment, format_bytes, measure
+
+DEFAULT_SIZES = [10, 100, 1_000, 10_000, 100_000]
+DEFAULT_BASELINE = "benchmarks/baseline.json"
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Time the Bowl and FishTank hot paths at a range of population sizes.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="Population sizes to run at")
+    parser.add_argument("--cases", nargs="+", choices=[case.name for case in CASES],
+                        help="Only run these cases (default: all)")
+    parser.add_argument("--repeats", type=int, default=30, help="Repetitions per case and size")
+    parser.add_argument("--max-seconds", type=float, default=10.0,
+                        help="Stop repeating a case after this long, once it has at least three samples")
+    parser.add_argument("--output", help="Write the results to this JSON file")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="Results to compare against, if the file exists")
+    parser.add_argument("--save-baseline", action="store_true", help="Write the results to --baseline")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="Fail if a median latency is more than this fraction slower than the baseline")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    cases = [case for case in CASES if not args.cases or case.name in args.cases]
+    report = Report(environment=environment())
+
+    print(f"{'case':<26}{'size':>8}{'n':>5}{'p50 ms':>11}{'p90 ms':>11}{'p99 ms':>11}{'max ms':>11}"
+          f"{'memory':>11}{'peak':>11}")
+    for case in cases:
+        for size in args.sizes:
+            if case.max_size is not None and size > case.max_size:
+                continue
+            result = measure(case, size, repeats=args.repeats, max_seconds=args.max_seconds)
+            report.results.append(result)
+            print(f"{result.case:<26}{result.size:>8}{result.repeats:>5}{result.p50_ms:>11.3f}"
+                  f"{result.p90_ms:>11.3f}{result.p99_ms:>11.3f}{result.max_ms:>11.3f}"
+                  f"{format_bytes(result.setup_bytes):>11}{format_bytes(result.peak_bytes):>11}", flush=True)
+
+    if args.output:
+        report.save(args.output)
+
+    if args.save_baseline:
+        report.save(args.baseline)
+        print(f"Baseline saved to {args.baseline}")
+        return
+
+    try:
+        baseline = Report.load(args.baseline)
+    except FileNotFoundError:
+        # ✅ Baselines are machine-specific, so none is committed; say so rather than pass without comparing
+        print(f"\nNo baseline at {args.baseline}, so nothing was compared. "
+              f"Run with --save-baseline to record one on this machine.")
+        return
+
+    print(f"\nCompared with {args.baseline} ({baseline.environment.get('commit')}, "
+          f"{baseline.environment.get('time')}):")
+    regressions = []
+    for comparison in compare(report, baseline):
+        regressed = comparison.ratio > 1 + args.threshold
+        if regressed:
+            regressions.append(comparison)
+        print(f"  {comparison.key:<34}{comparison.baseline_ms:>11.3f} → {comparison.current_ms:>11.3f} ms "
+              f"({comparison.ratio:>5.2f}x){'  ⚠️ regression' if regressed else ''}")
+
+    if regressions:
+        print(f"{len(regressions)} case(s) are more than {args.threshold:.0%} slower than the baseline.")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+The operations the benchmark suite times. Every setup is seeded, so a population of a given size is
+the same tank on every run.
+"""
+import contextlib
+import io
+import math
+import os
+import random
+import tempfile
+from typing import Dict, List
+
+from lib.v1.bowl import AVAILABLE_CREATURES, Bowl
+from lib.v1.clock import SimulatedClock
+
+from .harness import Case
+
+SEED = 1234
+FOOD_EVERY = 10  # Ticks between cookies in the update benchmark, like headless_v1.py's default
+
+_temp_dir = tempfile.TemporaryDirectory(prefix="fishtank-bench-")
+_saved_tanks: Dict[int, str] = {}
+
+
+def tank_side(size: int) -> int:
+    """Square tank with about ten cells per creature, never smaller than the usual 73x30 tank's height."""
+    return max(30, math.isqrt(size * 10))
+
+
+def populated_bowl(size: int) -> Bowl:
+    """A seeded tank holding size creatures, in the same species mix populate_random_tank() uses."""
+    side = tank_side(size)
+    clock = SimulatedClock()
+    bowl = Bowl(width=side, height=side, save_file="", clock=clock, seed=SEED)
+    species = list(AVAILABLE_CREATURES)
+    weights = [spawn_rate[1] for spawn_rate in AVAILABLE_CREATURES.values()]
+    for i in range(size):
+        creature_type = bowl.rng.choices(species, weights)[0]
+        x = bowl.rng.randint(1, side - 3)
+        y = bowl.rng.randint(1, side - 3)
+        bowl.add_creature(creature_type.create_creature(f"{creature_type.__name__}_{i}", bowl, x, y))
+    for _ in range(max(1, size // 1000)):
+        bowl.drop_food()
+    return bowl
+
+
+def _quietly(operation, *args) -> None:
+    """save_state() and load_state() announce themselves; keep that out of the benchmark output."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        operation(*args)
+
+
+# -- v1 ------------------------------------------------------------------------------------------
+
+class _Ticker:
+    def __init__(self, size: int) -> None:
+        self.bowl = populated_bowl(size)
+        self.ticks = 0
+
+    def tick(self) -> None:
+        if self.ticks % FOOD_EVERY == 0:
+            self.bowl.drop_food()
+        self.bowl.update()
+        self.bowl.clock.advance()
+        self.ticks += 1
+
+
+def _ready_to_breed(size: int) -> Bowl:
+    bowl = populated_bowl(size)
+    for creature in bowl.creatures:
+        creature.eaten_since_last_reproduction = creature.REPRODUCTION_THRESHOLD
+    return bowl
+
+
+def _save_path(size: int) -> str:
+    return os.path.join(_temp_dir.name, f"save_{size}.tank")
+
+
+def _saved_tank(size: int) -> str:
+    path = _saved_tanks.get(size)
+    if path is None:
+        path = _saved_tanks[size] = os.path.join(_temp_dir.name, f"load_{size}.tank")
+        _quietly(populated_bowl(size).save_state, path)
+    return path
+
+
+def _empty_bowl_for(size: int) -> tuple:
+    side = tank_side(size)
+    return Bowl(width=side, height=side, save_file="", clock=SimulatedClock(), seed=SEED), _saved_tank(size)
+
+
+# -- v2 ------------------------------------------------------------------------------------------
+
+def _fish_tank(size: int):
+    from lib.v2.fish_tank import FishTank  # Needs pygame, so only imported when a v2 case runs
+    random.seed(SEED)
+    tank = FishTank(width=1280, height=720, fps=60, per_species=max(1, size // 3), headless=True)
+    tank.render()  # ✅ The first frame is a full redraw; time the steady state
+    return tank
+
+
+CASES: List[Case] = [
+    Case("bowl.update", setup=_Ticker, run=lambda ticker: ticker.tick()),
+    Case("bowl.render", setup=populated_bowl, run=lambda bowl: bowl.render()),
+    Case("bowl.handle_reproduction", setup=_ready_to_breed, run=lambda bowl: bowl.handle_reproduction(),
+         fresh=True),
+    Case("bowl.save_state", setup=lambda size: (populated_bowl(size), _save_path(size)),
+         run=lambda state: _quietly(state[0].save_state, state[1])),
+    Case("bowl.load_state", setup=_empty_bowl_for, run=lambda state: _quietly(state[0].load_state, state[1]),
+         fresh=True),
+    Case("fishtank.update", setup=_fish_tank, run=lambda tank: tank.update()),
+    # Every frame erases and redraws every sprite, so render alone costs the same whether or not they moved
+    Case("fishtank.render", setup=_fish_tank, run=lambda tank: tank.render()),
+]
@@ -0,0 +1,163 @@
+import gc
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+
+@dataclass
+class Case:
+    """
+    One operation to time at a range of population sizes.
+
+    :param setup: Builds whatever run() needs for a population of the given size. Not timed.
+    :param run: The operation being measured, called once per repetition.
+    :param fresh: Call setup() again before every repetition, for operations that use up their input.
+    :param max_size: Largest population this case is run at, for operations that get impractical beyond it.
+    """
+    name: str
+    setup: Callable[[int], Any]
+    run: Callable[[Any], None]
+    fresh: bool = False
+    max_size: Optional[int] = None
+    teardown: Callable[[Any], None] = lambda state: None
+
+
+@dataclass
+class Result:
+    case: str
+    size: int
+    repeats: int
+    mean_ms: float
+    p50_ms: float
+    p90_ms: float
+    p99_ms: float
+    max_ms: float
+    setup_bytes: int  # Memory held by the setup's state
+    peak_bytes: int  # Highest extra memory in use while the operation runs
+
+    @property
+    def key(self) -> str:
+        return f"{self.case}@{self.size}"
+
+
+def percentile(samples: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of a non-empty list."""
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, max(0, round(fraction * len(ordered)) - 1))]
+
+
+def measure(case: Case, size: int, repeats: int, max_seconds: float, warmup: int = 1) -> Result:
+    """Times case at size, stopping early (after at least three repetitions) once max_seconds have passed."""
+    # ✅ Memory is measured in its own pass, since tracing allocations slows everything down
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    state = case.setup(size)
+    setup_bytes = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.reset_peak()
+    baseline = tracemalloc.get_traced_memory()[0]
+    case.run(state)
+    peak_bytes = tracemalloc.get_traced_memory()[1] - baseline
+    tracemalloc.stop()
+    case.teardown(state)
+
+    state = case.setup(size)
+    for _ in range(warmup):
+        case.run(state)
+        if case.fresh:
+            case.teardown(state)
+            state = case.setup(size)
+
+    samples: List[float] = []
+    deadline = time.perf_counter() + max_seconds
+    while len(samples) < repeats:
+        if case.fresh and samples:
+            case.teardown(state)
+            state = case.setup(size)
+        gc.collect()
+        start = time.perf_counter()
+        case.run(state)
+        samples.append((time.perf_counter() - start) * 1000)
+        if len(samples) >= 3 and time.perf_counter() > deadline:
+            break
+    case.teardown(state)
+
+    return Result(
+        case=case.name,
+        size=size,
+        repeats=len(samples),
+        mean_ms=statistics.fmean(samples),
+        p50_ms=percentile(samples, 0.50),
+        p90_ms=percentile(samples, 0.90),
+        p99_ms=percentile(samples, 0.99),
+        max_ms=max(samples),
+        setup_bytes=setup_bytes,
+        peak_bytes=peak_bytes,
+    )
+
+
+def environment() -> Dict[str, str]:
+    """Where the numbers came from, so runs on different machines aren't compared by accident."""
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                                check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = "unknown"
+    return {
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "commit": commit,
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+    }
+
+
+@dataclass
+class Report:
+    environment: Dict[str, str]
+    results: List[Result] = field(default_factory=list)
+
+    def save(self, path: str) -> None:
+        with open(path, "w") as file:
+            json.dump({"environment": self.environment, "results": [asdict(r) for r in self.results]}, file,
+                      indent=4)
+
+    @classmethod
+    def load(cls, path: str) -> "Report":
+        with open(path, "r") as file:
+            data = json.load(file)
+        return cls(environment=data["environment"], results=[Result(**r) for r in data["results"]])
+
+
+@dataclass
+class Comparison:
+    key: str
+    baseline_ms: float
+    current_ms: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current_ms / self.baseline_ms if self.baseline_ms > 0 else float("inf")
+
+
+def compare(current: Report, baseline: Report) -> List[Comparison]:
+    """Pairs up median latencies for every case and size both reports have."""
+    previous = {result.key: result for result in baseline.results}
+    return [
+        Comparison(result.key, previous[result.key].p50_ms, result.p50_ms)
+        for result in current.results if result.key in previous
+    ]
+
+
+def format_bytes(count: int) -> str:
+    for unit in ("B", "KB", "MB"):
+        if abs(count) < 1024:
+            return f"{count:.0f} {unit}"
+        count /= 1024
+    return f"{count:.1f} GB"
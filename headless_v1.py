@@ -0,0 +1,71 @@
+import argparse
+from lib.v1.bowl import Bowl
+from lib.v1.clock import SimulatedClock
+from lib.v1.headless import fast_forward
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Fast-forward the v1 bowl with no rendering.")
+    parser.add_argument("--width", type=int, default=73, help="Width of the tank")
+    parser.add_argument("--height", type=int, default=30, help="Height of the tank")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for the simulation's random number generator")
+    parser.add_argument("--ticks", type=int, default=10_000, help="Number of updates to run")
+    parser.add_argument("--tick-seconds", type=float, default=0.3, help="Simulated seconds per update")
+    parser.add_argument("--food-every", type=int, default=10, help="Drop food every N ticks (0 to never feed)")
+    parser.add_argument("--engine", choices=["objects", "vector", "sharded"], default="objects",
+                        help="Simulate creature by creature, all at once with NumPy, "
+                             "or in horizontal stripes spread over worker processes")
+    parser.add_argument("--workers", type=int, help="Worker processes for --engine sharded (default: one per core)")
+    parser.add_argument("--load", help="Start from a saved tank instead of a freshly populated one")
+    parser.add_argument("--save", help="Save the tank here when the run finishes")
+    parser.add_argument("--profile", action="store_true", help="Time each phase of a tick and print them at the end")
+    parser.add_argument("--metrics", help="Append a JSON line of profiler metrics to this file every --metrics-interval")
+    parser.add_argument("--metrics-interval", type=float, default=10.0, help="Seconds between metrics lines")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    clock = SimulatedClock(tick_seconds=args.tick_seconds)
+    bowl_type = Bowl
+    if args.engine == "vector":
+        from lib.v1.vector_bowl import VectorBowl  # Needs NumPy, so only imported when asked for
+        bowl_type = VectorBowl
+    options = {}
+    if args.engine == "sharded":
+        from lib.v1.sharded import ShardedBowl
+        bowl_type = ShardedBowl
+        options["workers"] = args.workers
+    bowl = bowl_type(width=args.width, height=args.height, save_file=args.load or "", clock=clock, seed=args.seed,
+                     **options)
+    if args.load:
+        bowl.load_state()
+    else:
+        bowl.populate_random_tank()
+    if args.profile or args.metrics:
+        bowl.profiler.enabled = True
+    if args.metrics:
+        bowl.profiler.dump_to(args.metrics, args.metrics_interval)
+
+    try:
+        result = fast_forward(bowl, clock, ticks=args.ticks, food_every=args.food_every)
+    finally:
+        bowl.profiler.close()  # ✅ Flushes the last metrics line and closes --metrics
+
+    print(f"Ran {result.ticks} ticks ({result.simulated_seconds:.0f}s of tank time) "
+          f"in {result.wall_seconds:.2f}s: {result.ticks_per_second:.0f} ticks/s")
+    print(f"Population: {result.population}, cookies: {result.cookies}")
+    print(f"State digest: {result.digest}")
+    if args.profile:
+        print("\n".join(bowl.profiler.overlay_lines()))
+
+    if args.save:
+        bowl.save_file = args.save
+        bowl.save_state()
+
+    if args.engine == "sharded":
+        bowl.close()
+
+
+if __name__ == "__main__":
+    main()
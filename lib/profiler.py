@@ -0,0 +1,204 @@
+"""
+Lightweight per-phase timing for the v1 and v2 simulations.
+
+Phases are timed with perf_counter and kept in rolling histograms of the last few hundred samples,
+so percentiles reflect what the tank is doing now rather than since it started. A disabled
+profiler costs a couple of attribute lookups per phase.
+"""
+import json
+import math
+import time
+from collections import deque
+from typing import Deque, Dict, List, Optional, TextIO
+
+WINDOW = 600  # Samples each histogram remembers: a few minutes of v1 ticks, ten seconds of v2 frames
+
+# Bucket i holds samples up to FIRST_BUCKET * GROWTH ** i seconds: a quarter-octave apart from 1 µs to ~17 s
+FIRST_BUCKET = 1e-6
+GROWTH = 2 ** 0.25
+BUCKETS = 97
+
+
+class RollingHistogram:
+    """Log-bucketed histogram over the most recent samples. Percentiles are accurate to a bucket (~19%)."""
+
+    def __init__(self, window: int = WINDOW) -> None:
+        self.counts: List[int] = [0] * BUCKETS
+        self._recent: Deque[int] = deque()
+        self._recent_seconds: Deque[float] = deque()
+        self._window = window
+        self.total_seconds = 0.0  # Sum of the samples in the window
+
+    def __len__(self) -> int:
+        return len(self._recent)
+
+    @staticmethod
+    def bucket(seconds: float) -> int:
+        if seconds <= FIRST_BUCKET:
+            return 0
+        return min(BUCKETS - 1, math.ceil(math.log(seconds / FIRST_BUCKET, GROWTH)))
+
+    @staticmethod
+    def upper_bound(bucket: int) -> float:
+        return FIRST_BUCKET * GROWTH ** bucket
+
+    def add(self, seconds: float) -> None:
+        bucket = self.bucket(seconds)
+        self.counts[bucket] += 1
+        self._recent.append(bucket)
+        self._recent_seconds.append(seconds)
+        self.total_seconds += seconds
+        if len(self._recent) > self._window:
+            self.counts[self._recent.popleft()] -= 1
+            self.total_seconds -= self._recent_seconds.popleft()
+
+    def percentile(self, fraction: float) -> float:
+        """Upper bound of the bucket the given fraction of samples fall at or below, in seconds."""
+        if not self._recent:
+            return 0.0
+        rank = max(1, math.ceil(fraction * len(self._recent)))
+        seen = 0
+        for bucket, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                return self.upper_bound(bucket)
+        return self.upper_bound(BUCKETS - 1)
+
+    @property
+    def mean(self) -> float:
+        return self.total_seconds / len(self._recent) if self._recent else 0.0
+
+
+class _Phase:
+    __slots__ = ('profiler', 'name', 'start')
+
+    def __init__(self, profiler: "Profiler", name: str) -> None:
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self) -> None:
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc_info) -> None:
+        self.profiler.record(self.name, time.perf_counter() - self.start)
+
+
+class _NoPhase:
+    def __enter__(self) -> None:
+        pass
+
+    def __exit__(self, *exc_info) -> None:
+        pass
+
+
+_NO_PHASE = _NoPhase()
+
+
+class Profiler:
+    """
+    Collects phase timings, counters and gauges for a running tank.
+
+    The tank calls phase() around each part of its tick or frame and tick_done() at the end, which
+    also writes a JSON line to the metrics stream every dump_interval seconds when one is set.
+    """
+
+    def __init__(self, enabled: bool = True, window: int = WINDOW) -> None:
+        self.enabled = enabled
+        self.window = window
+        self.histograms: Dict[str, RollingHistogram] = {}
+        self.counters: Dict[str, int] = {}
+        self.gauges: Dict[str, float] = {}
+        self.ticks = 0
+        self._dump: Optional[TextIO] = None
+        self._dump_interval = 0.0
+        self._last_dump = time.monotonic()
+        self._counters_at_dump: Dict[str, int] = {}
+        self._ticks_at_dump = 0
+
+    def dump_to(self, path: str, interval: float = 10.0) -> None:
+        """Appends a JSON line of metrics to the file at path every interval seconds, until close()."""
+        self.close()
+        self._dump = open(path, "a")
+        self._dump_interval = interval
+        self._last_dump = time.monotonic()
+        self._counters_at_dump = dict(self.counters)
+        self._ticks_at_dump = self.ticks
+
+    def close(self) -> None:
+        """Writes the metrics for any ticks since the last line, then closes the metrics file."""
+        if self._dump is None:
+            return
+        try:
+            if self.ticks > self._ticks_at_dump:
+                self.write_metrics()
+        finally:
+            self._dump.close()
+            self._dump = None
+
+    def phase(self, name: str):
+        """Context manager that times its body as the named phase."""
+        return _Phase(self, name) if self.enabled else _NO_PHASE
+
+    def record(self, name: str, seconds: float) -> None:
+        histogram = self.histograms.get(name)
+        if histogram is None:
+            histogram = self.histograms[name] = RollingHistogram(self.window)
+        histogram.add(seconds)
+
+    def count(self, name: str, amount: int = 1) -> None:
+        if self.enabled:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    def tick_done(self, seconds: float, **gauges: float) -> None:
+        """Records a whole tick (or frame) and the gauges that go with it, e.g. population."""
+        self.record("tick", seconds)
+        self.gauges.update(gauges)
+        self.ticks += 1
+        if self._dump is not None and time.monotonic() - self._last_dump >= self._dump_interval:
+            self.write_metrics()
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """p50, p99 and mean of every phase, in milliseconds."""
+        return {
+            name: {
+                "p50_ms": histogram.percentile(0.50) * 1000,
+                "p99_ms": histogram.percentile(0.99) * 1000,
+                "mean_ms": histogram.mean * 1000,
+            }
+            for name, histogram in self.histograms.items()
+        }
+
+    def write_metrics(self) -> None:
+        now = time.monotonic()
+        elapsed = max(now - self._last_dump, 1e-9)
+        phases = self.summary()
+        tick = phases.get("tick", {"p50_ms": 0.0, "p99_ms": 0.0})
+        line = {
+            "time": time.time(),
+            "ticks": self.ticks,
+            "tick_p50_ms": tick["p50_ms"],
+            "tick_p99_ms": tick["p99_ms"],
+            **self.gauges,
+            **{
+                f"{name}_per_sec": (count - self._counters_at_dump.get(name, 0)) / elapsed
+                for name, count in self.counters.items()
+            },
+            "phases": phases,
+        }
+        self._dump.write(json.dumps(line) + "\n")
+        self._dump.flush()
+        self._last_dump = now
+        self._counters_at_dump = dict(self.counters)
+        self._ticks_at_dump = self.ticks
+
+    def overlay_lines(self, limit: int = 8) -> List[str]:
+        """A short text panel: the tick, then the slowest phases by p99."""
+        phases = self.summary()
+        lines = [f"{'phase':<28}{'p50':>8}{'p99':>8}"]
+        ordered = sorted((name for name in phases if name != "tick"), key=lambda n: -phases[n]["p99_ms"])
+        for name in (["tick"] if "tick" in phases else []) + ordered[:limit]:
+            lines.append(f"{name[-28:]:<28}{phases[name]['p50_ms']:>6.1f}ms{phases[name]['p99_ms']:>6.1f}ms")
+        gauges = "  ".join(f"{key}: {value:g}" for key, value in self.gauges.items())
+        if gauges:
+            lines.append(gauges)
+        return lines
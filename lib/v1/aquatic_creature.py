@@ -1,7 +1,17 @@
-import random
-import time
+from functools import lru_cache
 from typing import Optional
-from wcwidth import wcswidth
+
+from .glyphs import GLYPHS
+
+
+@lru_cache(maxsize=None)
+def species_compatible(cls1: type, cls2: type) -> bool:
+    """Checks (once per class pair) whether two creature classes share a species."""
+    for base1 in cls1.__bases__:
+        for base2 in cls2.__bases__:
+            if issubclass(base1, base2) or issubclass(base2, base1):
+                return True
+    return False
 
 
 class AquaticCreature:
@@ -18,30 +28,99 @@ class AquaticCreature:
     ALLOW_RARE = True
 
     AVAILABLE_SEXES = ["Male", "Female"]
+    IS_PREDATOR = False  # Predators hunt other creatures instead of cookies and are never prey themselves
+
+    # ✅ No per-instance dict: creatures are numerous and this keeps them small and quick to read
+    __slots__ = (
+        'name', 'bowl', 'in_bowl', 'uid', 'slot', '_closest_food', '_closest_food_key', '_x', '_y', 'glyph_id',
+        'rare', 'birth_time', 'last_food_removed', '_current_food_count', '_eaten_since_last_reproduction',
+        'last_reproduction_time', '_offspring_count', 'sex', '_digestion',
+    )
 
     def __init__(self, name: str, bowl: 'Bowl', emoji: str, x: int | None = None, y: int | None = None,
                  rare: bool = False) -> None:
-        self.name = name
-        self.bowl = bowl
-        self.x = x
-        self.y = y
-        self.emoji = emoji
-        # self.width = 2  # Emojis take up two spaces in most terminals
+        self._attach(name, bowl)
+        self._x = x
+        self._y = y
+        self.glyph_id = GLYPHS.register(emoji)  # ✅ Index into the shared glyph registry
         self.rare = rare
 
         # Age Tracking
-        self.birth_time = time.time()
+        self.birth_time = self.bowl.clock.now()
 
         # Fullness Tracking
         self.last_food_removed = self.birth_time
-        self.current_food_count = 0
+        self._current_food_count = 0
 
         # ✅ Reproduction Tracking
-        self.eaten_since_last_reproduction = 0
+        self._eaten_since_last_reproduction = 0
         self.last_reproduction_time = 0
-        self.offspring_count = 0
+        self._offspring_count = 0
+
+        self.sex = self.bowl.rng.choice(self.AVAILABLE_SEXES)
+
+    def _attach(self, name: str, bowl: 'Bowl') -> None:
+        """Sets up the bookkeeping every creature needs, however it was created."""
+        self.name = name
+        self.bowl = bowl
+        self.in_bowl = False  # Set by the bowl once this creature is on the occupancy grid
+        self.uid: int | None = None  # Assigned by the bowl, follows the order creatures were added
+        self.slot: int | None = None  # Row in a VectorBowl's arrays, when it has one
+        self._closest_food = None
+        self._closest_food_key = None  # (index version, x, y) the cached closest_food was found for
+        self._digestion = None  # Timer for the next food to be digested, while in a bowl with food in it
+
+    @property
+    def x(self) -> int | None:
+        return self._x
+
+    @x.setter
+    def x(self, value: int | None) -> None:
+        old_x = self._x
+        self._x = value
+        if self.in_bowl and value != old_x:
+            self.bowl.creature_moved(self, old_x, self._y)
+
+    @property
+    def y(self) -> int | None:
+        return self._y
+
+    @y.setter
+    def y(self, value: int | None) -> None:
+        old_y = self._y
+        self._y = value
+        if self.in_bowl and value != old_y:
+            self.bowl.creature_moved(self, self._x, old_y)
+
+    @property
+    def current_food_count(self) -> int:
+        return self._current_food_count
+
+    @current_food_count.setter
+    def current_food_count(self, value: int) -> None:
+        if self.in_bowl:
+            self.bowl.population.food_changed(self, value - self._current_food_count)  # ✅ Keep the stats in step
+        self._current_food_count = value
+
+    @property
+    def offspring_count(self) -> int:
+        return self._offspring_count
+
+    @offspring_count.setter
+    def offspring_count(self, value: int) -> None:
+        if self.in_bowl:
+            self.bowl.population.offspring_changed(self, value - self._offspring_count)
+        self._offspring_count = value
+
+    @property
+    def eaten_since_last_reproduction(self) -> int:
+        return self._eaten_since_last_reproduction
 
-        self.sex = random.choice(self.AVAILABLE_SEXES)
+    @eaten_since_last_reproduction.setter
+    def eaten_since_last_reproduction(self, value: int) -> None:
+        self._eaten_since_last_reproduction = value
+        if self.in_bowl:
+            self.bowl.breeding.update(self)  # ✅ Keep the breeding index in step
 
     @property
     def is_full(self):
@@ -62,19 +141,21 @@ class AquaticCreature:
             'Sex': self.sex,
         }
 
+    @property
+    def has_eaten_enough_to_breed(self) -> bool:
+        return self._eaten_since_last_reproduction >= self.REPRODUCTION_THRESHOLD
+
+    def ready_to_breed(self, now: float) -> bool:
+        """Checks this creature's own side of the breeding conditions."""
+        return self.has_eaten_enough_to_breed and now - self.last_reproduction_time > self.REPRODUCTION_COOLDOWN
+
     def can_reproduce(self, other: "AquaticCreature") -> bool:
         """Checks if two creatures can reproduce."""
-        same_species = False
-        for base1 in self.__class__.__bases__:
-            for base2 in other.__class__.__bases__:
-                if issubclass(base1, base2) or issubclass(base2, base1):
-                    same_species = True
+        now = self.bowl.clock.now()
         return (
-                same_species  # ✅ Must be the same species
-                and time.time() - self.last_reproduction_time > self.REPRODUCTION_COOLDOWN
-                and time.time() - other.last_reproduction_time > other.REPRODUCTION_COOLDOWN
-                and self.eaten_since_last_reproduction >= self.REPRODUCTION_THRESHOLD
-                and other.eaten_since_last_reproduction >= other.REPRODUCTION_THRESHOLD
+                species_compatible(self.__class__, other.__class__)  # ✅ Must be the same species
+                and self.ready_to_breed(now)
+                and other.ready_to_breed(now)
         )
 
     def reproduce_with(self, other) -> Optional["AquaticCreature"]:
@@ -89,8 +170,8 @@ class AquaticCreature:
         baby = self.create_offspring(baby_name, self.bowl, baby_x, baby_y)
 
         if baby:
-            self.last_reproduction_time = time.time()
-            other.last_reproduction_time = time.time()
+            self.last_reproduction_time = self.bowl.clock.now()
+            other.last_reproduction_time = self.bowl.clock.now()
             self.eaten_since_last_reproduction = 0
             other.eaten_since_last_reproduction = 0
             self.offspring_count += 1
@@ -102,21 +183,28 @@ class AquaticCreature:
 
     def stay_in_bounds(self) -> None:
         """Ensures the creature stays within the tank boundaries."""
-        emoji_width = len(self.emoji) * 2  # Account for emoji width
+        emoji_width = self.width  # Account for emoji width
         self.x = max(1, min(self.x, self.bowl.width - emoji_width - 2))  # Keep inside width
         self.y = max(1, min(self.y, self.bowl.height - 2))  # ✅ Ensure creature doesn't exceed tank height
 
     def age(self) -> int:
         """Returns the creature's age in seconds."""
-        return int(time.time() - self.birth_time)
+        return int(self.bowl.clock.now() - self.birth_time)
+
+    @property
+    def food_index(self) -> "SpatialHash":
+        """The spatial index this creature looks for food in."""
+        return self.bowl.food_index
 
     @property
     def closest_food(self):
-        return min(
-            self.bowl.cookies,
-            key=lambda c: abs(self.x - c.x) + abs(self.y - c.y),
-            default=None
-        )
+        """The nearest food, cached until this creature moves or the food index changes."""
+        index = self.food_index
+        key = (index.version, self._x, self._y)
+        if key != self._closest_food_key:
+            self._closest_food = index.nearest(self._x, self._y)
+            self._closest_food_key = key
+        return self._closest_food
 
     def update(self) -> None:
         """Common update behavior for all creatures."""
@@ -124,37 +212,72 @@ class AquaticCreature:
         # ✅ Call swim() so creatures actually move
         self.swim(self.bowl.width - 2, self.bowl.height - 2)
 
-        if time.time() > self.last_food_removed + self.REMOVE_FOOD_EVERY and self.current_food_count > 0:
-            self.last_food_removed = time.time()
-            self.current_food_count -= 1
-
         # ✅ If the creature reaches food, it eats it
-        if self.closest_food and self.x == self.closest_food.x and self.y == self.closest_food.y:
+        food = self.bowl.food_index.at(self.x, self.y)
+        if food:
             self.current_food_count += 1
+            if self._digestion is None:
+                # Not before next tick, even if the last food was digested long ago
+                self.schedule_digestion(max(self.last_food_removed + self.REMOVE_FOOD_EVERY, self.bowl.clock.now()))
             self.eaten_since_last_reproduction += 1
             self.bowl.log_activity(f"{self.emoji} {self.name} ate food!")
-            self.closest_food.eat()
+            self.bowl.record_event("feed", uid=self.uid, current_food_count=self.current_food_count,
+                                   eaten_since_last_reproduction=self.eaten_since_last_reproduction)
+            food.eat()
+
+    def schedule_digestion(self, deadline: float) -> None:
+        """Digests a food at the first tick after deadline, rather than checking every tick."""
+        self._digestion = self.bowl.digestion_timers.schedule(deadline, self.digest)
+
+    def cancel_digestion(self) -> None:
+        if self._digestion is not None:
+            self._digestion.cancel()
+            self._digestion = None
+
+    def digest(self, now: float) -> None:
+        """Uses up one food, REMOVE_FOOD_EVERY seconds after the last, for as long as there is any."""
+        deadline = self._digestion.deadline
+        if now <= deadline:
+            self.schedule_digestion(deadline)  # ✅ Not quite due; the bowl hands timers over a hair early
+            return
+        self._digestion = None
+        self.last_food_removed = now
+        self.current_food_count -= 1
+        if self.current_food_count > 0:
+            self.schedule_digestion(now + self.REMOVE_FOOD_EVERY)
 
     def swim(self, max_x: int, max_y: int) -> None:
         """Creatures move toward the closest food, but avoid overlapping and stop when full."""
 
-        if self.closest_food and not self.is_full:
-            self.move_toward(self.closest_food.x, self.closest_food.y)  # ✅ Always move toward food if it exists
+        if self.food_index and not self.is_full:
+            self.follow_food()  # ✅ Always move toward food if it exists
         else:
             # ✅ If no food, move randomly but avoid collisions
             potential_moves = [
                 (self.x + dx, self.y + dy) for dx, dy in [(-1, 0), (1, 0), (0, -1), (0, 1)]
             ]
-            occupied = self.bowl.get_occupied_positions()
+            occupied = self.bowl.occupancy
             valid_moves = [move for move in potential_moves if
                            move not in occupied and 1 <= move[0] < max_x - 1 and 1 <= move[1] < max_y - 1]
 
             if valid_moves:
-                self.x, self.y = random.choice(valid_moves)  # ✅ Only move randomly if no food exists
+                self.x, self.y = self.bowl.rng.choice(valid_moves)  # ✅ Only move randomly if no food exists
+
+    def follow_food(self) -> None:
+        """Steps along the bowl's food field, or straight at the closest food if the field has no way through."""
+        step = self.bowl.food_field().step(self.x, self.y, can_enter=self._can_swim_to)
+        if step is None:
+            self.move_toward(self.closest_food.x, self.closest_food.y)
+        else:
+            self.x, self.y = step
+
+    def _can_swim_to(self, x: int, y: int) -> bool:
+        # The field already keeps to the tank's sides and top; only crabs go down to its bottom row
+        return (x, y) not in self.bowl.occupancy and y < self.bowl.height - 2
 
     def move_toward(self, target_x: int, target_y: int) -> None:
         """Move toward a specific target position while avoiding occupied spaces."""
-        occupied = self.bowl.get_occupied_positions()
+        occupied = self.bowl.occupancy
 
         # ✅ Compute best move toward the target
         potential_moves = sorted([
@@ -174,19 +297,19 @@ class AquaticCreature:
 
     def random_movement(self) -> None:
         """Default random movement for creatures."""
-        self.x += random.choice([-1, 0, 1])
-        self.y += random.choice([-1, 0, 1])
+        self.x += self.bowl.rng.choice([-1, 0, 1])
+        self.y += self.bowl.rng.choice([-1, 0, 1])
 
     def find_nearest_open_space(self, x: int, y: int, bowl) -> tuple:
         """Finds the nearest available open space for a new creature."""
-        occupied = bowl.get_occupied_positions()
+        occupied = bowl.occupancy
 
         potential_positions = [
             (x + dx, y + dy) for dx in [-1, 0, 1] for dy in [-1, 0, 1]
             if (x + dx, y + dy) not in occupied and 1 <= x + dx < bowl.width - 2 and 1 <= y + dy < bowl.height - 2
         ]
 
-        return random.choice(potential_positions) if potential_positions else (x, y)  # Stay in place if no free space
+        return bowl.rng.choice(potential_positions) if potential_positions else (x, y)  # Stay in place if no free space
 
     @classmethod
     def create_offspring(cls, name: str, bowl: 'Bowl', x: int, y: int,
@@ -205,31 +328,50 @@ class AquaticCreature:
         if rarity_chance is None:
             rarity_chance = cls.RARITY_CHANCE
         inst = cls(name=name, bowl=bowl, x=x, y=y)
-        if cls.ALLOW_RARE and allow_rare and random.random() < rarity_chance:
+        if cls.ALLOW_RARE and allow_rare and bowl.rng.random() < rarity_chance:
             inst.make_rare()
         return inst
 
     def make_rare(self):
         self.rare = True
-        self.emoji = random.choice(self.RARE_EMOJIS)
+        self.emoji = self.bowl.rng.choice(self.RARE_EMOJIS)
 
     @classmethod
     def from_dict(cls, bowl: 'Bowl', data: dict):
+        """Recreates a creature saved with to_dict(), without re-rolling anything that was saved."""
         required_keys = ['name', 'x', 'y', 'rare', 'emoji']
         for x in required_keys:
             if x not in data:
                 raise ValueError(f'Failed to recreate creature due to missing key: {x}')
 
-        inst = cls.create_creature(name=data.get('name'), bowl=bowl, x=data.get('x'), y=data.get('y'))
-        for key, value in data.items():
-            if hasattr(inst, key):
-                try:
-                    setattr(inst, key, value)
-                except AttributeError:
-                    pass
+        inst = cls.__new__(cls)
+        inst._attach(data['name'], bowl)
+        inst.restore(data)
         return inst
 
-    def __dict__(self):
+    def restore(self, data: dict) -> None:
+        """Loads saved state. Subclasses extend this for their own fields."""
+        self._x = data['x']
+        self._y = data['y']
+        self.glyph_id = GLYPHS.register(data['emoji'])
+        self.rare = data['rare']
+
+        # Age Tracking
+        self.birth_time = data.get('birth_time', self.bowl.clock.now())
+
+        # Fullness Tracking
+        self.last_food_removed = data.get('last_food_removed', self.birth_time)
+        self._current_food_count = data.get('current_food_count', 0)
+
+        # ✅ Reproduction Tracking
+        self._eaten_since_last_reproduction = data.get('eaten_since_last_reproduction', 0)
+        self.last_reproduction_time = data.get('last_reproduction_time', 0)
+        self._offspring_count = data.get('offspring_count', 0)
+
+        # Older saves didn't record sex
+        self.sex = data.get('sex') or self.bowl.rng.choice(self.AVAILABLE_SEXES)
+
+    def to_dict(self) -> dict:
         return {
             'type': self.__class__.__name__,
             'name': self.name,
@@ -250,10 +392,24 @@ class AquaticCreature:
             'eaten_since_last_reproduction': self.eaten_since_last_reproduction,
             'last_reproduction_time': self.last_reproduction_time,
             'offspring_count': self.offspring_count,
+
+            'sex': self.sex,
         }
 
+    @classmethod
+    def all_emojis(cls) -> list:
+        """Every emoji this species can be shown with."""
+        return cls.NORMAL_EMOJIS + cls.RARE_EMOJIS
+
+    @property
+    def emoji(self) -> str:
+        return GLYPHS.glyph(self.glyph_id)
+
+    @emoji.setter
+    def emoji(self, value: str) -> None:
+        self.glyph_id = GLYPHS.register(value)
 
     @property
     def width(self):
         """Determine the actual display width of the emoji."""
-        return max(1, wcswidth(self.emoji))  # ✅ Correctly handles emoji widths
+        return GLYPHS.width(self.glyph_id)  # ✅ Precomputed per grapheme cluster, handles ZWJ sequences
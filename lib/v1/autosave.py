@@ -0,0 +1,157 @@
+import json
+import os
+import queue
+import tempfile
+import threading
+import time
+from typing import Callable, List, Optional
+
+from . import journal, snapshot
+
+
+# ✅ Read once at import: os.umask() can only be read by setting it, which would race the writer thread
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def _file_mode(path: str) -> int:
+    """The mode path already has, or the one open() would give a new file."""
+    try:
+        return os.stat(path).st_mode & 0o7777
+    except FileNotFoundError:
+        return 0o666 & ~_UMASK
+
+
+def write_atomic(path: str, blob: bytes) -> None:
+    """Writes to a temporary file next to path and renames it over path, so a crash never leaves half a file."""
+    directory = os.path.dirname(os.path.abspath(path))
+    descriptor, temp_path = tempfile.mkstemp(dir=directory, prefix=os.path.basename(path), suffix=".tmp")
+    try:
+        with os.fdopen(descriptor, "wb") as file:
+            file.write(blob)
+            file.flush()
+            os.fchmod(file.fileno(), _file_mode(path))  # ✅ mkstemp makes files 0600; saves shouldn't be
+            os.fsync(file.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+def encode_state(state: dict, path: str) -> bytes:
+    """The bytes Bowl.save_state() would write for state at path."""
+    if path.endswith(".json"):
+        return json.dumps(state, indent=4).encode("utf-8")
+    return snapshot.pack(state)
+
+
+class Autosaver:
+    """
+    Saves the tank in the background while it runs.
+
+    The simulation thread only records events and, every so often, copies the tank into plain
+    dicts between ticks. Everything slow (packing, hashing, writing and syncing files) happens on
+    a writer thread, which works from that copy and never touches the live Bowl.
+
+    Events are appended to the journal once a second. Once the journal grows past compact_after
+    events, or every interval seconds, a full save is written and the journal starts over.
+    """
+
+    def __init__(self, bowl: 'Bowl', path: str | None = None, interval: float = 60.0,
+                 flush_interval: float = 1.0, compact_after: int = 1000,
+                 clock: Callable[[], float] = time.monotonic) -> None:
+        self.bowl = bowl
+        self.path: str = path or bowl.save_file
+        self.journal_path: str = journal.journal_path(self.path)
+        self.interval: float = interval
+        self.flush_interval: float = flush_interval
+        self.compact_after: int = compact_after
+        self._clock = clock
+        self._jobs: queue.Queue = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._events_since_save: int = 0
+        self._last_save: float = 0.0
+        self._last_flush: float = 0.0
+        self._journal_valid: bool = False  # Writer thread only
+        self.error: Optional[BaseException] = None
+
+    def start(self) -> None:
+        """Starts journaling the bowl and writes a first full save to journal against."""
+        self.bowl.journal = journal.Journal()
+        self._thread = threading.Thread(target=self._run, name="autosave", daemon=True)
+        self._thread.start()
+        self.save_now()
+
+    def tick(self) -> None:
+        """Call once per frame on the simulation thread. Only ever queues work."""
+        if self.error is not None:
+            self.bowl.log_activity(f"⚠️ Autosave failed: {self.error}")
+            self.error = None
+
+        now = self._clock()
+        if now - self._last_save >= self.interval or self._events_since_save >= self.compact_after:
+            self.save_now()
+        elif now - self._last_flush >= self.flush_interval:
+            self.flush()
+
+    def flush(self) -> None:
+        """Queues the events recorded since the last flush for appending to the journal."""
+        self._last_flush = self._clock()
+        events = self.bowl.journal.drain()
+        if events:
+            self._events_since_save += len(events)
+            self._jobs.put(("append", events))
+
+    def save_now(self) -> None:
+        """Copies the tank and queues a full save, after which the journal starts over."""
+        self._last_save = self._last_flush = self._clock()
+        self._events_since_save = 0
+        # ✅ Everything recorded so far is in this copy, so those events never need to reach the disk
+        self.bowl.journal.drain()
+        state = self.bowl.to_dict()
+        state["activity_log"] = list(state["activity_log"])
+        uids = [creature.uid for creature in self.bowl.creatures]
+        cookie_uids = [cookie.uid for cookie in self.bowl.cookies]
+        self._jobs.put(("save", state, uids, cookie_uids))
+
+    def stop(self) -> None:
+        """Writes a final full save, waits for the writer to finish and stops journaling."""
+        self.save_now()
+        self._jobs.put(None)
+        self._thread.join()
+        self.bowl.journal = None
+        if self.error is not None:
+            raise self.error
+
+    def _run(self) -> None:
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                return
+            try:
+                if job[0] == "append":
+                    self._append(job[1])
+                else:
+                    self._save(*job[1:])
+            except OSError as error:
+                if job[0] == "save":
+                    # ✅ Events since the last save were dropped with it, so stop adding to a journal with a gap
+                    self._journal_valid = False
+                self.error = error
+
+    def _append(self, events: List[dict]) -> None:
+        if not self._journal_valid:
+            return
+        with open(self.journal_path, "a") as file:
+            file.write(journal.encode(events))
+            file.flush()
+            os.fsync(file.fileno())
+
+    def _save(self, state: dict, uids: List[int], cookie_uids: List[int]) -> None:
+        blob = encode_state(state, self.path)
+        write_atomic(self.path, blob)
+        # ✅ If we crash between these two writes, the old journal won't match the new save and is ignored
+        head = journal.header(journal.save_digest(blob), uids, cookie_uids)
+        write_atomic(self.journal_path, journal.encode([head]).encode("utf-8"))
+        self._journal_valid = True
@@ -1,12 +1,23 @@
-import time
 import json
 import random
 import os
-import unicodedata
-from wcwidth import wcswidth
+import time
 
-from typing import List
+from typing import Dict, List, Tuple
+from ..profiler import Profiler
+from .clock import Clock, SystemClock
 from .cookie import Cookie
+from .glyphs import GLYPHS
+from .occupancy import OccupancyGrid
+from .breeding import BreedingIndex
+from .entities import CreatureStore, EntityStore
+from .flowfield import FlowField
+from .population import PopulationStats, StatsPanel
+from .spatial import SpatialHash
+from .timers import TimerQueue
+from .terminal import Frame, frame_to_text, text_to_cells
+from . import journal, snapshot
+from .autosave import encode_state, write_atomic
 from .aquatic_creature import AquaticCreature
 from .crab import Crab
 from .fish import Fish
@@ -26,16 +37,44 @@ AVAILABLE_CREATURES = {
     Shark: [1, 1],
 }
 
+# ✅ Intern every emoji up front so width lookups never hit wcwidth during a frame
+for _creature_type in AVAILABLE_CREATURES:
+    GLYPHS.register_all(_creature_type.all_emojis())
+
 
 class Bowl:
-    def __init__(self, width: int, height: int, save_file: str) -> None:
+    def __init__(self, width: int, height: int, save_file: str, clock: Clock | None = None,
+                 seed: int | None = None) -> None:
         self.width: int = width
         self.height: int = height
         self.save_file: str = save_file
-        self.creatures: List[AquaticCreature] = []
-        self.cookies: List[Cookie] = []  # 🍪 Multiple food items
+        self.clock: Clock = clock or SystemClock()  # ✅ Every timer in the tank reads from this
+        self.seed: int | None = seed
+        self.rng: random.Random = random.Random(seed)  # ✅ All simulation randomness, reproducible when seeded
+        self._wave_rng: random.Random = random.Random()  # Cosmetic only, so rendering never shifts the simulation
+        self.creatures: CreatureStore[AquaticCreature] = CreatureStore()  # ✅ O(1) add and remove, by uid
+        self.occupancy: OccupancyGrid = OccupancyGrid()  # ✅ Kept in sync as creatures move
+        self.breeding: BreedingIndex = BreedingIndex()  # ✅ Creatures that have eaten enough to breed
+        self.population: PopulationStats = PopulationStats()  # ✅ Per-species totals for the stats panel
+        self.stats_panel: StatsPanel = StatsPanel(self.population)
+        self._next_uid: int = 0
+        self.cookies: EntityStore[Cookie] = EntityStore()  # 🍪 Multiple food items
+        self._next_cookie_uid: int = 0
+        self.food_index: SpatialHash[Cookie] = SpatialHash()  # ✅ Nearest-cookie lookups
+        self.prey_index: SpatialHash[AquaticCreature] = SpatialHash()  # ✅ Nearest-prey lookups for predators
+        self.prey_claims: set = set()  # uids of prey a shark is already after this tick
+        self._food_field: FlowField = FlowField()  # ✅ Ways to the nearest cookie, shared by everyone looking
+        self._food_field_version: int | None = None  # food_index.version the field was built for
+        self.food_field_rows: Tuple[int, int] | None = None  # Rows the field covers, if not the whole tank
+        # ✅ Time-driven changes happen when their deadline passes, instead of being checked for every tick
+        self.cookie_timers: TimerQueue = TimerQueue()  # Cookies dissolving after Cookie.MAX_LIFE
+        self.digestion_timers: TimerQueue = TimerQueue()  # Creatures digesting a food every REMOVE_FOOD_EVERY
         self.activity_log: List[str] = []  # Tracks last 3 actions
         self.paused: bool = False  # ✅ Track pause state
+        self._waves: List[str] | None = None
+        self.journal: journal.Journal | None = None  # ✅ Set while an Autosaver is running
+        self.profiler: Profiler = Profiler(enabled=False)  # ✅ Times each phase of a tick when enabled
+        self.show_profiler: bool = False  # Draw the profiler's panel under the activity log
 
     def toggle_pause(self) -> None:
         """Toggle pausing of updates and rendering."""
@@ -43,39 +82,56 @@ class Bowl:
         state = "Paused" if self.paused else "Resumed"
         self.log_activity(f"⏸ {state} the simulation.")
 
+    def next_stats_page(self) -> None:
+        """Show the next page of creatures in the stats panel."""
+        self.stats_panel.next_page()
+
+    def previous_stats_page(self) -> None:
+        """Show the previous page of creatures in the stats panel."""
+        self.stats_panel.previous_page()
+
+    def toggle_profiler(self) -> None:
+        """Show or hide the profiler panel, starting the profiler the first time it is shown."""
+        self.show_profiler = not self.show_profiler
+        self.profiler.enabled = True
+
     def spawn_creature(self) -> None:
         """Spawns a new random non-shark creature."""
-        creature_type = random.choice([Fish, Crab, Jellyfish])
-        x = random.randint(1, self.width - 3)
-        y = random.randint(1, self.height - 3)
+        creature_type = self.rng.choice([Fish, Crab, Jellyfish])
+        x = self.rng.randint(1, self.width - 3)
+        y = self.rng.randint(1, self.height - 3)
 
-        new_creature = creature_type.create_offspring(f"{creature_type.__name__}_{random.randint(100, 999)}", self, x,
+        new_creature = creature_type.create_offspring(f"{creature_type.__name__}_{self.rng.randint(100, 999)}", self, x,
                                                       y)
-        self.creatures.append(new_creature)
+        self.add_creature(new_creature)
         self.log_activity(f"✨ Spawned a new {new_creature.emoji} {new_creature.name}!")
 
     def kill_random_creature(self) -> None:
         """Removes a random non-shark creature, but ensures at least two of each species remain."""
-        species_counts = {}  # ✅ Count how many of each species exist
-        for creature in self.creatures:
-            species_name = type(creature).__name__
-            if species_name not in species_counts:
-                species_counts[species_name] = 0
-            species_counts[species_name] += 1
-
-        # ✅ Create a list of creatures that can be removed
-        removable_creatures = [
-            c for c in self.creatures
-            if not isinstance(c, Shark) and species_counts[type(c).__name__] > 2  # ✅ Ensure at least 2 remain
+        # ✅ Species with more than two members, in a fixed order so a seeded tank always picks the same victim
+        removable_species = [
+            members for species, members in sorted(self.creatures.species.items(), key=lambda item: item[0].__name__)
+            if not issubclass(species, Shark) and len(members) > 2  # ✅ Ensure at least 2 remain
         ]
 
-        if removable_creatures:
-            victim = random.choice(removable_creatures)
-            self.creatures.remove(victim)
+        removable_count = sum(len(members) for members in removable_species)
+        if removable_count:
+            index = self.rng.randrange(removable_count)
+            for members in removable_species:
+                if index < len(members):
+                    victim = members[index]
+                    break
+                index -= len(members)
+            self.remove_creature(victim)
             self.log_activity(f"💀 {victim.emoji} {victim.name} was removed from the tank.")
         else:
             self.log_activity("⚠️ Cannot remove any more creatures without causing extinction!")
 
+    def record_event(self, event: str, **fields) -> None:
+        """Notes something that happened for the autosave journal, if one is running."""
+        if self.journal is not None:
+            self.journal.record(event, **fields)
+
     def log_activity(self, message: str) -> None:
         """Logs an activity and keeps only the last 3 events."""
         self.activity_log.append(message)
@@ -86,161 +142,328 @@ class Bowl:
         """Check for breeding pairs and spawn new creatures if conditions are met."""
         new_creatures = []
 
-        for i, creature in enumerate(self.creatures):
-            for j, other in enumerate(self.creatures):
-                if i != j:  # ✅ Ensure different creatures
-                    baby = creature.reproduce_with(other)
-                    if baby:
-                        new_creatures.append(baby)
-
-        self.creatures.extend(new_creatures)
+        # ✅ Only creatures that have eaten enough are considered, no need to check every pair
+        for creature, other in list(self.breeding.pairs(self.clock.now())):
+            baby = creature.reproduce_with(other)
+            if baby:
+                new_creatures.append(baby)
+                self.record_event("birth", parents=[self._breeding_state(c) for c in (creature, other)])
+
+        for baby in new_creatures:
+            self.add_creature(baby)
+
+    @staticmethod
+    def _breeding_state(creature: AquaticCreature) -> dict:
+        return {
+            "uid": creature.uid,
+            "last_reproduction_time": creature.last_reproduction_time,
+            "eaten_since_last_reproduction": creature.eaten_since_last_reproduction,
+            "offspring_count": creature.offspring_count,
+        }
 
     def generate_waves(self) -> str:
         """Generate a random wave pattern for the top of the tank."""
-        return ''.join(random.choice(['~', '=', ' ']) for _ in range(self.width - 2))
+        return ''.join(self._wave_rng.choice(['~', '=', ' ']) for _ in range(self.width - 2))
 
     def drop_food(self) -> None:
         """Drops a cookie in a random location near the center of the tank."""
-        x_position = random.randint(self.width // 3, (self.width * 2) // 3)
-        self.cookies.append(Cookie(x_position, self))  # 🍪 Add a new cookie!
+        x_position = self.rng.randint(self.width // 3, (self.width * 2) // 3)
+        self.add_cookie(Cookie(x_position, self))  # 🍪 Add a new cookie!
+        self.profiler.count("cookies")
+
+    def add_cookie(self, cookie: Cookie) -> None:
+        cookie.uid = self._next_cookie_uid
+        self._next_cookie_uid += 1
+        self.cookies.add(cookie)
+        self.food_index.insert(cookie, cookie.x, cookie.y)
+        cookie.expiry = self.cookie_timers.schedule(cookie.created + cookie.MAX_LIFE, cookie.expire)
+        if self.journal is not None:
+            self.journal.record("cookie_drop", uid=cookie.uid, cookie=cookie.to_dict())
+
+    def remove_cookie(self, cookie: Cookie) -> None:
+        self.record_event("cookie_gone", uid=cookie.uid)
+        self.cookies.remove(cookie)  # ✅ Safe mid-loop: the store fills the gap once the loop is done
+        self.food_index.remove(cookie)
+        if cookie.expiry is not None:
+            cookie.expiry.cancel()
+            cookie.expiry = None
 
     def update(self) -> None:
         """Updates all creatures, prevents overlapping, handles food, and enables reproduction."""
-        # Make each cookie sink
-        for cookie in self.cookies:
-            cookie.update()
+        tick_start = time.perf_counter()
+        profiler = self.profiler
+        now = self.clock.now()
+
+        with profiler.phase("update.cookies"):
+            # Make each cookie sink
+            for cookie in self.cookies:
+                cookie.update()
+            self.cookie_timers.run_due(now)
+
+            self.index_food()
 
         # ✅ Call update on each creature
-        for creature in self.creatures:
-            creature.update()
+        self.prey_claims.clear()
+        if profiler.enabled:
+            self._update_creatures_timed()
+        else:
+            for creature in self.creatures:
+                creature.update()
+
+        # ✅ After the creatures have moved, as if each had checked its own hunger during its update
+        with profiler.phase("update.digestion"):
+            profiler.count("digested", self.digestion_timers.run_due(now))
 
         # ✅ Check for reproduction
-        self.handle_reproduction()
+        with profiler.phase("update.reproduction"):
+            self.handle_reproduction()
+
+        if profiler.enabled:
+            profiler.tick_done(time.perf_counter() - tick_start, population=len(self.creatures),
+                               cookies=len(self.cookies))
+
+    def _update_creatures_timed(self) -> None:
+        """Updates each creature, adding up the time spent on each species."""
+        per_species: Dict[str, float] = {}
+        clock = time.perf_counter
+        for creature in self.creatures:
+            start = clock()
+            creature.update()
+            species = type(creature).__name__
+            per_species[species] = per_species.get(species, 0.0) + clock() - start
+        for species, seconds in per_species.items():
+            self.profiler.record(f"update.creatures.{species}", seconds)
+
+    def index_food(self) -> None:
+        """Cookies only move while sinking, so index them once for the whole tick."""
+        self.food_index.rebuild((cookie, cookie.x, cookie.y) for cookie in self.cookies)
+
+    def food_field(self) -> FlowField:
+        """
+        Distances to the nearest cookie around the creatures in the way. Built when first asked for after
+        the food index changes, which is once a tick, as creatures stood at that moment.
+        """
+        if self._food_field_version != self.food_index.version:
+            sources = (self.food_index.position(cookie) for cookie in self.food_index)
+            self._food_field.build(self.width, self.height, sources, self.occupancy, self.food_field_rows)
+            self._food_field_version = self.food_index.version
+            self.profiler.count("food field builds")
+        return self._food_field
 
     def render(self) -> str:
         """Render the fish tank with statistics and activity log while preventing overlapping creatures."""
-        tank_lines: List[str] = []
+        return frame_to_text(self.render_frame())
 
-        # Top of the tank with waves
-        tank_lines.append("╔" + self.generate_waves() + "╗")
+    def render_frame(self) -> Frame:
+        """Render the tank, stats and activity log as rows of terminal cells."""
+        profiler = self.profiler
+        with profiler.phase("render.tank"):
+            tank_rows = self._render_tank()
+
+        # ✅ Stats Section
+        with profiler.phase("render.stats"):
+            # ✅ Species totals and a page of creatures, cut to the tank's height so it never runs off the screen
+            stats_lines = [" Stats ".center(30, "-")]
+            stats_lines += self.stats_panel.lines(self.creatures, self.clock.now(), len(tank_rows) - 1)
+
+            # ✅ Merge tank and stats properly
+            frame: Frame = []
+            max_tank_height = max(len(tank_rows), len(stats_lines))
+            blank_tank = [" "] * self.width
+            gutter = [" "] * 3
+
+            for i in range(max_tank_height):
+                tank_part = tank_rows[i] if i < len(tank_rows) else blank_tank
+                stats_part = text_to_cells(stats_lines[i]) if i < len(stats_lines) else ()
+                frame.append(tank_part + gutter + list(stats_part))
+
+        # ✅ Activity Log Section
+        with profiler.phase("render.activity_log"):
+            activity_lines = [" Activity Log ".center(30, "-")] + self.activity_log
+            if self.show_profiler:
+                activity_lines += [" Profiler ".center(30, "-")] + profiler.overlay_lines()
+
+            for line in activity_lines:
+                frame.append(list(text_to_cells(line)))
+
+        return frame
+
+    def _render_tank(self) -> Frame:
+        """The tank itself, with creatures and cookies placed in it."""
+        # Top of the tank with waves (held still while paused so an idle frame doesn't change)
+        if not self.paused or self._waves is None:
+            self._waves = list(self.generate_waves())
+        tank_rows: Frame = [["╔"] + self._waves + ["╗"]]
 
         # Middle section (empty space for creatures & food)
+        empty_row = ["║"] + [" "] * (self.width - 2) + ["║"]
         for _ in range(self.height - 2):
-            tank_lines.append("║" + " " * (self.width - 2) + "║")
+            tank_rows.append(empty_row[:])
 
         # Bottom of the tank
-        tank_lines.append("╚" + "═" * (self.width - 2) + "╝")
+        tank_rows.append(["╚"] + ["═"] * (self.width - 2) + ["╝"])
 
         # ✅ Ensure creatures are placed without overwriting each other
         occupied_positions = set()
 
         for creature in sorted(self.creatures, key=lambda c: c.y):
-            if 1 <= creature.y < len(tank_lines):  # ✅ Prevent out-of-range errors
-                row = list(tank_lines[creature.y])
-                emoji_chars = list(creature.emoji)
+            if 1 <= creature.y < len(tank_rows):  # ✅ Prevent out-of-range errors
                 emoji_width = creature.width  # ✅ Use correct forced width
 
                 # ✅ Check if the space is occupied before placing the creature
-                if all((creature.x + i, creature.y) not in occupied_positions for i in range(emoji_width)):
-                    row[creature.x + 1: creature.x + 1 + emoji_width] = emoji_chars
+                if (creature.x + 1 + emoji_width <= self.width
+                        and all((creature.x + i, creature.y) not in occupied_positions for i in range(emoji_width))):
+                    self._place_glyph(tank_rows[creature.y], creature.x + 1, creature.emoji, emoji_width)
 
                     # ✅ Mark occupied positions
                     occupied_positions.update((creature.x + i, creature.y) for i in range(emoji_width))
 
-                tank_lines[creature.y] = ''.join(row)
-
         # ✅ Place cookies while ensuring they don't overlap creatures
+        cookie_glyph = GLYPHS.glyph(Cookie.GLYPH_ID)
+        cookie_width = GLYPHS.width(Cookie.GLYPH_ID)  # ✅ Handle emoji width
         for cookie in self.cookies:
             if (cookie.x, cookie.y) not in occupied_positions:
-                row = list(tank_lines[cookie.y])
-                emoji_chars = list("🍪")  # ✅ Get correct width
-                emoji_width = len(emoji_chars) * wcswidth('🍪')  # ✅ Handle emoji width
-
                 # ✅ Ensure the cookie fits in the tank without shifting alignment
-                if cookie.x + emoji_width < self.width - 2:
-                    row[cookie.x + 1: cookie.x + 1 + emoji_width] = emoji_chars
-                    occupied_positions.update((cookie.x + i, cookie.y) for i in range(emoji_width))
-
-                tank_lines[cookie.y] = ''.join(row)
-
-        # ✅ Stats Section
-        stats_lines = [" Stats ".center(30, "-")]
-        for creature in self.creatures:
-            stats_lines.append(f"{creature.emoji} {creature.stats}")
-
-        # ✅ Activity Log Section
-        activity_lines = [" Activity Log ".center(30, "-")] + self.activity_log
-
-        # ✅ Merge tank and stats properly
-        combined_output = []
-        max_tank_height = max(len(tank_lines), len(stats_lines))
-
-        for i in range(max_tank_height):
-            tank_part = tank_lines[i] if i < len(tank_lines) else " " * self.width
-            stats_part = stats_lines[i] if i < len(stats_lines) else ""
-            combined_output.append(f"{tank_part}   {stats_part}")
-
-        return "\n".join(combined_output) + "\n" + "\n".join(activity_lines)
+                if cookie.x + cookie_width < self.width - 2:
+                    self._place_glyph(tank_rows[cookie.y], cookie.x + 1, cookie_glyph, cookie_width)
+                    occupied_positions.update((cookie.x + i, cookie.y) for i in range(cookie_width))
+
+        return tank_rows
+
+    @staticmethod
+    def _place_glyph(row: List[str], col: int, glyph: str, glyph_width: int) -> None:
+        """Puts a glyph into a row of cells, blanking the cells it spills over."""
+        # ✅ Don't leave half of a wide glyph behind on either side
+        lead = col
+        while lead > 0 and row[lead] == "":
+            lead -= 1
+        for i in range(lead, col):
+            row[i] = " "
+        end = col + glyph_width
+        while end < len(row) and row[end] == "":
+            row[end] = " "
+            end += 1
+
+        row[col] = glyph
+        for i in range(1, glyph_width):
+            row[col + i] = ""
 
     def add_creature(self, creature: AquaticCreature) -> None:
-        self.creatures.append(creature)
-
-    def save_state(self) -> None:
-        """Saves the tank's current state to a JSON file."""
-        data = {
+        """Adds a creature to the tank and marks its cell as occupied."""
+        creature.uid = self._next_uid
+        self._next_uid += 1
+        self.creatures.add(creature)
+        self.occupancy.add(creature.x, creature.y)
+        if not creature.IS_PREDATOR:
+            self.prey_index.insert(creature, creature.x, creature.y)
+        creature.in_bowl = True
+        if creature.current_food_count > 0:
+            creature.schedule_digestion(creature.last_food_removed + creature.REMOVE_FOOD_EVERY)
+        self.breeding.update(creature)
+        self.population.add(creature)
+        if self.journal is not None:
+            self.journal.record("spawn", uid=creature.uid, creature=creature.to_dict())
+
+    def remove_creature(self, creature: AquaticCreature) -> None:
+        """Removes a creature from the tank and frees its cell."""
+        self.creatures.remove(creature)
+        self.occupancy.remove(creature.x, creature.y)
+        self.prey_index.remove(creature)
+        self.breeding.discard(creature)
+        self.population.remove(creature)
+        creature.cancel_digestion()
+        creature.in_bowl = False
+        self.record_event("death", uid=creature.uid)
+
+    def creature_moved(self, creature: AquaticCreature, old_x: int, old_y: int) -> None:
+        """Keeps the occupancy grid and prey index in step with a creature's new position."""
+        self.occupancy.move(old_x, old_y, creature.x, creature.y)
+        if not creature.IS_PREDATOR:
+            self.prey_index.move(creature, creature.x, creature.y)
+
+    def refresh_views(self) -> None:
+        """Brings creature objects up to date before they are read. Creatures already are in this engine."""
+
+    def is_occupied(self, x: int, y: int) -> bool:
+        """Returns True if a creature is currently at (x, y)."""
+        return self.occupancy.is_occupied(x, y)
+
+    def to_dict(self) -> dict:
+        """The tank's state in the layout used by JSON saves and snapshots alike."""
+        self.refresh_views()
+        return {
             "width": self.width,
             "height": self.height,
             "creatures": [
-                creature.__dict__() for creature in self.creatures
+                creature.to_dict() for creature in self.creatures
             ],
             "cookies": [
-                cookie.__dict__() for cookie in self.cookies
+                cookie.to_dict() for cookie in self.cookies
             ],
             "activity_log": self.activity_log
         }
 
-        with open(self.save_file, "w") as file:
-            json.dump(data, file, indent=4)
+    def save_state(self, path: str | None = None) -> None:
+        """Saves the tank's current state. Files ending in .json are written as JSON, anything else as a snapshot."""
+        path = path or self.save_file
+        write_atomic(path, encode_state(self.to_dict(), path))
 
         print("💾 Tank state saved!")
 
-    def load_state(self) -> None:
-        """Loads the tank's state from a JSON file, or populates it with random creatures if no save exists."""
-        if not os.path.exists(self.save_file):
+    def export_json(self, path: str) -> None:
+        """Writes the tank's current state as human-readable JSON."""
+        write_atomic(path, json.dumps(self.to_dict(), indent=4).encode("utf-8"))
+
+    def load_state(self, path: str | None = None) -> None:
+        """Loads the tank's state from a snapshot or JSON file, or populates it with random creatures if no save exists."""
+        path = path or self.save_file
+        if not os.path.exists(path):
             print("🚀 No save file found! Generating a new tank with random creatures.")
             self.populate_random_tank()
             return
 
-        with open(self.save_file, "r") as file:
-            data = json.load(file)
+        if snapshot.is_snapshot(path):
+            data = snapshot.read(path)
+        else:
+            with open(path, "r") as file:
+                data = json.load(file)
+        # ✅ Pick up anything the autosave journal recorded after this save was written
+        replayed = journal.recover(data, path)
+        self.restore(data)
 
+        print("🔄 Tank state loaded!")
+        if replayed:
+            print(f"📜 Replayed {replayed} events from the autosave journal.")
+
+    def restore(self, data: dict) -> None:
+        """Adds the creatures, cookies and activity log from a saved state to the tank."""
         available_types = {x.__name__: x for x in AVAILABLE_CREATURES}
         for creature_data in data.get("creatures", []):
             creature_type: AquaticCreature = available_types.get(creature_data.get('type', None), None)
             if creature_type:
                 self.add_creature(creature_type.from_dict(self, creature_data))
         # Restore cookies
-        self.cookies = [
-            Cookie.from_dict(bowl=self, data=cookie) for cookie in data.get("cookies", [])
-        ]
+        self.cookies.clear()
+        self.food_index.clear()
+        self.cookie_timers.clear()
+        for cookie in data.get("cookies", []):
+            self.add_cookie(Cookie.from_dict(bowl=self, data=cookie))
         # Restore activity log
         self.activity_log = data.get("activity_log", [])[-3:]  # Keep last 3 logs
 
-        print("🔄 Tank state loaded!")
-
     def populate_random_tank(self) -> None:
         """Fills the tank with a random selection of creatures if no save exists."""
         for creature, spawn_rate in AVAILABLE_CREATURES.items():
             min_spawn, max_spawn = spawn_rate
-            for _ in range(random.randint(min_spawn, max_spawn)):
-                name = f"{creature.__name__}_{random.randint(100, 999)}"
-                x = random.randint(1, self.width - 3)
-                y = random.randint(1, self.height - 3)
-                self.creatures.append(creature.create_creature(name, self, x, y, allow_rare=True))
+            for _ in range(self.rng.randint(min_spawn, max_spawn)):
+                name = f"{creature.__name__}_{self.rng.randint(100, 999)}"
+                x = self.rng.randint(1, self.width - 3)
+                y = self.rng.randint(1, self.height - 3)
+                self.add_creature(creature.create_creature(name, self, x, y, allow_rare=True))
 
         # Log the initial population
         self.log_activity("🌱 New tank populated with random creatures, including a predator!")
 
     def get_occupied_positions(self) -> set:
         """Returns a set of (x, y) positions currently occupied by creatures."""
-        return {(creature.x, creature.y) for creature in self.creatures}
+        return set(self.occupancy)
@@ -0,0 +1,65 @@
+import heapq
+from typing import Dict, Iterator, List, Tuple
+
+from .aquatic_creature import AquaticCreature, species_compatible
+
+
+class BreedingIndex:
+    """Keeps track of creatures that have eaten enough to breed, bucketed by species."""
+
+    def __init__(self) -> None:
+        self._buckets: Dict[type, Dict[int, AquaticCreature]] = {}
+
+    def update(self, creature: AquaticCreature) -> None:
+        """Adds or drops a creature depending on how much it has eaten since it last bred."""
+        if creature.has_eaten_enough_to_breed:
+            self._buckets.setdefault(type(creature), {})[creature.uid] = creature
+        else:
+            self.discard(creature)
+
+    def discard(self, creature: AquaticCreature) -> None:
+        bucket = self._buckets.get(type(creature))
+        if bucket is not None:
+            bucket.pop(creature.uid, None)
+
+    def clear(self) -> None:
+        self._buckets.clear()
+
+    def __len__(self) -> int:
+        return sum(len(bucket) for bucket in self._buckets.values())
+
+    def pairs(self, now: float) -> Iterator[Tuple[AquaticCreature, AquaticCreature]]:
+        """
+        Yields breeding pairs in the order the creatures joined the tank (by uid).
+
+        Each creature is paired at most once. Creatures still on cooldown are skipped.
+        """
+        ready: Dict[type, List[AquaticCreature]] = {}
+        for species, bucket in self._buckets.items():
+            candidates = sorted((c for c in bucket.values() if c.ready_to_breed(now)), key=lambda c: c.uid)
+            if candidates:
+                ready[species] = candidates
+
+        if not ready:
+            return
+
+        paired = set()
+        for creature in heapq.merge(*ready.values(), key=lambda c: c.uid):
+            if creature.uid in paired:
+                continue
+
+            partner = None
+            for species, candidates in ready.items():
+                if not species_compatible(type(creature), species):
+                    continue
+                for other in candidates:
+                    if other is creature or other.uid in paired:
+                        continue
+                    if partner is None or other.uid < partner.uid:
+                        partner = other
+                    break  # ✅ Lists are sorted, so the first free one is this bucket's best
+
+            if partner is not None:
+                paired.add(creature.uid)
+                paired.add(partner.uid)
+                yield creature, partner
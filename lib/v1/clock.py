@@ -0,0 +1,34 @@
+import time
+
+
+class Clock:
+    """Where a bowl gets the current time from, in seconds."""
+
+    def now(self) -> float:
+        raise NotImplementedError
+
+
+class SystemClock(Clock):
+    """Wall-clock time, used when watching the tank live."""
+
+    def now(self) -> float:
+        return time.time()
+
+
+class SimulatedClock(Clock):
+    """A clock that only moves when told to, so a bowl can run as fast as the CPU allows."""
+
+    # Starts at a realistic timestamp so saved tanks stay compatible with live runs
+    DEFAULT_START = 1_700_000_000.0
+
+    def __init__(self, start: float = DEFAULT_START, tick_seconds: float = 0.3) -> None:
+        self._now = start
+        self.tick_seconds = tick_seconds
+
+    def now(self) -> float:
+        return self._now
+
+    def advance(self, seconds: float | None = None) -> float:
+        """Moves time forward by one tick (or the given number of seconds) and returns the new time."""
+        self._now += self.tick_seconds if seconds is None else seconds
+        return self._now
@@ -1,21 +1,33 @@
-import time
+from .glyphs import GLYPHS
 
 
 class Cookie:
     """Represents food dropped into the tank that sinks slowly and attracts fish."""
     MAX_LIFE = 5
+    EMOJI = "🍪"
+    GLYPH_ID = GLYPHS.register(EMOJI)
+
+    __slots__ = ('created', 'x', 'y', 'eaten_count', 'bowl', 'uid', 'expiry')
 
     def __init__(self, x: int, bowl: 'Bowl') -> None:
-        self.created = time.time()
+        self.created = bowl.clock.now()
         self.x: int = x
         self.y: int = 1  # Start just below the waves
         self.eaten_count: int = 0  # Number of times fish have touched it
         self.bowl = bowl
+        self.uid: int | None = None  # Assigned by the bowl
+        self.expiry = None  # The bowl's timer for dissolving this cookie
 
     def update(self) -> None:
         self.fall()
-        if time.time() - self.created >= self.MAX_LIFE:
-            self.bowl.cookies.remove(self)
+
+    def expire(self, now: float) -> None:
+        """Called by the bowl's timer once the cookie has been in the tank MAX_LIFE seconds."""
+        self.expiry = None
+        if now - self.created >= self.MAX_LIFE:
+            self.bowl.remove_cookie(self)
+        else:
+            self.expiry = self.bowl.cookie_timers.schedule(self.created + self.MAX_LIFE, self.expire)  # A hair early
 
     def fall(self) -> None:
         """Cookie sinks down one row per frame."""
@@ -25,9 +37,9 @@ class Cookie:
     def eat(self) -> bool:
         """Returns True if the cookie has been eaten enough times."""
         if self.eaten_count >= 5:
-            self.bowl.cookies.remove(self)
+            self.bowl.remove_cookie(self)
 
-    def __dict__(self):
+    def to_dict(self) -> dict:
         return {
             'created': self.created,
             'x': self.x,
@@ -41,10 +53,9 @@ class Cookie:
         for x in required_keys:
             if x not in data:
                 raise ValueError(f'Failed to recreate cookie due to missing key: {x}')
-        inst = cls(data.get('x'), bowl=bowl)
-
-        for key, value in data.items():
-            if hasattr(inst, key):
-                setattr(inst, key, value)
+        inst = cls(data['x'], bowl=bowl)
+        inst.created = data['created']
+        inst.y = data['y']
+        inst.eaten_count = data['eaten_count']
         return inst
 
@@ -1,17 +1,18 @@
-import random
 from typing import Optional
 
 from .aquatic_creature import AquaticCreature
 from .cookie import Cookie
+from .flowfield import SIDEWAYS
 
 
 class Crab(AquaticCreature):
     NORMAL_EMOJIS = ["🦀"]
     RARE_EMOJIS = ["🦞"]
     """Crabs stay near the bottom but chase food."""
+    __slots__ = ()
 
     def __init__(self, name: str, bowl: 'Bowl', x: int | None = None, y: int | None = None) -> None:
-        super().__init__(name=name, bowl=bowl, emoji=random.choice(self.NORMAL_EMOJIS), x=x, y=bowl.height - 2)
+        super().__init__(name=name, bowl=bowl, emoji=bowl.rng.choice(self.NORMAL_EMOJIS), x=x, y=bowl.height - 2)
 
     def update(self) -> None:
         """Crabs only move left or right and always stay at the bottom."""
@@ -22,19 +23,25 @@ class Crab(AquaticCreature):
 
     def swim(self, max_x: int, max_y: int) -> None:
         """Crabs only move left or right, and always stay at the bottom."""
-        occupied = self.bowl.get_occupied_positions()
-
-        if self.closest_food:
-            # ✅ Move toward food horizontally only
-            if self.x < self.closest_food.x and (self.x + 1, self.y) not in occupied:
+        occupied = self.bowl.occupancy
+
+        if self.food_index:
+            # ✅ Move toward food horizontally only, reading the food field along the bottom row
+            step = self.bowl.food_field().step(self.x, self.y, SIDEWAYS, can_enter=self._can_scuttle_to)
+            if step is not None:
+                self.x = step[0]
+            elif self.x < self.closest_food.x and (self.x + 1, self.y) not in occupied:
                 self.x += 1
             elif self.x > self.closest_food.x and (self.x - 1, self.y) not in occupied:
                 self.x -= 1
         else:
             # ✅ Move randomly left or right if no food is present
-            new_x = self.x + random.choice([-1, 1])
+            new_x = self.x + self.bowl.rng.choice([-1, 1])
             if (new_x, self.y) not in occupied and 1 <= new_x < max_x - 1:
                 self.x = new_x
 
         # ✅ Ensure crabs stay at the bottom
         self.y = max_y - 2
+
+    def _can_scuttle_to(self, x: int, y: int) -> bool:
+        return (x, y) not in self.bowl.occupancy
@@ -0,0 +1,115 @@
+from typing import Dict, Generic, Iterator, List, Optional, TypeVar
+
+T = TypeVar('T')
+
+
+class EntityStore(Generic[T]):
+    """
+    The bowl's creatures or cookies, keyed by their uid.
+
+    Entities live in a dense list so iterating stays fast. Removing one moves the last entity into its
+    place, so nothing has to shift down. Removing one while the store is being iterated is allowed: it
+    drops out of the store at once, and its slot is filled in once the outermost loop finishes.
+    Iteration order is the order entities were added, shuffled only by removals, and is the same on
+    every run that adds and removes the same entities.
+    """
+
+    def __init__(self) -> None:
+        self._items: List[Optional[T]] = []
+        self._positions: Dict[int, int] = {}  # uid → index in _items
+        self._vacated: List[int] = []  # Slots emptied mid-iteration, filled in afterwards
+        self._iterating = 0
+
+    def add(self, entity: T) -> None:
+        self._positions[entity.uid] = len(self._items)
+        self._items.append(entity)
+
+    def remove(self, entity: T) -> None:
+        position = self._positions.pop(entity.uid, None)
+        if position is None:
+            raise ValueError(f"{entity!r} is not in the store")
+        if self._iterating:
+            self._items[position] = None
+            self._vacated.append(position)
+        else:
+            self._swap_remove(position)
+
+    def get(self, uid: int) -> Optional[T]:
+        position = self._positions.get(uid)
+        return None if position is None else self._items[position]
+
+    def clear(self) -> None:
+        self._items.clear()
+        self._positions.clear()
+        self._vacated.clear()
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def __bool__(self) -> bool:
+        return bool(self._positions)
+
+    def __contains__(self, entity: T) -> bool:
+        position = self._positions.get(entity.uid)
+        return position is not None and self._items[position] is entity
+
+    def __getitem__(self, index):
+        """Indexing and slicing, for paging and random picks. Not while the store is being iterated."""
+        return self._items[index]
+
+    def __iter__(self) -> Iterator[T]:
+        self._iterating += 1
+        try:
+            items = self._items
+            i = 0
+            while i < len(items):  # ✅ Entities added during the loop are visited too, as with a list
+                entity = items[i]
+                if entity is not None:
+                    yield entity
+                i += 1
+        finally:
+            self._iterating -= 1
+            if not self._iterating and self._vacated:
+                self._fill_vacated()
+
+    def _swap_remove(self, position: int) -> None:
+        last = self._items.pop()
+        if position < len(self._items):
+            self._items[position] = last
+            self._positions[last.uid] = position
+
+    def _fill_vacated(self) -> None:
+        # ✅ Highest first, so everything after the slot being filled is a live entity
+        for position in sorted(self._vacated, reverse=True):
+            last = self._items.pop()
+            if position < len(self._items):
+                self._items[position] = last
+                self._positions[last.uid] = position
+        self._vacated.clear()
+
+
+class CreatureStore(EntityStore[T]):
+    """An EntityStore that also keeps a store of each species' members."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.species: Dict[type, EntityStore[T]] = {}
+
+    def add(self, entity: T) -> None:
+        super().add(entity)
+        members = self.species.get(type(entity))
+        if members is None:
+            members = self.species[type(entity)] = EntityStore()
+        members.add(entity)
+
+    def remove(self, entity: T) -> None:
+        super().remove(entity)
+        self.species[type(entity)].remove(entity)
+
+    def count(self, species: type) -> int:
+        members = self.species.get(species)
+        return len(members) if members is not None else 0
+
+    def clear(self) -> None:
+        super().clear()
+        self.species.clear()
@@ -1,4 +1,3 @@
-import random
 from .aquatic_creature import AquaticCreature
 from .cookie import Cookie
 
@@ -7,14 +6,15 @@ class Fish(AquaticCreature):
     NORMAL_EMOJIS = ["🐠", "🐟"]
     RARE_EMOJIS = ["🐡"]
     """Standard fish that moves smoothly in all directions."""
+    __slots__ = ()
 
     def __init__(self, name: str, bowl: 'Bowl', x: int | None = None, y: int | None = None) -> None:
-        super().__init__(name=name, bowl=bowl, emoji=random.choice(self.NORMAL_EMOJIS), x=x, y=y)
+        super().__init__(name=name, bowl=bowl, emoji=bowl.rng.choice(self.NORMAL_EMOJIS), x=x, y=y)
 
     def update(self) -> None:
         """Fish swim normally and inherit base movement from AquaticCreature."""
         super().update()
 
         # Fish sometimes move randomly
-        if random.random() < 0.2:
+        if self.bowl.rng.random() < 0.2:
             self.random_movement()
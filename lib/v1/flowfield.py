@@ -0,0 +1,121 @@
+"""
+How far every cell of the tank is from the nearest food, shared by every creature looking for it.
+
+One breadth-first search outward from all the food at once stands in for each creature working out
+its own way there. Cells with a creature in them are walls, so the distances lead around a crowd
+rather than into the back of it.
+"""
+from typing import Callable, Iterable, List, Optional, Sequence, Tuple
+
+Cell = Tuple[int, int]
+
+WALL = -2  # Outside the open water, or a creature was there when the field was built
+UNSEEN = -1  # No way through to any food
+
+# Moves in the order AquaticCreature.move_toward prefers them when they are equally good: right, left, down, up
+STEPS: Tuple[Cell, ...] = ((1, 0), (-1, 0), (0, 1), (0, -1))
+SIDEWAYS: Tuple[Cell, ...] = ((1, 0), (-1, 0))
+
+
+class FlowField:
+    """
+    Step counts to the nearest source over the tank's open cells: 1 <= x < width - 2, 1 <= y <= height - 2,
+    or just the rows from top to bottom - 1 of them when the field is built for part of the tank.
+    """
+
+    def __init__(self) -> None:
+        self.width = 0
+        self.height = 0
+        self.rows: Tuple[int, int] = (0, 0)
+        self.distances: List[int] = []  # Row-major, y * width + x
+        self._empty: List[int] = []  # UNSEEN over the open cells and WALL around them, copied for each build
+
+    def build(self, width: int, height: int, sources: Iterable[Cell], blocked: Iterable[Cell],
+              rows: Optional[Tuple[int, int]] = None) -> None:
+        """
+        Starts over from the given food positions, with a wall wherever a creature is.
+
+        Food above or below rows counts from the nearest row it covers, that many steps further away.
+        """
+        top, bottom = rows or (0, height)
+        first_row, last_row = max(1, top), min(height - 2, bottom - 1)
+        if (width, height, (first_row, last_row)) != (self.width, self.height, self.rows):
+            self._resize(width, height, first_row, last_row)
+        distances = self._empty[:]
+        for x, y in blocked:
+            if 0 <= x < width and first_row <= y <= last_row:
+                distances[y * width + x] = WALL
+
+        seeds = []
+        for x, y in sources:
+            if 1 <= x < width - 2 and first_row <= last_row:
+                row = min(max(y, first_row), last_row)
+                seeds.append((abs(y - row), row * width + x))
+        seeds.sort()
+
+        # ✅ Level by level outward; food starting further off joins in when the search reaches its distance.
+        # The edge is all WALL, so neighbours never need bounds checks or wrap onto another row.
+        offsets = (1, -1, width, -width)
+        frontier: List[int] = []
+        steps = seeds[0][0] if seeds else 0
+        seeded = 0
+        while frontier or seeded < len(seeds):
+            if not frontier:
+                steps = max(steps, seeds[seeded][0])
+            while seeded < len(seeds) and seeds[seeded][0] <= steps:
+                index = seeds[seeded][1]
+                if distances[index] < 0:  # ✅ Food is reachable even with a creature on it
+                    distances[index] = steps
+                    frontier.append(index)
+                seeded += 1
+            steps += 1
+            next_frontier = []
+            for index in frontier:
+                for offset in offsets:
+                    neighbour = index + offset
+                    if distances[neighbour] == UNSEEN:
+                        distances[neighbour] = steps
+                        next_frontier.append(neighbour)
+            frontier = next_frontier
+        self.distances = distances
+
+    def _resize(self, width: int, height: int, first_row: int, last_row: int) -> None:
+        self.width, self.height, self.rows = width, height, (first_row, last_row)
+        row = [WALL] + [UNSEEN] * max(0, width - 3) + [WALL] * min(2, width - 1)
+        open_rows = max(0, last_row - first_row + 1)
+        self._empty = [WALL] * (width * first_row) + row * open_rows + [WALL] * (width * (height - first_row - open_rows))
+        self.distances = self._empty[:]
+
+    def distance(self, x: int, y: int) -> int:
+        """Steps to the nearest source, or a negative number (WALL or UNSEEN) if there is no saying."""
+        if 0 <= x < self.width and 0 <= y < self.height:
+            return self.distances[y * self.width + x]
+        return WALL
+
+    def step(self, x: int, y: int, steps: Sequence[Cell] = STEPS,
+             can_enter: Optional[Callable[[int, int], bool]] = None) -> Optional[Cell]:
+        """
+        Where to go next from (x, y): the cell one of steps leads to that is nearest a source, or (x, y)
+        itself if none of them is nearer. None if the field has no way from here to any source.
+
+        A creature's own cell was a wall when the field was built, so its distance is taken to be one
+        more than its best neighbour's.
+        """
+        width, distances = self.width, self.distances
+        if not (0 < x < width - 1 and 0 < y < self.height - 1):
+            return None
+        index = y * width + x
+        here = distances[index]
+        if here < 0:
+            reachable = [distances[index + offset] for offset in (1, -1, width, -width)
+                         if distances[index + offset] >= 0]
+            if not reachable:
+                return None
+            here = min(reachable) + 1
+
+        best, best_distance = (x, y), here
+        for dx, dy in steps:
+            distance = distances[index + dy * width + dx]
+            if 0 <= distance < best_distance and (can_enter is None or can_enter(x + dx, y + dy)):
+                best, best_distance = (x + dx, y + dy), distance
+        return best
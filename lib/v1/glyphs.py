@@ -0,0 +1,92 @@
+import sys
+from typing import Dict, Iterable, List
+
+from wcwidth import wcwidth
+
+ZWJ = "\u200d"
+VARIATION_SELECTOR_16 = "\ufe0f"  # Asks for the colourful, double-width emoji presentation
+
+
+def _is_skin_tone(char: str) -> bool:
+    return "\U0001F3FB" <= char <= "\U0001F3FF"
+
+
+def _is_regional_indicator(char: str) -> bool:
+    return "\U0001F1E6" <= char <= "\U0001F1FF"
+
+
+def split_graphemes(text: str) -> List[str]:
+    """
+    Splits text into user-perceived characters.
+
+    Covers what shows up in the tank: ZWJ sequences (🧜‍♂️), variation selectors, skin tones,
+    flags and combining marks. Not a full UAX #29 implementation.
+    """
+    clusters: List[str] = []
+    for char in text:
+        if clusters:
+            previous = clusters[-1]
+            joins = (
+                    previous.endswith(ZWJ)
+                    or char == ZWJ
+                    or _is_skin_tone(char)
+                    or wcwidth(char) == 0
+                    or (_is_regional_indicator(char) and len(previous) == 1 and _is_regional_indicator(previous))
+            )
+            if joins:
+                clusters[-1] = previous + char
+                continue
+        clusters.append(char)
+    return clusters
+
+
+def cluster_width(cluster: str) -> int:
+    """Number of terminal cells a single grapheme cluster occupies."""
+    if len(cluster) == 1:
+        return max(0, wcwidth(cluster))
+    if ZWJ in cluster or VARIATION_SELECTOR_16 in cluster or _is_regional_indicator(cluster[0]):
+        return 2  # ✅ Emoji sequences render as one double-width glyph, not the sum of their parts
+    return max(0, wcwidth(cluster[0]))
+
+
+def text_width(text: str) -> int:
+    """Number of terminal cells a string occupies."""
+    return sum(cluster_width(cluster) for cluster in split_graphemes(text))
+
+
+class GlyphRegistry:
+    """Interns every emoji the tank can show along with its display width, so lookups are O(1)."""
+
+    def __init__(self) -> None:
+        self._glyphs: List[str] = []
+        self._widths: List[int] = []
+        self._ids: Dict[str, int] = {}
+
+    def register(self, text: str) -> int:
+        """Returns the id for text, registering it the first time it is seen."""
+        glyph_id = self._ids.get(text)
+        if glyph_id is None:
+            glyph_id = len(self._glyphs)
+            self._glyphs.append(sys.intern(text))
+            self._widths.append(max(1, text_width(text)))
+            self._ids[text] = glyph_id
+        return glyph_id
+
+    def register_all(self, texts: Iterable[str]) -> None:
+        for text in texts:
+            self.register(text)
+
+    def glyph(self, glyph_id: int) -> str:
+        return self._glyphs[glyph_id]
+
+    def width(self, glyph_id: int) -> int:
+        return self._widths[glyph_id]
+
+    def __contains__(self, text: str) -> bool:
+        return text in self._ids
+
+    def __len__(self) -> int:
+        return len(self._glyphs)
+
+
+GLYPHS = GlyphRegistry()  # ✅ Shared by every bowl in the process
@@ -0,0 +1,53 @@
+import hashlib
+import json
+import time
+from dataclasses import dataclass
+
+from .bowl import Bowl
+from .clock import SimulatedClock
+
+
+@dataclass
+class HeadlessResult:
+    """Summary of a fast-forward run."""
+    ticks: int
+    simulated_seconds: float
+    wall_seconds: float
+    population: int
+    cookies: int
+    digest: str
+
+    @property
+    def ticks_per_second(self) -> float:
+        return self.ticks / self.wall_seconds if self.wall_seconds > 0 else float("inf")
+
+
+def state_digest(bowl: Bowl) -> str:
+    """Hash of everything the simulation tracks, for checking two runs came out bit-identical."""
+    return hashlib.sha256(json.dumps(bowl.to_dict(), sort_keys=True).encode()).hexdigest()
+
+
+def fast_forward(bowl: Bowl, clock: SimulatedClock, ticks: int, food_every: int = 0) -> HeadlessResult:
+    """
+    Runs bowl.update() back to back with no rendering, advancing the simulated clock one tick each time.
+
+    :param food_every: Drop a cookie every this many ticks, standing in for someone pressing 'f'. 0 disables it.
+    """
+    start_time = clock.now()
+    wall_start = time.perf_counter()
+    for tick in range(ticks):
+        if food_every and tick % food_every == 0:
+            bowl.drop_food()
+        bowl.update()
+        clock.advance()
+    wall_seconds = time.perf_counter() - wall_start
+    bowl.refresh_views()
+
+    return HeadlessResult(
+        ticks=ticks,
+        simulated_seconds=clock.now() - start_time,
+        wall_seconds=wall_seconds,
+        population=len(bowl.creatures),
+        cookies=len(bowl.cookies),
+        digest=state_digest(bowl),
+    )
@@ -1,4 +1,3 @@
-import random
 from .aquatic_creature import AquaticCreature
 from .cookie import Cookie
 
@@ -7,17 +6,18 @@ class Jellyfish(AquaticCreature):
     """Jellyfish float gracefully up and down."""
     NORMAL_EMOJIS = ["🪼"]
     RARE_EMOJIS = ["🦑", "🐙"]
+    __slots__ = ()
 
     def __init__(self, name: str, bowl: 'Bowl', x: int | None = None, y: int | None = None) -> None:
-        super().__init__(name=name, bowl=bowl, emoji=random.choice(self.NORMAL_EMOJIS), x=x, y=y)
+        super().__init__(name=name, bowl=bowl, emoji=bowl.rng.choice(self.NORMAL_EMOJIS), x=x, y=y)
 
     def swim(self, max_x: int, max_y: int) -> None:
         """Jellyfish primarily move up/down, occasionally drifting sideways."""
         super().swim(max_x=max_x, max_y=max_y)
-        if random.random() < 0.3:
-            self.y += random.choice([-1, 1])  # Move up or down
-        if random.random() < 0.1:
-            self.x += random.choice([-1, 1])  # Slight horizontal drift
+        if self.bowl.rng.random() < 0.3:
+            self.y += self.bowl.rng.choice([-1, 1])  # Move up or down
+        if self.bowl.rng.random() < 0.1:
+            self.x += self.bowl.rng.choice([-1, 1])  # Slight horizontal drift
 
         # Keep within bounds
         self.x = max(0, min(self.x, max_x - self.width))
@@ -0,0 +1,119 @@
+"""
+Append-only journal of what happened in the tank since the last full save.
+
+The file is JSON lines. The first line names the save it follows on from, by the SHA-256 of the
+save file, and lists the uid of each saved creature in order. Every line after that is one event:
+
+    spawn        a creature was added (spawned or born), with its saved form and uid
+    death        a creature left the tank
+    birth        two parents bred, with their reproduction counters afterwards
+    feed         a creature ate, with its food counters afterwards
+    cookie_drop  a cookie was dropped, with its saved form and uid
+    cookie_gone  a cookie was eaten or dissolved
+
+Replaying the events over the save brings back who is in the tank, what they have eaten and which
+cookies are in it. Positions are not journaled, so creatures come back where they were at the last
+save, or where they were born, and food they have digested since is back in their stomachs.
+"""
+import hashlib
+import json
+import os
+from typing import Dict, List, Optional
+
+
+def journal_path(save_path: str) -> str:
+    """Where the journal for a save file lives."""
+    return save_path + ".journal"
+
+
+def save_digest(blob: bytes) -> str:
+    return hashlib.sha256(blob).hexdigest()
+
+
+class Journal:
+    """Collects events on the simulation thread until the autosaver drains them to disk."""
+
+    def __init__(self) -> None:
+        self._events: List[dict] = []
+
+    def record(self, event: str, **fields) -> None:
+        fields["event"] = event
+        self._events.append(fields)
+
+    def drain(self) -> List[dict]:
+        """Returns every event recorded since the last drain."""
+        events, self._events = self._events, []
+        return events
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+
+def header(digest: str, uids: List[int], cookie_uids: List[int]) -> dict:
+    return {"event": "header", "save": digest, "uids": uids, "cookie_uids": cookie_uids}
+
+
+def encode(events: List[dict]) -> str:
+    return "".join(json.dumps(event) + "\n" for event in events)
+
+
+def read_events(path: str) -> Optional[tuple]:
+    """Returns (header, events) from a journal, stopping at a line cut short by a crash."""
+    if not os.path.exists(path):
+        return None
+    events = []
+    with open(path, "r") as file:
+        for line in file:
+            try:
+                events.append(json.loads(line))
+            except json.JSONDecodeError:
+                break  # ✅ Only the last append can be torn, everything before it is intact
+    if not events or events[0].get("event") != "header":
+        return None
+    return events[0], events[1:]
+
+
+def recover(data: dict, save_path: str) -> int:
+    """
+    Replays the journal for save_path over data, a tank in Bowl.to_dict() form, in place.
+
+    A journal left over from an older save is ignored: everything in it is already in the save.
+    Returns the number of events replayed.
+    """
+    journal = read_events(journal_path(save_path))
+    if journal is None:
+        return 0
+    head, events = journal
+    with open(save_path, "rb") as file:
+        if save_digest(file.read()) != head["save"]:
+            return 0
+    if "cookie_uids" not in head:
+        return 0  # Written before cookies had uids, when cookie_gone events gave a list position instead
+
+    creatures: Dict[int, dict] = dict(zip(head["uids"], data["creatures"]))
+    cookies: Dict[int, dict] = dict(zip(head["cookie_uids"], data["cookies"]))
+    for event in events:
+        kind = event["event"]
+        if kind == "spawn":
+            creatures[event["uid"]] = event["creature"]
+        elif kind == "death":
+            creatures.pop(event["uid"], None)
+        elif kind == "birth":
+            for parent in event["parents"]:
+                creature = creatures.get(parent.pop("uid"))
+                if creature is not None:
+                    creature.update(parent)
+        elif kind == "feed":
+            creature = creatures.get(event["uid"])
+            if creature is not None:
+                creature["current_food_count"] = event["current_food_count"]
+                creature["eaten_since_last_reproduction"] = event["eaten_since_last_reproduction"]
+        elif kind == "cookie_drop":
+            cookies[event["uid"]] = event["cookie"]
+        elif kind == "cookie_gone":
+            cookies.pop(event["uid"], None)
+
+    # ✅ Dicts keep insertion order, so creatures come back in the order they joined the tank
+    data["creatures"] = list(creatures.values())
+    data["cookies"] = list(cookies.values())
+    return len(events)
@@ -0,0 +1,102 @@
+"""
+Keyboard input straight from the terminal, without root.
+
+stdin is put into cbreak mode (keys arrive as they're pressed, unechoed, while Ctrl+C still interrupts)
+and read with select, so checking for input never blocks and every key pressed is kept, in order, until
+the main loop gets to it.
+"""
+import os
+import select
+import sys
+import termios
+import tty
+from collections import deque
+from typing import Deque, List, Optional
+
+ESCAPE = "\x1b"
+READ_SIZE = 1024
+
+
+class KeyReader:
+    """Queues keypresses from a terminal. Use as a context manager so the terminal is always put back."""
+
+    def __init__(self, stream=None) -> None:
+        self.stream = stream or sys.stdin
+        self.events: Deque[str] = deque()
+        self._fd: Optional[int] = None
+        self._saved: Optional[list] = None
+        self._pending = ""  # The start of an escape sequence cut off by the end of a read
+
+    def __enter__(self) -> "KeyReader":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def start(self) -> None:
+        if not self.stream.isatty():
+            return  # ✅ Nothing to read keys from, e.g. stdin is a pipe; the tank still runs
+        self._fd = self.stream.fileno()
+        self._saved = termios.tcgetattr(self._fd)
+        tty.setcbreak(self._fd)
+
+    def close(self) -> None:
+        if self._saved is not None:
+            termios.tcsetattr(self._fd, termios.TCSADRAIN, self._saved)
+            self._saved = None
+        self._fd = None
+
+    def fileno(self) -> Optional[int]:
+        """The terminal's file descriptor while reading, or None when stdin isn't a terminal."""
+        return self._fd
+
+    def wait(self, timeout: float) -> bool:
+        """Waits up to timeout seconds for a key. Returns whether any keys are queued."""
+        if self._fd is not None:
+            ready, _, _ = select.select([self._fd], [], [], max(0.0, timeout))
+            if ready:
+                self._read()
+        return bool(self.events)
+
+    def poll(self) -> bool:
+        """Queues whatever has been typed since the last call, without waiting."""
+        return self.wait(0)
+
+    def drain(self) -> List[str]:
+        """Every queued key in the order it was pressed, emptying the queue."""
+        self.poll()
+        keys = list(self.events)
+        self.events.clear()
+        return keys
+
+    def _read(self) -> None:
+        data = os.read(self._fd, READ_SIZE)
+        text = self._pending + data.decode(errors="replace")
+        self._pending = ""
+        i = 0
+        while i < len(text):
+            char = text[i]
+            if char != ESCAPE:
+                self.events.append(char)
+                i += 1
+                continue
+            # ✅ Arrow keys and the like arrive as one escape sequence; queue it as a single key
+            end = self._escape_end(text, i)
+            if end is None:
+                self._pending = text[i:]
+                return
+            self.events.append(text[i:end])
+            i = end
+
+    @staticmethod
+    def _escape_end(text: str, start: int) -> Optional[int]:
+        """Index just past the escape sequence at start, or None if it's cut off."""
+        if start + 1 >= len(text):
+            return start + 1  # A lone Esc key
+        if text[start + 1] not in "[O":
+            return start + 1
+        for i in range(start + 2, len(text)):
+            if "@" <= text[i] <= "~":
+                return i + 1
+        return None
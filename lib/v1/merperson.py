@@ -1,5 +1,3 @@
-import random
-import time
 from typing import Optional
 
 from lib.v1.aquatic_creature import AquaticCreature
@@ -10,20 +8,21 @@ class Merperson(AquaticCreature):
     RARITY_CHANCE = .05
     NORMAL_EMOJIS = ['🧜']
     RARE_EMOJIS = ['🧜']
+    __slots__ = ('gender',)
 
     def __init__(self, name: str, bowl: 'Bowl', emoji: str, x: int | None = None, y: int | None = None) -> None:
         super().__init__(name=name, bowl=bowl, emoji=emoji, x=x, y=y)
 
-        self.gender = random.choice([self.sex, "They"])
+        self.gender = self.bowl.rng.choice([self.sex, "They"])
 
     def swim(self, max_x: int, max_y: int) -> None:
         """Default Merperson movement (to be overridden)."""
         super().swim(max_x, max_y)
 
         # Occasionally swim upward
-        if random.random() < 0.1:
+        if self.bowl.rng.random() < 0.1:
             self.y -= 1  # Move up
-        elif random.random() < 0.2:
+        elif self.bowl.rng.random() < 0.2:
             self.y += 1  # Move down
 
         # Keep within bounds
@@ -37,13 +36,13 @@ class Merperson(AquaticCreature):
 
         baby_x, baby_y = self.find_nearest_open_space((self.x + other.x) // 2, (self.y + other.y) // 2, self.bowl)
 
-        offspring_type = random.choice([self.__class__, other.__class__])
+        offspring_type = self.bowl.rng.choice([self.__class__, other.__class__])
 
         baby = offspring_type.create_offspring(f"{offspring_type.__name__}_Jr", self.bowl, baby_x, baby_y)
 
         if baby:
-            self.last_reproduction_time = time.time()
-            other.last_reproduction_time = time.time()
+            self.last_reproduction_time = self.bowl.clock.now()
+            other.last_reproduction_time = self.bowl.clock.now()
             self.eaten_since_last_reproduction = 0
             other.eaten_since_last_reproduction = 0
             self.offspring_count += 1
@@ -53,6 +52,13 @@ class Merperson(AquaticCreature):
 
         return baby
 
+    def restore(self, data: dict) -> None:
+        super().restore(data)
+        self.gender = data.get('gender') or self.bowl.rng.choice([self.sex, "They"])
+
+    def to_dict(self) -> dict:
+        return {**super().to_dict(), 'gender': self.gender}
+
     @property
     def stats(self):
         return {
@@ -0,0 +1,49 @@
+from typing import Dict, Iterator, Tuple
+
+Cell = Tuple[int, int]
+
+
+class OccupancyGrid:
+    """Tracks how many creatures sit on each cell so lookups don't rescan the whole bowl."""
+
+    def __init__(self) -> None:
+        self._cells: Dict[Cell, int] = {}
+
+    def add(self, x: int, y: int) -> None:
+        """Marks a creature as standing on (x, y)."""
+        cell = (x, y)
+        self._cells[cell] = self._cells.get(cell, 0) + 1
+
+    def remove(self, x: int, y: int) -> None:
+        """Releases one creature's claim on (x, y)."""
+        cell = (x, y)
+        count = self._cells.get(cell, 0)
+        if count <= 1:
+            self._cells.pop(cell, None)
+        else:
+            self._cells[cell] = count - 1
+
+    def move(self, old_x: int, old_y: int, new_x: int, new_y: int) -> None:
+        """Moves a single occupant from one cell to another."""
+        if (old_x, old_y) == (new_x, new_y):
+            return
+        self.remove(old_x, old_y)
+        self.add(new_x, new_y)
+
+    def is_occupied(self, x: int, y: int) -> bool:
+        return (x, y) in self._cells
+
+    def count(self, x: int, y: int) -> int:
+        return self._cells.get((x, y), 0)
+
+    def clear(self) -> None:
+        self._cells.clear()
+
+    def __contains__(self, cell: Cell) -> bool:
+        return cell in self._cells
+
+    def __iter__(self) -> Iterator[Cell]:
+        return iter(self._cells)
+
+    def __len__(self) -> int:
+        return len(self._cells)
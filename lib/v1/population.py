@@ -0,0 +1,175 @@
+import bisect
+from typing import Dict, List, Tuple
+
+from .aquatic_creature import AquaticCreature
+
+
+def species_emoji(creature: AquaticCreature) -> str:
+    """The species' everyday emoji, rather than whichever one the first creature seen happened to have."""
+    return creature.NORMAL_EMOJIS[0] if creature.NORMAL_EMOJIS else creature.emoji
+
+
+class SpeciesTotals:
+    """Running totals for one species, kept in step as its creatures come, go, eat and breed."""
+
+    __slots__ = ('name', 'emoji', 'count', 'rare', 'food', 'capacity', 'offspring', 'birth_times')
+
+    def __init__(self, name: str, emoji: str) -> None:
+        self.name = name
+        self.emoji = emoji
+        self.count = 0
+        self.rare = 0
+        self.food = 0  # Sum of current_food_count
+        self.capacity = 0  # Sum of FULL_AT_FOOD_COUNT, so fullness is food / capacity
+        self.offspring = 0
+        self.birth_times: List[float] = []  # ✅ Sorted, so any age percentile is one lookup
+
+    @property
+    def fullness(self) -> float:
+        return min(1.0, self.food / self.capacity) if self.capacity else 0.0
+
+    def ages(self, now: float) -> Tuple[float, float, float]:
+        """Youngest, median and oldest age in seconds."""
+        births = self.birth_times
+        return now - births[-1], now - births[len(births) // 2], now - births[0]
+
+
+class PopulationStats:
+    """Per-species totals for a bowl. The bowl reports every creature added or removed; creatures report changes."""
+
+    def __init__(self) -> None:
+        self.species: Dict[str, SpeciesTotals] = {}
+        self.total = 0
+        self.rare = 0
+
+    def add(self, creature: AquaticCreature) -> None:
+        name = type(creature).__name__
+        totals = self.species.get(name)
+        if totals is None:
+            totals = self.species[name] = SpeciesTotals(name, species_emoji(creature))
+        totals.count += 1
+        totals.rare += creature.rare
+        totals.food += creature.current_food_count
+        totals.capacity += creature.FULL_AT_FOOD_COUNT
+        totals.offspring += creature.offspring_count
+        bisect.insort(totals.birth_times, creature.birth_time)
+        self.total += 1
+        self.rare += creature.rare
+
+    def remove(self, creature: AquaticCreature) -> None:
+        totals = self.species[type(creature).__name__]
+        totals.count -= 1
+        totals.rare -= creature.rare
+        totals.food -= creature.current_food_count
+        totals.capacity -= creature.FULL_AT_FOOD_COUNT
+        totals.offspring -= creature.offspring_count
+        del totals.birth_times[bisect.bisect_left(totals.birth_times, creature.birth_time)]
+        self.total -= 1
+        self.rare -= creature.rare
+        if not totals.count:
+            del self.species[totals.name]
+
+    def food_changed(self, creature: AquaticCreature, change: int) -> None:
+        self.species[type(creature).__name__].food += change
+
+    def offspring_changed(self, creature: AquaticCreature, change: int) -> None:
+        self.species[type(creature).__name__].offspring += change
+
+    def clear(self) -> None:
+        self.species.clear()
+        self.total = 0
+        self.rare = 0
+
+    def recount(self, creatures: List[AquaticCreature]) -> None:
+        """Starts over from a list of creatures, for engines whose creatures change without telling anyone."""
+        self.clear()
+        for creature in creatures:
+            name = type(creature).__name__
+            totals = self.species.get(name)
+            if totals is None:
+                totals = self.species[name] = SpeciesTotals(name, species_emoji(creature))
+            totals.count += 1
+            totals.rare += creature.rare
+            totals.food += creature.current_food_count
+            totals.capacity += creature.FULL_AT_FOOD_COUNT
+            totals.offspring += creature.offspring_count
+            totals.birth_times.append(creature.birth_time)
+            self.rare += creature.rare
+        for totals in self.species.values():
+            totals.birth_times.sort()  # ✅ Sorted once, rather than inserting a creature at a time
+        self.total = len(creatures)
+
+
+def format_age(seconds: float) -> str:
+    """Age at the coarsest unit that still says something, so it only changes every so often."""
+    if seconds < 60:
+        return f"{int(seconds)}s"
+    if seconds < 3600:
+        return f"{int(seconds // 60)}m"
+    if seconds < 86400:
+        return f"{int(seconds // 3600)}h"
+    return f"{int(seconds // 86400)}d"
+
+
+class StatsPanel:
+    """
+    The stats beside the tank: a line per species, then a page of individual creatures.
+
+    Every line is cached with the values it was built from and only formatted again when one of them
+    changes, so a frame where nothing visible changed formats nothing.
+    """
+
+    def __init__(self, population: PopulationStats) -> None:
+        self.population = population
+        self.page = 0
+        self._species_lines: Dict[str, Tuple[tuple, str]] = {}
+        self._creature_lines: Dict[int, Tuple[tuple, str]] = {}
+
+    def lines(self, creatures: List[AquaticCreature], now: float, height: int) -> List[str]:
+        """At most height lines: totals, each species, then as many creatures as fit."""
+        population = self.population
+        lines = [f"{population.total} creatures, {population.rare} rare"]
+        for totals in population.species.values():
+            lines.append(self._species_line(totals, now))
+
+        page_size = max(1, height - len(lines) - 1)
+        pages = max(1, -(-len(creatures) // page_size))
+        self.page = min(self.page, pages - 1)
+        start = self.page * page_size
+        shown = creatures[start:start + page_size]
+        lines.append(f" Creatures {start + 1}-{start + len(shown)} of {len(creatures)} ".center(30, "-")
+                     if shown else " No creatures ".center(30, "-"))
+        lines.extend(self._creature_line(creature, now) for creature in shown)
+
+        if len(self._creature_lines) > 4 * page_size:
+            # ✅ Forget creatures that are no longer on screen (or in the tank)
+            keep = {creature.uid for creature in shown}
+            self._creature_lines = {uid: entry for uid, entry in self._creature_lines.items() if uid in keep}
+        return lines[:height]
+
+    def next_page(self) -> None:
+        self.page += 1  # Clamped to the last page when the panel is drawn
+
+    def previous_page(self) -> None:
+        self.page = max(0, self.page - 1)
+
+    def _species_line(self, totals: SpeciesTotals, now: float) -> str:
+        youngest, median, oldest = totals.ages(now)
+        key = (totals.count, totals.rare, round(totals.fullness * 100), totals.offspring,
+               format_age(youngest), format_age(median), format_age(oldest))
+        cached = self._species_lines.get(totals.name)
+        if cached is None or cached[0] != key:
+            count, rare, fullness, offspring, youngest, median, oldest = key
+            line = (f"{totals.emoji} {totals.name:<9}{count:>5} ({rare} rare)  {fullness}% full  "
+                    f"{offspring} offspring  age {youngest}/{median}/{oldest}")
+            cached = self._species_lines[totals.name] = (key, line)
+        return cached[1]
+
+    def _creature_line(self, creature: AquaticCreature, now: float) -> str:
+        # Name, sex and the like never change once a creature is in the tank, so they needn't be in the key
+        key = (int(now - creature.birth_time), creature.current_food_count, creature.offspring_count,
+               creature.glyph_id)
+        cached = self._creature_lines.get(creature.uid)
+        if cached is None or cached[0] != key:
+            cached = self._creature_lines[creature.uid] = (key, f"{creature.emoji} {creature.stats}")
+        return cached[1]
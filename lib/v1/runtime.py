@@ -0,0 +1,118 @@
+"""
+Runs a Bowl on asyncio, with the simulation, drawing, input and autosaving each going at their own pace.
+
+    - The tick task steps the bowl tick_rate times a second against a fixed schedule. If it falls behind
+      it runs the missed ticks back to back, up to MAX_CATCH_UP, before giving up on the rest.
+    - The render task draws at most fps times a second, and only once something has changed. Building
+      a frame is quick; writing it to a slow terminal isn't, so that happens on a writer thread, and
+      frames that come due while a write is still going are dropped rather than queued.
+    - Keys are handled the moment the terminal has them, through the event loop's reader callbacks.
+    - The autosave task hands the Autosaver its copy of the tank between ticks; packing and writing
+      that copy happens on the Autosaver's own writer thread.
+"""
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional
+
+from .autosave import Autosaver
+from .keys import KeyReader
+from .recording import RECORDED_ACTIONS, Recorder
+from .terminal import TerminalRenderer
+
+MAX_CATCH_UP = 5  # Ticks run back to back after a stall before the schedule is reset
+
+
+class BowlRuntime:
+    """Drives a bowl, its terminal, keyboard and autosaver until cancelled."""
+
+    def __init__(self, bowl: 'Bowl', renderer: TerminalRenderer, keys: KeyReader, autosaver: Optional[Autosaver],
+                 tick_rate: float = 1 / 0.3, fps: float = 10.0, recorder: Optional[Recorder] = None) -> None:
+        self.bowl = bowl
+        self.renderer = renderer
+        self.keys = keys
+        self.autosaver = autosaver
+        self.tick_seconds = 1 / tick_rate
+        self.frame_seconds = 1 / fps
+        self.recorder = recorder
+        self.actions: Dict[str, str] = {
+            "p": "toggle_pause",
+            "s": "spawn_creature",
+            "k": "kill_random_creature",
+            "f": "drop_food",
+            "o": "toggle_profiler",
+            "]": "next_stats_page",
+            "[": "previous_stats_page",
+        }
+        self.ticks = 0
+        self.frames_drawn = 0
+        self.frames_dropped = 0
+        self._changed = asyncio.Event()
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="terminal")
+
+    async def run(self) -> None:
+        """Runs every task until one fails or the runtime is cancelled."""
+        loop = asyncio.get_running_loop()
+        fd = self.keys.fileno()
+        if fd is not None:
+            loop.add_reader(fd, self._on_keys)
+        tasks = [self._tick_loop(), self._render_loop()]
+        if self.autosaver is not None:
+            tasks.append(self._autosave_loop())
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            if fd is not None:
+                loop.remove_reader(fd)
+            self._writer.shutdown(wait=True)
+
+    def _on_keys(self) -> None:
+        for key in self.keys.drain():
+            action = self.actions.get(key.lower())
+            if action is None:
+                continue
+            if self.recorder is not None and action in RECORDED_ACTIONS:
+                self.recorder.perform(action)
+            else:
+                getattr(self.bowl, action)()
+            self._changed.set()
+
+    async def _tick_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        next_tick = loop.time()
+        while True:
+            await asyncio.sleep(max(0.0, next_tick - loop.time()))
+            behind = 0
+            while loop.time() >= next_tick and behind < MAX_CATCH_UP:
+                if not self.bowl.paused:
+                    self.bowl.update()
+                if self.recorder is not None:
+                    self.recorder.tick()
+                self.ticks += 1
+                next_tick += self.tick_seconds
+                behind += 1
+                await asyncio.sleep(0)  # ✅ Let keys in between catch-up ticks
+            if loop.time() >= next_tick:
+                next_tick = loop.time() + self.tick_seconds  # ✅ Too far behind; carry on from now
+            self._changed.set()
+
+    async def _render_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        writing: Optional[asyncio.Future] = None
+        while True:
+            await self._changed.wait()
+            if writing is not None and not writing.done():
+                # ✅ The terminal hasn't taken the last frame yet; skip this one and try again next frame
+                self.frames_dropped += 1
+            else:
+                self._changed.clear()
+                if writing is not None:
+                    writing.result()  # Surface any error from the last write
+                output = self.renderer.diff(self.bowl.render_frame())
+                writing = loop.run_in_executor(self._writer, self.renderer.write, output)
+                self.frames_drawn += 1
+            await asyncio.sleep(self.frame_seconds)
+
+    async def _autosave_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.autosaver.flush_interval)
+            self.autosaver.tick()
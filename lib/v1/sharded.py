@@ -0,0 +1,311 @@
+"""
+Simulates one big tank across several worker processes.
+
+The tank is cut into horizontal stripes, each owned by a worker running an ordinary Bowl over the
+whole tank area but holding only the creatures and cookies inside its rows. Every tick:
+
+    1. The coordinator sends each worker its halo (occupied cells in the rows just above and below
+       its stripe), where every cookie outside the stripe is, and any creatures, cookies or kills
+       routed to it since the last tick.
+    2. All workers run Bowl.update() at the same time.
+    3. Each worker hands back whatever left its stripe, its own edge rows and its cookies' positions,
+       and the coordinator routes emigrants to the stripe they moved into.
+
+Creatures swim toward the nearest cookie anywhere in the tank, as they do in a single Bowl. What
+stays inside a stripe: breeding partners, shark prey and the population count sharks check before
+hunting. Halos and other stripes' cookies are as of the end of the previous tick.
+"""
+import bisect
+import multiprocessing
+import os
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .aquatic_creature import AquaticCreature
+from .bowl import AVAILABLE_CREATURES, Bowl
+from .clock import Clock
+from .cookie import Cookie
+
+MIN_STRIPE_HEIGHT = 4  # Creatures move at most a row per tick, so a stripe is only ever crossed one at a time
+
+Cell = Tuple[int, int]
+
+
+class CoordinatorClock(Clock):
+    """A worker's clock: the time the coordinator said the current tick happens at."""
+
+    def __init__(self) -> None:
+        self.time = 0.0
+
+    def now(self) -> float:
+        return self.time
+
+
+class RemoteCookie:
+    """Another stripe's cookie. Only its position matters here: eating a cookie doesn't use it up."""
+    __slots__ = ('x', 'y')
+
+    def __init__(self, x: int, y: int) -> None:
+        self.x = x
+        self.y = y
+
+    def eat(self) -> None:
+        pass
+
+
+class StripeBowl(Bowl):
+    """The part of the tank a worker owns: rows top to bottom - 1, with one halo row either side."""
+
+    def __init__(self, width: int, height: int, top: int, bottom: int, clock: Clock, seed: Optional[str]) -> None:
+        super().__init__(width=width, height=height, save_file="", clock=clock)
+        self.rng.seed(seed)
+        self.top = top
+        self.bottom = bottom
+        self.food_field_rows = (top - 1, bottom + 1)  # ✅ Its own rows and the halo; other stripes' food counts from the edge
+        self.remote_food: List[RemoteCookie] = []
+        self._halo: List[Cell] = []
+        self._new_log: List[str] = []
+        self._types = {creature_type.__name__: creature_type for creature_type in AVAILABLE_CREATURES}
+
+    def log_activity(self, message: str) -> None:
+        super().log_activity(message)
+        self._new_log.append(message)
+
+    def index_food(self) -> None:
+        super().index_food()
+        for cookie in self.remote_food:
+            self.food_index.insert(cookie, cookie.x, cookie.y)
+
+    def set_halo(self, cells: List[Cell]) -> None:
+        """Marks the cells neighbouring stripes occupy, so nobody moves into them."""
+        for x, y in self._halo:
+            self.occupancy.remove(x, y)
+        for x, y in cells:
+            self.occupancy.add(x, y)
+        self._halo = cells
+
+    def receive(self, creatures: List[dict], cookies: List[dict], kills: List[int]) -> None:
+        """Takes in what the coordinator routed here. Kills are positions in self.creatures."""
+        for creature in [self.creatures[index] for index in kills]:
+            self.remove_creature(creature)
+        for data in creatures:
+            self.add_creature(self._types[data['type']].from_dict(self, data))
+        for data in cookies:
+            self.add_cookie(Cookie.from_dict(bowl=self, data=data))
+
+    def step(self, halo: List[Cell], remote_food: List[Cell]) -> dict:
+        """Runs one tick and hands back everything the coordinator needs to route."""
+        self.set_halo(halo)
+        self.remote_food = [RemoteCookie(x, y) for x, y in remote_food]
+        self.update()
+
+        emigrants = [creature for creature in self.creatures if not self.top <= creature.y < self.bottom]
+        for creature in emigrants:
+            self.remove_creature(creature)
+        leaving_cookies = [cookie for cookie in self.cookies if not self.top <= cookie.y < self.bottom]
+        for cookie in leaving_cookies:
+            self.remove_cookie(cookie)
+
+        log, self._new_log = self._new_log, []
+        return {
+            'creatures': [creature.to_dict() for creature in emigrants],
+            'cookies': [cookie.to_dict() for cookie in leaving_cookies],
+            'edges': [(c.x, c.y) for c in self.creatures if c.y == self.top or c.y == self.bottom - 1],
+            'food': [(cookie.x, cookie.y) for cookie in self.cookies],
+            'log': log,
+            'population': len(self.creatures),
+        }
+
+
+def _worker_main(connection, width: int, height: int, top: int, bottom: int, seed: Optional[str]) -> None:
+    clock = CoordinatorClock()
+    bowl = StripeBowl(width, height, top, bottom, clock, seed)
+    while True:
+        message = connection.recv()
+        if message is None:
+            return
+        kind, now, routed, tick = message
+        clock.time = now
+        bowl.receive(*routed)
+        if kind == 'step':
+            connection.send(bowl.step(*tick))
+        else:
+            connection.send(bowl.to_dict())
+
+
+class ShardedBowl(Bowl):
+    """
+    A Bowl whose simulation runs in worker processes, one per horizontal stripe of the tank.
+
+    Fill it the usual way (load_state() or populate_random_tank()); the workers start on the first
+    update(). After that, self.creatures and self.cookies are a view of the workers' tanks that
+    refresh_views() rebuilds, which rendering and saving do for you. Call close() when finished.
+    """
+
+    def __init__(self, width: int, height: int, save_file: str, clock: Clock | None = None,
+                 seed: int | None = None, workers: int | None = None) -> None:
+        super().__init__(width=width, height=height, save_file=save_file, clock=clock, seed=seed)
+        stripes = max(1, min(workers or os.cpu_count() or 1, height // MIN_STRIPE_HEIGHT))
+        self.tops: List[int] = [height * i // stripes for i in range(stripes)]
+        self.bottoms: List[int] = self.tops[1:] + [height]
+        self._processes: List[multiprocessing.Process] = []
+        self._connections = []
+        self._stale = False
+        self._origin: Dict[int, Tuple[int, int]] = {}  # id(view creature) → (stripe, position in that stripe)
+        self._routed: List[Tuple[List[dict], List[dict], List[int]]] = []
+        self._edges: List[List[Cell]] = []
+        self._food: List[List[Cell]] = []
+
+    @property
+    def started(self) -> bool:
+        return bool(self._processes)
+
+    def stripe_of(self, y: int) -> int:
+        return max(0, min(bisect.bisect_right(self.tops, y) - 1, len(self.tops) - 1))
+
+    def start(self) -> None:
+        """Hands the tank's contents out to one worker process per stripe."""
+        data = Bowl.to_dict(self)
+        stripes = len(self.tops)
+        self._routed = [([], [], []) for _ in range(stripes)]
+        self._edges = [[] for _ in range(stripes)]
+        self._food = [[] for _ in range(stripes)]
+        for index, (top, bottom) in enumerate(zip(self.tops, self.bottoms)):
+            parent, child = multiprocessing.Pipe()
+            seed = None if self.seed is None else f"{self.seed}/{index}"
+            process = multiprocessing.Process(target=_worker_main, args=(child, self.width, self.height, top,
+                                                                           bottom, seed), daemon=True)
+            process.start()
+            self._processes.append(process)
+            self._connections.append(parent)
+
+        self._route(data['creatures'], data['cookies'])
+        self._clear_view()
+
+    def close(self) -> None:
+        """Stops the worker processes. The view keeps whatever was last refreshed."""
+        self.refresh_views()
+        for connection in self._connections:
+            connection.send(None)
+        for process in self._processes:
+            process.join()
+        self._processes, self._connections = [], []
+
+    def _route(self, creatures: Iterable[dict], cookies: Iterable[dict]) -> None:
+        for data in creatures:
+            stripe = self.stripe_of(data['y'])
+            self._routed[stripe][0].append(data)
+            # ✅ Arrivals on a stripe's edge row are part of its neighbour's halo from the next tick
+            if data['y'] in (self.tops[stripe], self.bottoms[stripe] - 1):
+                self._edges[stripe].append((data['x'], data['y']))
+        for data in cookies:
+            stripe = self.stripe_of(data['y'])
+            self._routed[stripe][1].append(data)
+            self._food[stripe].append((data['x'], data['y']))
+
+    def _send(self, kind: str, ticks: List[Optional[tuple]]) -> list:
+        """Sends every worker its routed items (and tick), then waits for all of them to answer."""
+        now = self.clock.now()
+        routed, self._routed = self._routed, [([], [], []) for _ in self.tops]
+        for connection, items, tick in zip(self._connections, routed, ticks):
+            connection.send((kind, now, items, tick))
+        return [connection.recv() for connection in self._connections]
+
+    def update(self) -> None:
+        """Runs one tick on every stripe at once."""
+        if not self.started:
+            self.start()
+
+        tick_start = time.perf_counter()
+        profiler = self.profiler
+        stripes = len(self.tops)
+        with profiler.phase("update.halos"):
+            ticks = []
+            for index in range(stripes):
+                halo = []
+                if index > 0:
+                    halo += [cell for cell in self._edges[index - 1] if cell[1] == self.tops[index] - 1]
+                if index < stripes - 1:
+                    halo += [cell for cell in self._edges[index + 1] if cell[1] == self.bottoms[index]]
+                food = [cell for other, cells in enumerate(self._food) if other != index for cell in cells]
+                ticks.append((halo, food))
+
+        # ✅ The workers' own phases aren't visible from here, only how long the slowest stripe took
+        with profiler.phase("update.stripes"):
+            results = self._send('step', ticks)
+
+        with profiler.phase("update.route"):
+            self._edges = [result['edges'] for result in results]
+            self._food = [result['food'] for result in results]
+            for result in results:
+                for message in result['log']:
+                    self.log_activity(message)
+            for result in results:
+                self._route(result['creatures'], result['cookies'])
+        self._stale = True
+
+        if profiler.enabled:
+            profiler.tick_done(time.perf_counter() - tick_start,
+                               population=sum(result['population'] for result in results),
+                               cookies=sum(len(cells) for cells in self._food))
+
+    def refresh_views(self) -> None:
+        """Rebuilds self.creatures and self.cookies from the workers' tanks."""
+        if not self.started or not self._stale:
+            return
+        states = self._send('state', [None] * len(self.tops))
+        self._clear_view()
+        for stripe, state in enumerate(states):
+            for position, data in enumerate(state['creatures']):
+                creature = self._creature_type(data).from_dict(self, data)
+                Bowl.add_creature(self, creature)
+                self._origin[id(creature)] = (stripe, position)
+            for data in state['cookies']:
+                Bowl.add_cookie(self, Cookie.from_dict(bowl=self, data=data))
+        self._stale = False
+
+    def _clear_view(self) -> None:
+        for creature in self.creatures:
+            creature.in_bowl = False
+        self.creatures.clear()
+        self.cookies.clear()
+        self.occupancy.clear()
+        self.breeding.clear()
+        self.population.clear()
+        self.food_index.clear()
+        self.prey_index.clear()
+        self.cookie_timers.clear()
+        self.digestion_timers.clear()
+        self._origin.clear()
+
+    @staticmethod
+    def _creature_type(data: dict) -> type:
+        return next(t for t in AVAILABLE_CREATURES if t.__name__ == data['type'])
+
+    def render_frame(self):
+        self.refresh_views()
+        return super().render_frame()
+
+    def add_creature(self, creature: AquaticCreature) -> None:
+        if not self.started:
+            return super().add_creature(creature)
+        self._route([creature.to_dict()], [])
+        self._stale = True
+
+    def remove_creature(self, creature: AquaticCreature) -> None:
+        if not self.started:
+            return super().remove_creature(creature)
+        stripe, position = self._origin.pop(id(creature))
+        self._routed[stripe][2].append(position)
+        super().remove_creature(creature)
+        self._stale = True
+
+    def add_cookie(self, cookie: Cookie) -> None:
+        if not self.started:
+            return super().add_cookie(cookie)
+        self._route([], [cookie.to_dict()])
+        self._stale = True
+
+    def kill_random_creature(self) -> None:
+        self.refresh_views()  # ✅ Pick from who is actually in the tank
+        super().kill_random_creature()
@@ -1,6 +1,4 @@
-import random
 from typing import List, Optional
-import time
 from .aquatic_creature import AquaticCreature
 
 
@@ -8,38 +6,79 @@ class Shark(AquaticCreature):
     """A predator that hunts and eats other creatures but regulates population."""
     NORMAL_EMOJIS = ["🦈"]
     ALLOW_RARE = False
-    HUNT_RADIUS = 5
+    IS_PREDATOR = True
+    HUNT_RADIUS = 5  # Cells a well-fed shark looks for prey within
+    HUNT_RADIUS_GROWTH = 0.5  # Cells the radius widens by for every second without a kill
     KILL_COOLDOWN = 3
     MIN_POPULATION = 10
     MAX_POPULATION = 12
+    __slots__ = ('hunger', 'last_kill_time')
 
     def __init__(self, name: str, bowl: 'Bowl', x: int | None = None, y: int | None = None) -> None:
-        super().__init__(name=name, bowl=bowl, emoji=random.choice(self.NORMAL_EMOJIS), x=x, y=y)
+        super().__init__(name=name, bowl=bowl, emoji=bowl.rng.choice(self.NORMAL_EMOJIS), x=x, y=y)
         self.hunger = 0
         self.last_kill_time = 0
 
+    def restore(self, data: dict) -> None:
+        super().restore(data)
+        self.hunger = data.get('hunger', 0)
+        self.last_kill_time = data.get('last_kill_time', 0)
+
+    def to_dict(self) -> dict:
+        return {**super().to_dict(), 'hunger': self.hunger, 'last_kill_time': self.last_kill_time}
+
     def update(self) -> None:
         """Shark hunts prey but only if the population is high."""
         if len(self.bowl.creatures) <= self.MIN_POPULATION:
             return  # Stop hunting if population is too low
 
-        prey = self.closest_food
+        now = self.bowl.clock.now()
+        prey = self.find_prey(now)
+        if prey is None:
+            self.patrol()
+        else:
+            self.bowl.prey_claims.add(prey.uid)  # ✅ No other shark goes after it this tick
+            # Kill prey if cooldown allows
+            if abs(self.x - prey.x) + abs(self.y - prey.y) <= 1 and now - self.last_kill_time >= self.KILL_COOLDOWN:
+                self.strike(prey, now)
+            else:
+                self.move_toward(prey.x, prey.y)  # ✅ Stalk it, even while the last meal is going down
 
-        self.move_toward(prey.x, prey.y)
+        self.stay_in_bounds()  # ✅ Keep sharks inside!
 
-        # Kill prey if cooldown allows
-        if self.x == prey.x and self.y == prey.y and (time.time() - self.last_kill_time) >= self.KILL_COOLDOWN:
-            self.bowl.creatures.remove(prey)
-            self.hunger += 1
-            self.last_kill_time = time.time()
-            self.bowl.log_activity(f"🦈 {self.name} ate {prey.name}!")
+    def hunt_radius(self, now: float) -> int:
+        """How far the shark looks for prey, wider the longer since it last ate."""
+        return self.radius_after(now - max(self.last_kill_time, self.birth_time))
 
-        self.stay_in_bounds()  # ✅ Keep sharks inside!
+    @classmethod
+    def radius_after(cls, starving: float) -> int:
+        """HUNT_RADIUS, widened by HUNT_RADIUS_GROWTH cells for every second without a kill."""
+        return cls.HUNT_RADIUS + int(max(0.0, starving) * cls.HUNT_RADIUS_GROWTH)
+
+    def find_prey(self, now: float) -> Optional[AquaticCreature]:
+        """The nearest prey within the hunt radius that no other shark has claimed this tick."""
+        claims = self.bowl.prey_claims
+        return self.bowl.prey_index.nearest(self.x, self.y, max_distance=self.hunt_radius(now),
+                                            accept=lambda prey: prey.uid not in claims)
+
+    def strike(self, prey: AquaticCreature, now: float) -> None:
+        """Eats prey on or next to the shark, taking its place."""
+        x, y = prey.x, prey.y
+        self.bowl.remove_creature(prey)
+        self.x, self.y = x, y
+        self.hunger += 1
+        self.last_kill_time = now
+        self.bowl.log_activity(f"🦈 {self.name} ate {prey.name}!")
+
+    def patrol(self) -> None:
+        """Nothing in range: cruise a cell in a random free direction and look again next tick."""
+        moves = [(self.x + dx, self.y + dy) for dx, dy in ((1, 0), (-1, 0), (0, 1), (0, -1))]
+        moves = [(x, y) for x, y in moves if (x, y) not in self.bowl.occupancy
+                 and 1 <= x < self.bowl.width - 2 and 1 <= y < self.bowl.height - 2]
+        if moves:
+            self.x, self.y = self.bowl.rng.choice(moves)
 
     @property
-    def closest_food(self):
-        return min(
-            [c for c in self.bowl.creatures if not isinstance(c, Shark)],
-            key=lambda c: abs(self.x - c.x) + abs(self.y - c.y),
-            default=None
-        )
+    def food_index(self) -> "SpatialHash":
+        """Sharks hunt other creatures rather than cookies."""
+        return self.bowl.prey_index
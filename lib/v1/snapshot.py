@@ -0,0 +1,231 @@
+"""
+Compact binary snapshots of a tank.
+
+Layout (little-endian), each section straight after the one before it:
+
+    header        HEADER
+    species       u32 string id per species, in the order creature records refer to them
+    string table  u32 offset per string plus one end offset, then the UTF-8 bytes of every string
+    creatures     CREATURE records
+    cookies       COOKIE records
+    activity log  u32 string id per entry
+
+Names, emoji, sexes and genders are stored once in the string table and referenced by id, so a
+tank full of "Fish_123_Jr" costs four bytes per creature for the name. Reading maps the file and
+unpacks records in place rather than parsing text.
+"""
+import mmap
+import struct
+from typing import Dict, Iterator, List, Optional
+
+MAGIC = b"FTNK"
+VERSION = 1
+
+HEADER = struct.Struct("<4sHHIIIIIII")  # magic, version, reserved, width, height, species, strings, creatures, cookies, log
+U32 = struct.Struct("<I")
+
+# species, flags, name, emoji, sex, x, y, food, eaten, offspring, aux int, aux string,
+# birth time, last food removed, last reproduction time, aux time
+CREATURE = struct.Struct("<HBxIIIiiiiiiIdddd")
+COOKIE = struct.Struct("<diii")  # created, x, y, eaten count
+
+NO_STRING = 0xFFFFFFFF
+RARE_FLAG = 0x01
+
+# Species-specific state shares the aux columns. No species has more than one value of each kind.
+AUX_INT_KEYS = ("circle_index", "hunger")
+AUX_STRING_KEYS = ("gender",)
+AUX_TIME_KEYS = ("last_kill_time",)
+
+
+class SnapshotError(ValueError):
+    """Raised when a file isn't a snapshot this version can read."""
+
+
+def is_snapshot(path: str) -> bool:
+    """Checks the magic bytes, so loading doesn't depend on the file extension."""
+    try:
+        with open(path, "rb") as file:
+            return file.read(len(MAGIC)) == MAGIC
+    except OSError:
+        return False
+
+
+class _StringTable:
+    def __init__(self) -> None:
+        self.strings: List[str] = []
+        self._ids: Dict[str, int] = {}
+
+    def id(self, value: Optional[str]) -> int:
+        if value is None:
+            return NO_STRING
+        string_id = self._ids.get(value)
+        if string_id is None:
+            string_id = self._ids[value] = len(self.strings)
+            self.strings.append(value)
+        return string_id
+
+    def pack(self) -> bytes:
+        encoded = [s.encode("utf-8") for s in self.strings]
+        offsets = [0]
+        for blob in encoded:
+            offsets.append(offsets[-1] + len(blob))
+        return struct.pack(f"<{len(offsets)}I", *offsets) + b"".join(encoded)
+
+
+def _first(data: dict, keys: tuple, default):
+    for key in keys:
+        if key in data:
+            return data[key]
+    return default
+
+
+def pack(data: dict) -> bytes:
+    """Packs a tank in Bowl.to_dict() form into snapshot bytes."""
+    strings = _StringTable()
+    species_ids: Dict[str, int] = {}
+    creature_blobs = []
+
+    for creature in data["creatures"]:
+        species = species_ids.setdefault(creature["type"], len(species_ids))
+        creature_blobs.append(CREATURE.pack(
+            species,
+            RARE_FLAG if creature["rare"] else 0,
+            strings.id(creature["name"]),
+            strings.id(creature["emoji"]),
+            strings.id(creature.get("sex")),
+            creature["x"],
+            creature["y"],
+            creature.get("current_food_count", 0),
+            creature.get("eaten_since_last_reproduction", 0),
+            creature.get("offspring_count", 0),
+            _first(creature, AUX_INT_KEYS, 0),
+            strings.id(_first(creature, AUX_STRING_KEYS, None)),
+            creature.get("birth_time", 0.0),
+            creature.get("last_food_removed", 0.0),
+            creature.get("last_reproduction_time", 0.0),
+            _first(creature, AUX_TIME_KEYS, 0.0),
+        ))
+
+    cookie_blobs = [
+        COOKIE.pack(cookie["created"], cookie["x"], cookie["y"], cookie["eaten_count"]) for cookie in data["cookies"]
+    ]
+    log_ids = [strings.id(entry) for entry in data["activity_log"]]
+    species_names = [strings.id(name) for name in species_ids]
+
+    header = HEADER.pack(MAGIC, VERSION, 0, data["width"], data["height"], len(species_names),
+                         len(strings.strings), len(creature_blobs), len(cookie_blobs), len(log_ids))
+    return b"".join([
+        header,
+        struct.pack(f"<{len(species_names)}I", *species_names),
+        strings.pack(),
+        *creature_blobs,
+        *cookie_blobs,
+        struct.pack(f"<{len(log_ids)}I", *log_ids),
+    ])
+
+
+def write(data: dict, path: str) -> None:
+    with open(path, "wb") as file:
+        file.write(pack(data))
+
+
+class Snapshot:
+    """Read-only view over snapshot bytes. Records are unpacked on demand."""
+
+    def __init__(self, buffer) -> None:
+        self._buffer = memoryview(buffer)
+        if len(self._buffer) < HEADER.size:
+            raise SnapshotError("File is too short to be a tank snapshot")
+        (magic, version, _, self.width, self.height, species_count, string_count,
+         self.creature_count, self.cookie_count, log_count) = HEADER.unpack_from(self._buffer, 0)
+        if magic != MAGIC:
+            raise SnapshotError("Not a tank snapshot")
+        if version != VERSION:
+            raise SnapshotError(f"Unsupported snapshot version {version}")
+
+        offset = HEADER.size
+        species_string_ids = struct.unpack_from(f"<{species_count}I", self._buffer, offset)
+        offset += 4 * species_count
+
+        string_offsets = struct.unpack_from(f"<{string_count + 1}I", self._buffer, offset)
+        offset += 4 * (string_count + 1)
+        blob = self._buffer[offset:offset + string_offsets[-1]]
+        self.strings = [
+            str(blob[start:end], "utf-8") for start, end in zip(string_offsets, string_offsets[1:])
+        ]
+        offset += string_offsets[-1]
+
+        self.species = [self.strings[string_id] for string_id in species_string_ids]
+
+        self._creatures_at = offset
+        offset += CREATURE.size * self.creature_count
+        self._cookies_at = offset
+        offset += COOKIE.size * self.cookie_count
+        log_ids = struct.unpack_from(f"<{log_count}I", self._buffer, offset)
+        self.activity_log = [self.strings[string_id] for string_id in log_ids]
+
+    def _string(self, string_id: int) -> Optional[str]:
+        return None if string_id == NO_STRING else self.strings[string_id]
+
+    def creature_records(self) -> Iterator[tuple]:
+        """Raw CREATURE tuples, straight out of the buffer."""
+        end = self._creatures_at + CREATURE.size * self.creature_count
+        return CREATURE.iter_unpack(self._buffer[self._creatures_at:end])
+
+    def creatures(self) -> Iterator[dict]:
+        """Creatures in the same form AquaticCreature.to_dict() produces."""
+        for (species, flags, name, emoji, sex, x, y, food, eaten, offspring, aux_int, aux_string,
+             birth_time, last_food_removed, last_reproduction_time, aux_time) in self.creature_records():
+            creature = {
+                "type": self.species[species],
+                "name": self.strings[name],
+                "x": x,
+                "y": y,
+                "emoji": self.strings[emoji],
+                "rare": bool(flags & RARE_FLAG),
+                "birth_time": birth_time,
+                "last_food_removed": last_food_removed,
+                "current_food_count": food,
+                "eaten_since_last_reproduction": eaten,
+                "last_reproduction_time": last_reproduction_time,
+                "offspring_count": offspring,
+                "sex": self._string(sex),
+            }
+            # ✅ Species that don't use an aux column ignore the extra keys when restoring
+            for key in AUX_INT_KEYS:
+                creature[key] = aux_int
+            for key in AUX_TIME_KEYS:
+                creature[key] = aux_time
+            if aux_string != NO_STRING:
+                for key in AUX_STRING_KEYS:
+                    creature[key] = self.strings[aux_string]
+            yield creature
+
+    def cookies(self) -> Iterator[dict]:
+        end = self._cookies_at + COOKIE.size * self.cookie_count
+        for created, x, y, eaten_count in COOKIE.iter_unpack(self._buffer[self._cookies_at:end]):
+            yield {"created": created, "x": x, "y": y, "eaten_count": eaten_count}
+
+    def to_dict(self) -> dict:
+        """The whole tank in Bowl.to_dict() form."""
+        return {
+            "width": self.width,
+            "height": self.height,
+            "creatures": list(self.creatures()),
+            "cookies": list(self.cookies()),
+            "activity_log": self.activity_log,
+        }
+
+    def release(self) -> None:
+        self._buffer.release()
+
+
+def read(path: str) -> dict:
+    """Maps a snapshot file and returns the tank in Bowl.to_dict() form."""
+    with open(path, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        snapshot = Snapshot(mapped)
+        try:
+            return snapshot.to_dict()
+        finally:
+            snapshot.release()
@@ -0,0 +1,180 @@
+from typing import Callable, Dict, Generic, Hashable, Iterable, Iterator, Optional, Tuple, TypeVar
+
+T = TypeVar("T", bound=Hashable)
+Bucket = Tuple[int, int]
+
+
+class SpatialHash(Generic[T]):
+    """
+    Bucket grid for nearest-neighbour lookups by Manhattan distance.
+
+    Items are kept in insertion order so ties resolve the same way a min() over a list would.
+    """
+
+    def __init__(self, bucket_size: int = 8) -> None:
+        self.bucket_size = bucket_size
+        self.version = 0  # Bumped on every change so callers can cache query results
+        self._buckets: Dict[Bucket, Dict[T, None]] = {}
+        self._positions: Dict[T, Tuple[int, int]] = {}
+        self._order: Dict[T, int] = {}
+        self._next_order = 0
+        self._bounds: Optional[Tuple[int, int, int, int]] = None  # Bucket extent, only grows until clear()
+
+    def _bucket(self, x: int, y: int) -> Bucket:
+        return x // self.bucket_size, y // self.bucket_size
+
+    def _add_to_bucket(self, item: T, bucket_key: Bucket) -> None:
+        self._buckets.setdefault(bucket_key, {})[item] = None
+        bx, by = bucket_key
+        if self._bounds is None:
+            self._bounds = (bx, by, bx, by)
+        else:
+            min_bx, min_by, max_bx, max_by = self._bounds
+            self._bounds = (min(min_bx, bx), min(min_by, by), max(max_bx, bx), max(max_by, by))
+
+    def insert(self, item: T, x: int, y: int) -> None:
+        if item in self._positions:
+            self.move(item, x, y)
+            return
+        self._positions[item] = (x, y)
+        self._order[item] = self._next_order
+        self._next_order += 1
+        self._add_to_bucket(item, self._bucket(x, y))
+        self.version += 1
+
+    def remove(self, item: T) -> None:
+        position = self._positions.pop(item, None)
+        if position is None:
+            return
+        del self._order[item]
+        bucket_key = self._bucket(*position)
+        bucket = self._buckets[bucket_key]
+        del bucket[item]
+        if not bucket:
+            del self._buckets[bucket_key]
+        self.version += 1
+
+    def move(self, item: T, x: int, y: int) -> None:
+        old = self._positions.get(item)
+        if old is None or old == (x, y):
+            return
+        old_key, new_key = self._bucket(*old), self._bucket(x, y)
+        if old_key != new_key:
+            bucket = self._buckets[old_key]
+            del bucket[item]
+            if not bucket:
+                del self._buckets[old_key]
+            self._add_to_bucket(item, new_key)
+        self._positions[item] = (x, y)
+        self.version += 1
+
+    def rebuild(self, items: Iterable[Tuple[T, int, int]]) -> None:
+        """Replaces the whole index, e.g. once per tick after everything has moved."""
+        self.clear()
+        for item, x, y in items:
+            self.insert(item, x, y)
+
+    def clear(self) -> None:
+        self._buckets.clear()
+        self._positions.clear()
+        self._order.clear()
+        self._bounds = None
+        self.version += 1
+
+    def position(self, item: T) -> Optional[Tuple[int, int]]:
+        return self._positions.get(item)
+
+    def __contains__(self, item: T) -> bool:
+        return item in self._positions
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self._positions)
+
+    def at(self, x: int, y: int) -> Optional[T]:
+        """Returns the earliest inserted item sitting exactly on (x, y)."""
+        best = None
+        for item in self._buckets.get(self._bucket(x, y), ()):
+            if self._positions[item] == (x, y) and (best is None or self._order[item] < self._order[best]):
+                best = item
+        return best
+
+    def _ring(self, center: Bucket, radius: int) -> Iterator[Bucket]:
+        cx, cy = center
+        if radius == 0:
+            yield center
+            return
+        for bx in range(cx - radius, cx + radius + 1):
+            yield bx, cy - radius
+            yield bx, cy + radius
+        for by in range(cy - radius + 1, cy + radius):
+            yield cx - radius, by
+            yield cx + radius, by
+
+    def _max_ring(self, center: Bucket) -> int:
+        """The furthest ring (in buckets) that can still contain anything."""
+        cx, cy = center
+        min_bx, min_by, max_bx, max_by = self._bounds
+        return max(abs(min_bx - cx), abs(max_bx - cx), abs(min_by - cy), abs(max_by - cy))
+
+    def nearest(self, x: int, y: int, max_distance: Optional[int] = None,
+                accept: Optional[Callable[[T], bool]] = None) -> Optional[T]:
+        """Finds the closest item by Manhattan distance, optionally within max_distance."""
+        if not self._buckets:
+            return None
+
+        center = self._bucket(x, y)
+        last_ring = self._max_ring(center)
+        if max_distance is not None:
+            last_ring = min(last_ring, max_distance // self.bucket_size + 1)
+
+        best, best_key = None, None
+        buckets_visited = 0
+        for radius in range(last_ring + 1):
+            # ✅ Anything in this ring or further out is at least this far away
+            if best_key is not None and best_key[0] <= (radius - 1) * self.bucket_size:
+                break
+            # ✅ Sparse index (e.g. a few cookies in a big tank)? Checking every item is cheaper than more rings
+            buckets_visited += 8 * radius or 1
+            if buckets_visited > len(self._positions):
+                return self._nearest_of(x, y, self._positions, max_distance, accept)
+            for bucket_key in self._ring(center, radius):
+                bucket = self._buckets.get(bucket_key)
+                if bucket:
+                    best, best_key = self._nearest_in(x, y, bucket, max_distance, accept, best, best_key)
+        return best
+
+    def _nearest_in(self, x: int, y: int, items: Iterable[T], max_distance: Optional[int],
+                    accept: Optional[Callable[[T], bool]], best: Optional[T],
+                    best_key: Optional[Tuple[int, int]]) -> Tuple[Optional[T], Optional[Tuple[int, int]]]:
+        """Folds items into the running best (item, (distance, order)) pair."""
+        positions, order = self._positions, self._order
+        for item in items:
+            item_x, item_y = positions[item]
+            distance = abs(x - item_x) + abs(y - item_y)
+            if max_distance is not None and distance > max_distance:
+                continue
+            key = (distance, order[item])
+            if best_key is not None and key >= best_key:
+                continue
+            if accept is not None and not accept(item):
+                continue
+            best, best_key = item, key
+        return best, best_key
+
+    def _nearest_of(self, x: int, y: int, items: Iterable[T], max_distance: Optional[int],
+                    accept: Optional[Callable[[T], bool]]) -> Optional[T]:
+        return self._nearest_in(x, y, items, max_distance, accept, None, None)[0]
+
+    def within(self, x: int, y: int, radius: int) -> Iterator[T]:
+        """Yields every item within a Manhattan radius of (x, y)."""
+        min_bx, min_by = self._bucket(x - radius, y - radius)
+        max_bx, max_by = self._bucket(x + radius, y + radius)
+        for bx in range(min_bx, max_bx + 1):
+            for by in range(min_by, max_by + 1):
+                for item in self._buckets.get((bx, by), ()):
+                    item_x, item_y = self._positions[item]
+                    if abs(x - item_x) + abs(y - item_y) <= radius:
+                        yield item
@@ -0,0 +1,118 @@
+import sys
+from functools import lru_cache
+from typing import List, Optional, TextIO, Tuple
+
+from .glyphs import cluster_width, split_graphemes
+
+Frame = List[List[str]]  # Rows of cells. A wide glyph fills its first cell, the cells it covers hold ''
+
+CSI = "\033["
+HIDE_CURSOR = CSI + "?25l"
+SHOW_CURSOR = CSI + "?25h"
+CLEAR_SCREEN = CSI + "2J"
+CLEAR_TO_END_OF_LINE = CSI + "K"
+CLEAR_LINE = CSI + "2K"
+
+
+@lru_cache(maxsize=4096)
+def text_to_cells(text: str) -> Tuple[str, ...]:
+    """Splits text into terminal cells, one entry per column it occupies."""
+    cells: List[str] = []
+    for cluster in split_graphemes(text):
+        width = cluster_width(cluster)
+        if width <= 0:
+            continue
+        cells.append(cluster)
+        cells.extend([""] * (width - 1))
+    return tuple(cells)
+
+
+def frame_to_text(frame: Frame) -> str:
+    """Flattens a frame back into a printable string."""
+    return "\n".join("".join(row) for row in frame)
+
+
+def move_cursor(row: int, col: int) -> str:
+    """Escape sequence to move the cursor to a zero-based (row, col)."""
+    return f"{CSI}{row + 1};{col + 1}H"
+
+
+class TerminalRenderer:
+    """
+    Double-buffered terminal output.
+
+    Each frame is compared against the one on screen and only the cells that changed are
+    written, in a single write, so an unchanged frame costs nothing but the comparison.
+    """
+
+    MERGE_GAP = 4  # Unchanged cells to rewrite rather than emitting another cursor move
+
+    def __init__(self, stream: Optional[TextIO] = None) -> None:
+        self.stream = stream or sys.stdout
+        self._previous: Optional[Frame] = None
+
+    def draw(self, frame: Frame) -> int:
+        """Brings the terminal up to date with frame. Returns the number of characters written."""
+        output = self.diff(frame)
+        self.write(output)
+        return len(output)
+
+    def diff(self, frame: Frame) -> str:
+        """The output that turns the last frame diffed into this one. Whatever it returns must be written."""
+        if self._previous is None:
+            parts = [HIDE_CURSOR, CLEAR_SCREEN]
+            for row_index, row in enumerate(frame):
+                parts.append(move_cursor(row_index, 0))
+                parts.append("".join(row))
+        else:
+            parts = []
+            for row_index, row in enumerate(frame):
+                previous_row = self._previous[row_index] if row_index < len(self._previous) else []
+                if row != previous_row:
+                    self._diff_row(parts, row_index, previous_row, row)
+            for row_index in range(len(frame), len(self._previous)):
+                parts.append(move_cursor(row_index, 0) + CLEAR_LINE)
+
+        self._previous = [list(row) for row in frame]
+        return "".join(parts)
+
+    def write(self, output: str) -> None:
+        """Writes output from diff(). Safe to call from another thread while the next frame is built."""
+        if output:
+            self.stream.write(output)
+            self.stream.flush()
+
+    def _diff_row(self, parts: List[str], row_index: int, old: List[str], new: List[str]) -> None:
+        """Appends the escape sequences needed to turn old into new."""
+        runs: List[List[int]] = []
+        shared = min(len(old), len(new))
+        for col in range(len(new)):
+            if col < shared and old[col] == new[col]:
+                continue
+            if runs and col - runs[-1][1] <= self.MERGE_GAP:
+                runs[-1][1] = col + 1
+            else:
+                runs.append([col, col + 1])
+
+        for start, end in runs:
+            # ✅ Never start writing halfway through a wide glyph
+            while start > 0 and new[start] == "":
+                start -= 1
+            # ✅ Finish any wide glyph the run ends inside of
+            while end < len(new) and new[end] == "":
+                end += 1
+            parts.append(move_cursor(row_index, start))
+            parts.append("".join(new[start:end]))
+
+        if len(new) < len(old):
+            parts.append(move_cursor(row_index, len(new)) + CLEAR_TO_END_OF_LINE)
+
+    def invalidate(self) -> None:
+        """Forces the next draw to repaint the whole screen."""
+        self._previous = None
+
+    def close(self) -> None:
+        """Restores the cursor and leaves it below the last frame."""
+        rows = len(self._previous) if self._previous else 0
+        self.stream.write(move_cursor(rows, 0) + SHOW_CURSOR)
+        self.stream.flush()
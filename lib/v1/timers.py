@@ -0,0 +1,57 @@
+import heapq
+import itertools
+from typing import Callable, List, Tuple
+
+# A deadline computed as start + duration can round to a hair after the moment start + duration is
+# reached, so timers are handed over this much early and each callback checks its own condition.
+SLACK = 1e-6
+
+
+class Timer:
+    __slots__ = ('deadline', 'callback', 'cancelled')
+
+    def __init__(self, deadline: float, callback: Callable[[float], None]) -> None:
+        self.deadline = deadline
+        self.callback = callback
+        self.cancelled = False
+
+    def cancel(self) -> None:
+        self.cancelled = True  # ✅ Left in the heap and skipped when it comes up, rather than searched for
+
+
+class TimerQueue:
+    """
+    Deadlines in a heap, so checking for due timers costs nothing when none are due.
+
+    Callbacks get the current time and decide for themselves whether their condition holds; one
+    that isn't quite due yet (see SLACK) schedules itself again.
+    """
+
+    def __init__(self) -> None:
+        self._heap: List[Tuple[float, int, Timer]] = []
+        self._sequence = itertools.count()  # Breaks ties between equal deadlines in the order they were set
+
+    def schedule(self, deadline: float, callback: Callable[[float], None]) -> Timer:
+        timer = Timer(deadline, callback)
+        heapq.heappush(self._heap, (deadline, next(self._sequence), timer))
+        return timer
+
+    def run_due(self, now: float) -> int:
+        """Runs every live timer due by now, earliest first. Returns how many ran."""
+        heap = self._heap
+        ran = 0
+        # ✅ Collected first, so a callback rescheduling itself for the same deadline waits for the next call
+        due = []
+        while heap and heap[0][0] <= now + SLACK:
+            due.append(heapq.heappop(heap)[2])
+        for timer in due:
+            if not timer.cancelled:
+                timer.callback(now)
+                ran += 1
+        return ran
+
+    def clear(self) -> None:
+        self._heap.clear()
+
+    def __len__(self) -> int:
+        return len(self._heap)
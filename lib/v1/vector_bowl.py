@@ -0,0 +1,613 @@
+import time
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .aquatic_creature import AquaticCreature, species_compatible
+from .bowl import AVAILABLE_CREATURES, Bowl
+from .clock import Clock
+from .crab import Crab
+from .flowfield import UNSEEN, WALL
+from .fish import Fish
+from .jellyfish import Jellyfish
+from .mermaid import Mermaid
+from .merman import Merman
+from .merperson import Merperson
+from .shark import Shark
+from .shrimp import Shrimp
+from .terminal import Frame
+
+SPECIES: Tuple[type, ...] = tuple(AVAILABLE_CREATURES)
+
+# Moves in the order AquaticCreature.move_toward prefers them when they are equally good: right, left, down, up
+STEPS = np.array([(1, 0), (-1, 0), (0, 1), (0, -1)], dtype=np.int32)
+SIDEWAYS = STEPS[:2]  # What crabs can do along the bottom
+STAY, NO_WAY = -1, -2  # What _field_steps says when there's no step to take
+SHRIMP_CIRCLE = np.array([(1, 0), (0, 1), (-1, 0), (0, -1)], dtype=np.int32)  # Right → Down → Left → Up
+
+NEAREST_CHUNK = 4096  # Rows of the creature × cookie distance matrix computed at once
+
+
+class CreatureArrays:
+    """Struct-of-arrays storage for creature state. Slots are kept dense with swap-remove."""
+
+    FIELDS: Dict[str, type] = {
+        'x': np.int32,
+        'y': np.int32,
+        'species': np.int16,
+        'width': np.int16,
+        'food': np.int32,
+        'eaten': np.int32,
+        'offspring': np.int32,
+        'circle': np.int8,
+        'hunger': np.int32,
+        'uid': np.int64,
+        'birth_time': np.float64,
+        'last_food_removed': np.float64,
+        'last_reproduction_time': np.float64,
+        'last_kill_time': np.float64,
+    }
+
+    def __init__(self, capacity: int = 64) -> None:
+        self.count = 0
+        self._capacity = capacity
+        self._data: Dict[str, np.ndarray] = {name: np.zeros(capacity, dtype=dtype) for name, dtype in
+                                             self.FIELDS.items()}
+
+    def __getattr__(self, name: str) -> np.ndarray:
+        """The live portion of a field, e.g. arrays.x."""
+        data = self.__dict__.get('_data')
+        if data is None or name not in data:
+            raise AttributeError(name)
+        return data[name][:self.count]
+
+    def __setattr__(self, name: str, value) -> None:
+        if name in self.FIELDS:
+            # ✅ Lets `arrays.x += step` write through instead of shadowing the field
+            self._data[name][:self.count] = value
+        else:
+            super().__setattr__(name, value)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def append(self, values: Dict[str, float]) -> int:
+        if self.count == self._capacity:
+            self._capacity *= 2
+            for name, array in self._data.items():
+                grown = np.zeros(self._capacity, dtype=array.dtype)
+                grown[:self.count] = array[:self.count]
+                self._data[name] = grown
+        slot = self.count
+        for name, array in self._data.items():
+            array[slot] = values.get(name, 0)
+        self.count += 1
+        return slot
+
+    def swap_remove(self, slot: int) -> Optional[int]:
+        """Frees a slot by moving the last record into it. Returns the slot that moved, if any."""
+        last = self.count - 1
+        moved = None
+        if slot != last:
+            for array in self._data.values():
+                array[slot] = array[last]
+            moved = last
+        self.count -= 1
+        return moved
+
+
+class VectorBowl(Bowl):
+    """
+    A Bowl that simulates every creature at once with NumPy instead of calling update() per creature.
+
+    Positions, food, breeding counters and timers live in CreatureArrays. The creature objects in
+    self.creatures are only views for rendering and saving; refresh_views() copies the arrays into them.
+
+    Movement is resolved for everyone at once rather than one creature after another, so when two
+    creatures want the same cell the one added to the tank first gets it.
+    """
+
+    def __init__(self, width: int, height: int, save_file: str, clock: Clock | None = None,
+                 seed: int | None = None) -> None:
+        super().__init__(width=width, height=height, save_file=save_file, clock=clock, seed=seed)
+        self.arrays = CreatureArrays()
+        self._objects: List[AquaticCreature] = []  # Slot → creature view
+        self.np_rng = np.random.default_rng(self.rng.getrandbits(64))
+
+        self._species_code = {species: code for code, species in enumerate(SPECIES)}
+        self._remove_food_every = np.array([s.REMOVE_FOOD_EVERY for s in SPECIES], dtype=np.float64)
+        self._full_at = np.array([s.FULL_AT_FOOD_COUNT for s in SPECIES], dtype=np.int32)
+        self._threshold = np.array([s.REPRODUCTION_THRESHOLD for s in SPECIES], dtype=np.int32)
+        self._cooldown = np.array([s.REPRODUCTION_COOLDOWN for s in SPECIES], dtype=np.float64)
+        self._compatible = np.array([[species_compatible(a, b) for b in SPECIES] for a in SPECIES], dtype=bool)
+
+        def codes(*bases: type) -> np.ndarray:
+            return np.array([code for code, s in enumerate(SPECIES) if issubclass(s, bases)], dtype=np.int16)
+
+        self._codes = {
+            'shark': codes(Shark),
+            'crab': codes(Crab),
+            'fish': codes(Fish),
+            'jellyfish': codes(Jellyfish),
+            'merperson': codes(Merperson),
+            'merman': codes(Merman),
+            'mermaid': codes(Mermaid),
+            'shrimp': codes(Shrimp),
+        }
+
+    # -- Storage ------------------------------------------------------------------------------------
+
+    def add_creature(self, creature: AquaticCreature) -> None:
+        """Copies a creature into the arrays and keeps the object as its view."""
+        creature.uid = self._next_uid
+        self._next_uid += 1
+        creature.slot = self.arrays.append({
+            'x': creature.x,
+            'y': creature.y,
+            'species': self._species_code[type(creature)],
+            'width': creature.width,
+            'food': creature.current_food_count,
+            'eaten': creature.eaten_since_last_reproduction,
+            'offspring': creature.offspring_count,
+            'circle': getattr(creature, 'circle_index', 0),
+            'hunger': getattr(creature, 'hunger', 0),
+            'uid': creature.uid,
+            'birth_time': creature.birth_time,
+            'last_food_removed': creature.last_food_removed,
+            'last_reproduction_time': creature.last_reproduction_time,
+            'last_kill_time': getattr(creature, 'last_kill_time', 0),
+        })
+        self._objects.append(creature)
+        self.creatures.add(creature)
+        self.population.add(creature)
+        if self.journal is not None:
+            self.journal.record("spawn", uid=creature.uid, creature=creature.to_dict())
+
+    def remove_creature(self, creature: AquaticCreature) -> None:
+        self._free_slot(creature.slot)
+        self.creatures.remove(creature)
+        self.population.remove(creature)
+        self.record_event("death", uid=creature.uid)
+
+    def _free_slot(self, slot: int) -> None:
+        moved = self.arrays.swap_remove(slot)
+        last = self._objects.pop()
+        if moved is not None:
+            self._objects[slot] = last
+            last.slot = slot
+
+    def refresh_views(self) -> None:
+        """Copies the arrays back onto the creature objects."""
+        a = self.arrays
+        columns = zip(a.x.tolist(), a.y.tolist(), a.food.tolist(), a.eaten.tolist(), a.offspring.tolist(),
+                      a.circle.tolist(), a.hunger.tolist(), a.last_food_removed.tolist(),
+                      a.last_reproduction_time.tolist(), a.last_kill_time.tolist())
+        for creature, (x, y, food, eaten, offspring, circle, hunger, food_removed, reproduced, killed) in zip(
+                self._objects, columns):
+            creature._x, creature._y = x, y
+            creature._current_food_count = food
+            creature._eaten_since_last_reproduction = eaten
+            creature._offspring_count = offspring
+            creature.last_food_removed = food_removed
+            creature.last_reproduction_time = reproduced
+            if isinstance(creature, Shrimp):
+                creature.circle_index = circle
+            elif isinstance(creature, Shark):
+                creature.hunger = hunger
+                creature.last_kill_time = killed
+        # ✅ Food and offspring changed in the arrays without going through the creatures, so count again
+        self.population.recount(self.creatures)
+
+    def render_frame(self) -> Frame:
+        self.refresh_views()
+        return super().render_frame()
+
+    def is_occupied(self, x: int, y: int) -> bool:
+        a = self.arrays
+        return bool(np.any((a.x == x) & (a.y == y)))
+
+    def get_occupied_positions(self) -> set:
+        return set(zip(self.arrays.x.tolist(), self.arrays.y.tolist()))
+
+    # -- Simulation ---------------------------------------------------------------------------------
+
+    def update(self) -> None:
+        """Advances every creature by one tick in a handful of array passes."""
+        tick_start = time.perf_counter()
+        profiler = self.profiler
+
+        now = self.clock.now()
+        with profiler.phase("update.cookies"):
+            for cookie in self.cookies:
+                cookie.update()
+            self.cookie_timers.run_due(now)
+
+        # ✅ Creatures are updated a pass at a time rather than a species at a time
+        if self.arrays.count:
+            with profiler.phase("update.creatures.hunt"):
+                self._hunt(now)
+            with profiler.phase("update.creatures.swim"):
+                self._swim()
+            with profiler.phase("update.creatures.eat"):
+                self._decay_hunger(now)
+                self._eat()
+
+        with profiler.phase("update.reproduction"):
+            self.handle_reproduction()
+
+        if profiler.enabled:
+            profiler.tick_done(time.perf_counter() - tick_start, population=len(self.creatures),
+                               cookies=len(self.cookies))
+
+    def _mask(self, kind: str) -> np.ndarray:
+        return np.isin(self.arrays.species, self._codes[kind])
+
+    def _cell_keys(self, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+        """Packs cells into single integers so they can be compared in bulk."""
+        return y.astype(np.int64) * (self.width + 16) + (x.astype(np.int64) + 8)
+
+    def _nearest(self, x: np.ndarray, y: np.ndarray, target_x: np.ndarray, target_y: np.ndarray) -> np.ndarray:
+        """Index of the closest target for each point by Manhattan distance, first one on ties."""
+        nearest = np.empty(len(x), dtype=np.int64)
+        for start in range(0, len(x), NEAREST_CHUNK):
+            stop = start + NEAREST_CHUNK
+            distance = (np.abs(x[start:stop, None] - target_x[None, :])
+                        + np.abs(y[start:stop, None] - target_y[None, :]))
+            nearest[start:stop] = np.argmin(distance, axis=1)
+        return nearest
+
+    def _try_moves(self, movers: np.ndarray, new_x: np.ndarray, new_y: np.ndarray, occupied: np.ndarray) -> np.ndarray:
+        """
+        Moves as many movers as possible into free cells; returns which of them moved.
+
+        A move is refused if the cell is taken, or if an earlier creature is moving into it this pass.
+        """
+        a = self.arrays
+        keys = self._cell_keys(new_x, new_y)
+        free = ~np.isin(keys, occupied)
+        moved = np.zeros(len(movers), dtype=bool)
+        candidates = np.nonzero(free)[0]
+        if len(candidates):
+            _, first = np.unique(keys[candidates], return_index=True)
+            winners = candidates[first]
+            moved[winners] = True
+            slots = movers[winners]
+            a.x[slots] = new_x[winners]
+            a.y[slots] = new_y[winners]
+        return moved
+
+    def _occupied_keys(self) -> np.ndarray:
+        return self._cell_keys(self.arrays.x, self.arrays.y)
+
+    def _step_toward(self, movers: np.ndarray, target_x: np.ndarray, target_y: np.ndarray,
+                     max_x: int, max_y: int) -> None:
+        """Greedy one-cell step toward a target: horizontal first, then vertical if that is blocked."""
+        a = self.arrays
+        x, y = a.x[movers], a.y[movers]
+        step_x = np.sign(target_x - x).astype(np.int32)
+        step_y = np.sign(target_y - y).astype(np.int32)
+
+        horizontal = step_x != 0
+        first_x = np.where(horizontal, x + step_x, x)
+        first_y = np.where(horizontal, y, y + step_y)
+        wants = (first_x != x) | (first_y != y)
+        in_bounds = (1 <= first_x) & (first_x < max_x) & (1 <= first_y) & (first_y < max_y)
+
+        attempt = wants & in_bounds
+        moved = np.zeros(len(movers), dtype=bool)
+        moved[attempt] = self._try_moves(movers[attempt], first_x[attempt], first_y[attempt], self._occupied_keys())
+
+        # ✅ Blocked going sideways? Try closing the vertical gap instead
+        retry = ~moved & horizontal & (step_y != 0)
+        second_y = y + step_y
+        retry &= (1 <= x) & (x < max_x) & (1 <= second_y) & (second_y < max_y)
+        if np.any(retry):
+            self._try_moves(movers[retry], x[retry], second_y[retry], self._occupied_keys())
+
+    def _food_distances(self, cookie_x: np.ndarray, cookie_y: np.ndarray) -> np.ndarray:
+        """The same distances FlowField.build works out, a whole level of the search at a time."""
+        a = self.arrays
+        width, height = self.width, self.height
+        grid = np.full((height, width), WALL, dtype=np.int64)
+        grid[1:height - 1, 1:width - 2] = UNSEEN
+        distances = grid.ravel()
+
+        on_grid = (0 <= a.x) & (a.x < width) & (0 <= a.y) & (a.y < height)
+        blocked = a.y[on_grid].astype(np.int64) * width + a.x[on_grid]
+        distances[blocked[distances[blocked] == UNSEEN]] = WALL
+
+        # ✅ Food is reachable even with a creature on it
+        inside = (1 <= cookie_x) & (cookie_x < width - 2) & (1 <= cookie_y) & (cookie_y <= height - 2)
+        frontier = np.unique(cookie_y[inside].astype(np.int64) * width + cookie_x[inside])
+        distances[frontier] = 0
+        offsets = np.array([1, -1, width, -width], dtype=np.int64)
+        claims = np.empty(len(distances), dtype=np.int64)
+        steps = 0
+        while len(frontier):
+            steps += 1
+            around = (frontier[:, None] + offsets[None, :]).ravel()
+            reached = around[distances[around] == UNSEEN]
+            # ✅ Drop cells reached twice without sorting: only the last write to each claim survives
+            order = np.arange(len(reached))
+            claims[reached] = order
+            frontier = reached[claims[reached] == order]
+            distances[frontier] = steps
+        return distances
+
+    def _field_steps(self, distances: np.ndarray, movers: np.ndarray, steps: np.ndarray, below_y: int) -> np.ndarray:
+        """
+        For each mover, the index into steps that gets nearest food by the food field, STAY if none gets
+        any nearer, or NO_WAY if the field has no way from there. FlowField.step for everyone at once.
+        """
+        a = self.arrays
+        width = self.width
+        x, y = a.x[movers].astype(np.int64), a.y[movers].astype(np.int64)
+        inside = (0 < x) & (x < width - 1) & (0 < y) & (y < self.height - 1)
+        index = np.where(inside, y * width + x, 0)
+        unreachable = np.iinfo(np.int64).max // 2
+
+        # ✅ A creature's own cell was a wall when the field was built; it is one step past its best neighbour
+        around = distances[index[:, None] + (STEPS[:, 0] + STEPS[:, 1] * width)[None, :]]
+        best_around = np.where(around >= 0, around, unreachable).min(axis=1)
+        own = distances[index]
+        here = np.where(own >= 0, own, best_around + 1)
+        known = inside & ((own >= 0) | (best_around < unreachable))
+
+        candidate = distances[index[:, None] + (steps[:, 0] + steps[:, 1] * width)[None, :]]
+        usable = (candidate >= 0) & (candidate < here[:, None]) & (y[:, None] + steps[None, :, 1] < below_y)
+        best = np.where(usable, candidate, unreachable).argmin(axis=1)  # ✅ First of equals, in steps' order
+        choice = np.where(usable[np.arange(len(movers)), best], best, STAY)
+        return np.where(known, choice, NO_WAY)
+
+    def _take_steps(self, movers: np.ndarray, choice: np.ndarray, steps: np.ndarray) -> None:
+        """Moves each mover that has a step by the step it chose, if the cell is still free."""
+        moving = choice >= 0
+        if np.any(moving):
+            a = self.arrays
+            step = steps[choice[moving]]
+            self._try_moves(movers[moving], a.x[movers[moving]] + step[:, 0], a.y[movers[moving]] + step[:, 1],
+                            self._occupied_keys())
+
+    def _wander(self, movers: np.ndarray, steps: np.ndarray, max_x: int, max_y: int) -> None:
+        """Random one-cell steps into free cells, like AquaticCreature.swim when there's no food."""
+        a = self.arrays
+        new_x = a.x[movers] + steps[:, 0]
+        new_y = a.y[movers] + steps[:, 1]
+        in_bounds = (1 <= new_x) & (new_x < max_x - 1) & (1 <= new_y) & (new_y < max_y - 1)
+        if np.any(in_bounds):
+            self._try_moves(movers[in_bounds], new_x[in_bounds], new_y[in_bounds], self._occupied_keys())
+
+    def _hunt(self, now: float) -> None:
+        """
+        Sharks go after the nearest unclaimed prey within their hunt radius, as Shark.update does.
+        There are only ever a few, so they are handled one by one.
+        """
+        a = self.arrays
+        sharks = np.nonzero(self._mask('shark'))[0]
+        if not len(sharks) or a.count <= Shark.MIN_POPULATION:
+            return
+
+        unclaimed = ~self._mask('shark')  # ✅ Each prey is chased by one shark at most
+        victims = []
+        for shark in sharks.tolist():
+            prey = np.nonzero(unclaimed)[0]
+            distance = np.abs(a.x[prey] - a.x[shark]) + np.abs(a.y[prey] - a.y[shark])
+            radius = Shark.radius_after(now - max(float(a.last_kill_time[shark]), float(a.birth_time[shark])))
+            in_range = np.nonzero(distance <= radius)[0]
+            if not len(in_range):
+                # ✅ Nothing in range: cruise a cell in a random free direction
+                self._wander(np.array([shark]), STEPS[self.np_rng.integers(0, 4, 1)], self.width - 2, self.height - 2)
+            else:
+                nearest = in_range[np.argmin(distance[in_range])]
+                target = int(prey[nearest])
+                unclaimed[target] = False
+                if distance[nearest] <= 1 and now - a.last_kill_time[shark] >= Shark.KILL_COOLDOWN:
+                    victims.append(target)
+                    a.x[shark], a.y[shark] = a.x[target], a.y[target]
+                    a.hunger[shark] += 1
+                    a.last_kill_time[shark] = now
+                    self.log_activity(f"🦈 {self._objects[shark].name} ate {self._objects[target].name}!")
+                else:
+                    self._step_toward(np.array([shark]), a.x[target:target + 1], a.y[target:target + 1],
+                                      self.width - 2, self.height - 2)
+
+            # ✅ Keep sharks inside!
+            a.x[shark] = max(1, min(int(a.x[shark]), self.width - int(a.width[shark]) - 2))
+            a.y[shark] = max(1, min(int(a.y[shark]), self.height - 2))
+
+        # ✅ Free the highest slots first so swap-remove doesn't move a victim we still need
+        for slot in sorted(victims, reverse=True):
+            self.remove_creature(self._objects[slot])
+
+    def _swim(self) -> None:
+        a = self.arrays
+        max_x, max_y = self.width - 2, self.height - 2
+        n = a.count
+        sharks = self._mask('shark')
+        crabs = self._mask('crab')
+        swimmers = ~sharks & ~crabs
+
+        has_food = len(self.cookies) > 0
+        if has_food:
+            cookie_x = np.array([c.x for c in self.cookies], dtype=np.int32)
+            cookie_y = np.array([c.y for c in self.cookies], dtype=np.int32)
+            distances = self._food_distances(cookie_x, cookie_y)
+            hungry = a.food < self._full_at[a.species]
+        else:
+            hungry = np.zeros(n, dtype=bool)
+
+        # ✅ Everyone not full heads for the nearest cookie along the food field
+        seekers = np.nonzero(swimmers & hungry)[0]
+        if len(seekers):
+            choice = self._field_steps(distances, seekers, STEPS, max_y)
+            self._take_steps(seekers, choice, STEPS)
+            lost = choice == NO_WAY
+            if np.any(lost):
+                # No way through on the field; close in on the nearest cookie as the crow flies
+                target = self._nearest(a.x[seekers[lost]], a.y[seekers[lost]], cookie_x, cookie_y)
+                self._step_toward(seekers[lost], cookie_x[target], cookie_y[target], max_x, max_y)
+
+        # ✅ Everyone else takes a random step
+        wanderers = np.nonzero(swimmers & ~hungry)[0]
+        if len(wanderers):
+            self._wander(wanderers, STEPS[self.np_rng.integers(0, 4, len(wanderers))], max_x, max_y)
+
+        # ✅ Crabs shuffle sideways along the bottom
+        crab_slots = np.nonzero(crabs)[0]
+        if len(crab_slots):
+            if has_food:
+                choice = self._field_steps(distances, crab_slots, SIDEWAYS, self.height)
+                step = np.where(choice >= 0, SIDEWAYS[np.maximum(choice, 0), 0], 0).astype(np.int32)
+                lost = choice == NO_WAY
+                if np.any(lost):
+                    target = self._nearest(a.x[crab_slots[lost]], a.y[crab_slots[lost]], cookie_x, cookie_y)
+                    step[lost] = np.sign(cookie_x[target] - a.x[crab_slots[lost]])
+            else:
+                step = self.np_rng.choice(np.array([-1, 1], dtype=np.int32), len(crab_slots))
+                new_x = a.x[crab_slots] + step
+                step = np.where((1 <= new_x) & (new_x < max_x - 1), step, 0)
+            moving = step != 0
+            if np.any(moving):
+                self._try_moves(crab_slots[moving], a.x[crab_slots][moving] + step[moving],
+                                a.y[crab_slots][moving], self._occupied_keys())
+            a.y[crab_slots] = self.height - 2  # ✅ Lock crabs to bottom!
+
+        self._drift(max_x, max_y)
+
+    def _random_signs(self, mask: np.ndarray, chance: float) -> np.ndarray:
+        """-1/+1 for creatures in mask that pass a chance roll, 0 for everyone else."""
+        n = self.arrays.count
+        roll = mask & (self.np_rng.random(n) < chance)
+        return np.where(roll, self.np_rng.choice(np.array([-1, 1], dtype=np.int32), n), 0).astype(np.int32)
+
+    def _clamp(self, mask: np.ndarray, max_x: int, max_y: int) -> None:
+        a = self.arrays
+        a.x[mask] = np.clip(a.x[mask], 0, max_x - a.width[mask])
+        a.y[mask] = np.clip(a.y[mask], 1, max_y - 2)
+
+    def _drift(self, max_x: int, max_y: int) -> None:
+        """The species-specific wobbles each swim() adds on top of the base movement."""
+        a = self.arrays
+        n = a.count
+
+        fish = self._mask('fish')
+        wobble = fish & (self.np_rng.random(n) < 0.2)
+        a.x += np.where(wobble, self.np_rng.integers(-1, 2, n), 0).astype(np.int32)
+        a.y += np.where(wobble, self.np_rng.integers(-1, 2, n), 0).astype(np.int32)
+
+        jellyfish = self._mask('jellyfish')
+        a.y += self._random_signs(jellyfish, 0.3)
+        a.x += self._random_signs(jellyfish, 0.1)
+        self._clamp(jellyfish, max_x, max_y)
+
+        merperson = self._mask('merperson')
+        up = merperson & (self.np_rng.random(n) < 0.1)
+        down = merperson & ~up & (self.np_rng.random(n) < 0.2)
+        a.y -= up.astype(np.int32)
+        a.y += down.astype(np.int32)
+        self._clamp(merperson, max_x, max_y)
+
+        merman = self._mask('merman')
+        a.x += self._random_signs(merman, 0.5)
+        self._clamp(merman, max_x, max_y)
+
+        mermaid = self._mask('mermaid')
+        a.x += self._random_signs(mermaid, 0.3)
+        a.y += self._random_signs(mermaid, 0.3)
+        self._clamp(mermaid, max_x, max_y)
+
+        shrimp = np.nonzero(self._mask('shrimp'))[0]
+        if len(shrimp):
+            step = SHRIMP_CIRCLE[a.circle[shrimp]]
+            new_x, new_y = a.x[shrimp] + step[:, 0], a.y[shrimp] + step[:, 1]
+            a.circle[shrimp] = (a.circle[shrimp] + 1) % len(SHRIMP_CIRCLE)
+            inside = (1 <= new_x) & (new_x < max_x - 1) & (1 <= new_y) & (new_y < max_y - 1)
+            a.x[shrimp[inside]] = new_x[inside]
+            a.y[shrimp[inside]] = new_y[inside]
+
+    def _decay_hunger(self, now: float) -> None:
+        a = self.arrays
+        digest = (now > a.last_food_removed + self._remove_food_every[a.species]) & (a.food > 0)
+        a.food[digest] -= 1
+        a.last_food_removed[digest] = now
+
+    def _eat(self) -> None:
+        if not self.cookies:
+            return
+        a = self.arrays
+        cookie_keys: Dict[int, object] = {}
+        for cookie in self.cookies:
+            cookie_keys.setdefault(int(self._cell_keys(np.int64(cookie.x), np.int64(cookie.y))), cookie)
+
+        keys = self._cell_keys(a.x, a.y)
+        eaters = np.nonzero(np.isin(keys, np.fromiter(cookie_keys, dtype=np.int64)) & ~self._mask('shark'))[0]
+        if not len(eaters):
+            return
+        a.food[eaters] += 1
+        a.eaten[eaters] += 1
+        for slot, key in zip(eaters.tolist(), keys[eaters].tolist()):
+            creature = self._objects[slot]
+            self.log_activity(f"{creature.emoji} {creature.name} ate food!")
+            self.record_event("feed", uid=creature.uid, current_food_count=int(a.food[slot]),
+                              eaten_since_last_reproduction=int(a.eaten[slot]))
+            cookie = cookie_keys[key]
+            if cookie in self.cookies:
+                cookie.eat()
+
+    def handle_reproduction(self) -> None:
+        """Pairs up eligible creatures straight from the arrays, in the order they joined the tank."""
+        a = self.arrays
+        if not a.count:
+            return
+        now = self.clock.now()
+        species = a.species
+        ready = np.nonzero((a.eaten >= self._threshold[species])
+                           & (now - a.last_reproduction_time > self._cooldown[species]))[0]
+        if len(ready) < 2:
+            return
+        ready = ready[np.argsort(a.uid[ready], kind='stable')].tolist()
+
+        occupied = set(zip(a.x.tolist(), a.y.tolist()))
+        paired = set()
+        babies = []
+        for slot in ready:
+            if slot in paired:
+                continue
+            partner = next((other for other in ready if other != slot and other not in paired
+                            and self._compatible[species[slot], species[other]]), None)
+            if partner is None:
+                continue
+            paired.update((slot, partner))
+            parent, other = self._objects[slot], self._objects[partner]
+
+            mid_x = (int(a.x[slot]) + int(a.x[partner])) // 2
+            mid_y = (int(a.y[slot]) + int(a.y[partner])) // 2
+            open_spaces = [
+                (mid_x + dx, mid_y + dy) for dx in [-1, 0, 1] for dy in [-1, 0, 1]
+                if (mid_x + dx, mid_y + dy) not in occupied
+                and 1 <= mid_x + dx < self.width - 2 and 1 <= mid_y + dy < self.height - 2
+            ]
+            baby_x, baby_y = self.rng.choice(open_spaces) if open_spaces else (mid_x, mid_y)
+
+            if isinstance(parent, Merperson):
+                offspring_type = self.rng.choice([parent.__class__, other.__class__])
+                baby_name = f"{offspring_type.__name__}_Jr"
+            else:
+                offspring_type = parent.__class__
+                baby_name = f"{parent.name}_Jr"
+            babies.append(offspring_type.create_offspring(baby_name, self, baby_x, baby_y))
+
+            for breeder in (slot, partner):
+                a.last_reproduction_time[breeder] = now
+                a.eaten[breeder] = 0
+                a.offspring[breeder] += 1
+            self.record_event("birth", parents=[{
+                "uid": self._objects[breeder].uid,
+                "last_reproduction_time": now,
+                "eaten_since_last_reproduction": 0,
+                "offspring_count": int(a.offspring[breeder]),
+            } for breeder in (slot, partner)])
+            self.log_activity(f"{parent.emoji} {parent.name} had a baby: {babies[-1].name}!")
+
+        for baby in babies:
+            self.add_creature(baby)
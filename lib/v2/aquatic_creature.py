@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Optional, Tuple
 import pygame
 # from lib.v2.fish_tank import FishTank
 import random
@@ -8,6 +8,8 @@ from enum import Enum
 
 from pygame import Vector2
 
+from lib.v2.motion import MotionField
+
 
 class Sexes(Enum):
     MALE = "Male"
@@ -15,15 +17,25 @@ class Sexes(Enum):
 
 
 class AquaticCreature:
+    # ✅ Kept in the tank's motion arrays once added, which FishTank steps for every creature at once
+    x = MotionField('x')
+    y = MotionField('y')
+    prev_x = MotionField('prev_x')
+    prev_y = MotionField('prev_y')
+    dx = MotionField('dx')
+    dy = MotionField('dy')
+
     def __init__(self, tank: "FishTank", name: str, x: Optional[int] = None, y: Optional[int] = None,
                  mass: float = 1.0):
         self.tank = tank
         self.name = name
+        self.slot: Optional[int] = None  # ✅ Row in the tank's motion arrays while in the tank
 
         self._sex = None
 
         self.x = x if x is not None else random.randint(0, tank.width)
         self.y = y if y is not None else random.randint(0, tank.height)
+        self.prev_x, self.prev_y = self.x, self.y  # ✅ Position one step ago, for drawing between steps
 
         self.speed = random.uniform(0.5, 2.0)  # Random movement speed
         self.dx, self.dy = self.random_velocity()
@@ -33,12 +45,10 @@ class AquaticCreature:
         angle = random.uniform(0, 2 * 3.14159)  # Random angle in radians
         return self.speed * pygame.math.Vector2(1, 0).rotate_rad(angle)
 
-    def update(self):
-        pass
-
-    def render(self):
-        """Render the creature (to be overridden by subclasses)."""
-        pass
+    def interpolated_position(self, alpha: float) -> Tuple[float, float]:
+        """Where the creature is alpha of the way from its previous step to its current one."""
+        return (self.prev_x + (self.x - self.prev_x) * alpha,
+                self.prev_y + (self.y - self.prev_y) * alpha)
 
     @property
     def sex(self):
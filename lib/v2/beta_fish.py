@@ -1,3 +1,5 @@
+import math
+from typing import Tuple
 from lib.v2.udlr_aquatic_creature import UDLRAquaticCreature
 from lib.v2.aquatic_creature import Sexes
 
@@ -25,11 +27,6 @@ class BetaFish(UDLRAquaticCreature):
 
         self.reload_animations()
 
-    def update(self):
+    def vertical_band(self) -> Tuple[float, float]:
         """Restrict movement to the top two-thirds of the tank."""
-        super().update()
-        max_height = self.tank.height * (2 / 3)
-
-        if self.y >= max_height:
-            self.y = max_height
-            self.dy = -abs(self.dy)  # Move upward if at the boundary
\ No newline at end of file
+        return -math.inf, self.tank.height * (2 / 3)
\ No newline at end of file
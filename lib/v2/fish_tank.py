@@ -1,59 +1,212 @@
+import os
+import numpy as np
 import pygame
 import random
+import time
+from typing import List, Optional, Tuple
+from ..profiler import Profiler
+from . import motion
+from .motion import DIRECTIONS, MotionArrays
+from .udlr_aquatic_creature import UDLRAquaticCreature
 from .beta_fish import BetaFish
 from .puffer_fish import PufferFish
 from .stingray import Stingray
 
+WATER_COLOR = (0, 0, 255)
+STEP_RATE = 60  # Simulation steps per second, whatever the frame rate. Creature speeds are per step.
+MAX_FRAME_MS = 250  # Longest frame we catch up on, so a stall doesn't snowball into more steps
+HUD_REFRESH_SECONDS = 0.5  # Text is slow to render, so the profiler HUD is only redrawn this often
+HUD_COLOR = (255, 255, 255)
+
+
 class FishTank:
-    def __init__(self, width: int, height: int, fps: int):
+    def __init__(self, width: int, height: int, fps: int, per_species: int = 3, headless: bool = False):
+        if headless:
+            os.environ["SDL_VIDEODRIVER"] = "dummy"  # ✅ No display needed, e.g. on CI
         pygame.init()
         self.width = width
         self.height = height
         self.fps = fps
+        self.step_ms = 1000 / STEP_RATE  # ✅ Every update() advances the simulation by exactly this much
+        self.per_species = per_species
         self.screen = pygame.display.set_mode((self.width, self.height))
         pygame.display.set_caption("Fish Tank Simulator")
         self.clock = pygame.time.Clock()
         self.running = True
 
+        # ✅ Drawn once and copied back over wherever a creature was last frame
+        self.background = pygame.Surface((self.width, self.height)).convert()
+        self.background.fill(WATER_COLOR)
+        self._drawn_rects: List[pygame.Rect] = []
+        self._full_redraw = True
+
+        self.profiler = Profiler(enabled=False)  # ✅ Times each phase of a frame when enabled
+        self.show_hud = False  # Draw the profiler's numbers in the corner of the window
+        self._hud: Optional[pygame.Surface] = None
+        self._hud_drawn_at = 0.0
+
+        # ✅ Motion lives in NumPy arrays and is stepped for every creature at once. Creature objects are views
+        # whose x, y, direction and so on read and write their slot.
+        self.motion = MotionArrays()
+        self.rng = np.random.default_rng(random.getrandbits(64))
+        self._objects: List[UDLRAquaticCreature] = []  # Slot → creature
+        self._frames: List[Tuple[Tuple[pygame.Surface, ...], ...]] = []  # Slot → frames for each direction code
+
         self.creatures = []  # List to hold all aquatic creatures
         self.initialize_creatures()
 
     def initialize_creatures(self):
         """Populates the fish tank with creatures."""
-        for i in range(3):
-            self.creatures.append(
+        for i in range(self.per_species):
+            self.add_creature(
                 BetaFish(self, f"Betta {i}", x=random.randint(0, self.width), y=random.randint(0, self.height)))
 
-        for i in range(3):
-            self.creatures.append(
+        for i in range(self.per_species):
+            self.add_creature(
                 PufferFish(self, f"Puffer {i}", x=random.randint(0, self.width), y=random.randint(0, self.height)))
 
-        for i in range(3):
-            self.creatures.append(
+        for i in range(self.per_species):
+            self.add_creature(
                 Stingray(self, f"Puffer {i}", x=random.randint(0, self.width), y=random.randint(0, self.height)))
 
+    def add_creature(self, creature: UDLRAquaticCreature) -> None:
+        """Copies a creature into the motion arrays and keeps the object as its view."""
+        band_min, band_max = creature.vertical_band()
+        creature.slot = self.motion.append({
+            'x': creature.x,
+            'y': creature.y,
+            'prev_x': creature.prev_x,
+            'prev_y': creature.prev_y,
+            'dx': creature.dx,
+            'dy': creature.dy,
+            'width': creature.frame_size[0],
+            'height': creature.frame_size[1],
+            'band_min': band_min,
+            'band_max': band_max,
+            'direction': DIRECTIONS.index(creature.direction),
+            'frame': creature.frame_index,
+            'timer': creature.animation_timer,
+            'speed': creature.animation_speed,
+            'variant_chance': creature.VARIANT_TOGGLE_CHANCE,
+        })
+        self._objects.append(creature)
+        self._frames.append(())
+        self.animations_changed(creature)
+        self.creatures.append(creature)
+
+    def animations_changed(self, creature: UDLRAquaticCreature) -> None:
+        """Picks up a creature's new animation frames, e.g. after a puffer fish inflates."""
+        frames = self._frames[creature.slot] = tuple(creature.animations[direction] for direction in DIRECTIONS)
+        self.motion.set(creature.slot, {f'frames_{direction}': len(direction_frames)
+                                        for direction, direction_frames in zip(DIRECTIONS, frames)})
+
     def run(self):
+        """Steps the simulation at a fixed rate and renders as often as --fps allows, blending between steps."""
+        accumulator = 0.0
+        profiler = self.profiler
+        self.clock.tick()
         while self.running:
-            self.handle_events()
-            self.update()
-            self.render()
-            self.clock.tick(self.fps)
+            frame_start = time.perf_counter()
+            with profiler.phase("events"):
+                self.handle_events()
+
+            accumulator += min(self.clock.get_time(), MAX_FRAME_MS)
+            with profiler.phase("update"):
+                while accumulator >= self.step_ms:
+                    self.update()
+                    profiler.count("steps")
+                    accumulator -= self.step_ms
+
+            with profiler.phase("render"):
+                self.render(accumulator / self.step_ms)
+            with profiler.phase("clock wait"):
+                self.clock.tick(self.fps)
+
+            if profiler.enabled:
+                profiler.tick_done(time.perf_counter() - frame_start, population=len(self.creatures))
 
         pygame.quit()
 
+    def run_headless(self, steps: int) -> float:
+        """Runs the simulation for a number of steps with no rendering. Returns the wall-clock seconds it took."""
+        profiler = self.profiler
+        start = time.perf_counter()
+        for _ in range(steps):
+            step_start = time.perf_counter()
+            with profiler.phase("update"):
+                self.update()
+            if profiler.enabled:
+                profiler.count("steps")
+                profiler.tick_done(time.perf_counter() - step_start, population=len(self.creatures))
+        elapsed = time.perf_counter() - start
+        pygame.quit()
+        return elapsed
+
     def handle_events(self):
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 self.running = False
+            elif event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                self._full_redraw = True  # The window system lost what we drew
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                self.toggle_hud()
+
+    def toggle_hud(self) -> None:
+        """Shows or hides the profiler HUD, turning the profiler on the first time it is shown."""
+        self.show_hud = not self.show_hud
+        self.profiler.enabled = True
 
     def update(self):
-        """Update game state."""
-        for creature in self.creatures:
-            creature.update()
-
-    def render(self):
-        """Render everything to the screen."""
-        self.screen.fill((0, 0, 255))  # Blue background for water
-        for creature in self.creatures:
-            creature.render()
-        pygame.display.flip()
+        """Advance the simulation by one fixed step."""
+        a = self.motion
+        motion.step(a, self.width, self.height, self.step_ms)
+
+        # ✅ Only the few creatures that switch looks this step go back to Python
+        toggled = np.nonzero(self.rng.random(a.count) < a.variant_chance)[0]
+        for slot in toggled.tolist():
+            self._objects[slot].toggle_variant()
+
+    def render(self, alpha: float = 1.0):
+        """
+        Render everything to the screen, pushing only the parts that changed.
+
+        :param alpha: How far between the last two simulation steps to draw creatures, from 0 to 1.
+        """
+        a = self.motion
+        xs = (a.prev_x + (a.x - a.prev_x) * alpha).tolist()
+        ys = (a.prev_y + (a.y - a.prev_y) * alpha).tolist()
+        sprites = [
+            (frames[direction][frame], (x, y))
+            for frames, direction, frame, x, y in zip(self._frames, a.direction.tolist(), a.frame.tolist(), xs, ys)
+        ]
+        if self.show_hud:
+            sprites.append((self._hud_surface(), (8, 8)))  # ✅ Drawn last, so it sits on top of the creatures
+
+        if self._full_redraw:
+            self.screen.blit(self.background, (0, 0))
+            self._drawn_rects = self.screen.blits(sprites)
+            pygame.display.flip()
+            self._full_redraw = False
+            return
+
+        # ✅ Erase last frame's sprites and draw this frame's in a single batched call
+        erase = [(self.background, rect, rect) for rect in self._drawn_rects]
+        drawn = self.screen.blits(erase + sprites)[len(erase):]
+
+        pygame.display.update(self._drawn_rects + drawn)
+        self._drawn_rects = drawn
+
+    def _hud_surface(self) -> pygame.Surface:
+        """The profiler's overlay as text, re-rendered at most every HUD_REFRESH_SECONDS."""
+        now = time.monotonic()
+        if self._hud is None or now - self._hud_drawn_at >= HUD_REFRESH_SECONDS:
+            font = pygame.font.Font(None, 18)
+            lines = [font.render(line, True, HUD_COLOR) for line in self.profiler.overlay_lines()]
+            self._hud = pygame.Surface((max(line.get_width() for line in lines),
+                                        sum(line.get_height() for line in lines)), pygame.SRCALPHA)
+            y = 0
+            for line in lines:
+                self._hud.blit(line, (0, y))
+                y += line.get_height()
+            self._hud_drawn_at = now
+        return self._hud
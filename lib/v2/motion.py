@@ -0,0 +1,163 @@
+from typing import Any, Callable, Dict, Optional
+
+import numpy as np
+
+# Direction codes, in the order frame counts are stored
+DIRECTIONS = ("down", "left", "right", "up")
+DOWN, LEFT, RIGHT, UP = range(len(DIRECTIONS))
+
+
+class MotionArrays:
+    """Struct-of-arrays storage for v2 creature motion, one slot per creature."""
+
+    FIELDS: Dict[str, type] = {
+        'x': np.float64,
+        'y': np.float64,
+        'prev_x': np.float64,
+        'prev_y': np.float64,
+        'dx': np.float64,
+        'dy': np.float64,
+        'width': np.int32,  # Sprite size
+        'height': np.int32,
+        'band_min': np.float64,  # Vertical band the species keeps to
+        'band_max': np.float64,
+        'direction': np.int8,
+        'frame': np.int16,
+        'timer': np.float64,  # Animation timer, in milliseconds
+        'speed': np.float64,  # Milliseconds per animation frame
+        'frames_down': np.int16,  # Frames in each direction's animation
+        'frames_left': np.int16,
+        'frames_right': np.int16,
+        'frames_up': np.int16,
+        'variant_chance': np.float64,  # Chance per step of the creature switching looks
+    }
+
+    def __init__(self, capacity: int = 64) -> None:
+        self.count = 0
+        self._capacity = capacity
+        self._data: Dict[str, np.ndarray] = {name: np.zeros(capacity, dtype=dtype) for name, dtype in
+                                             self.FIELDS.items()}
+
+    def __getattr__(self, name: str) -> np.ndarray:
+        """The live portion of a field, e.g. arrays.x."""
+        data = self.__dict__.get('_data')
+        if data is None or name not in data:
+            raise AttributeError(name)
+        return data[name][:self.count]
+
+    def __setattr__(self, name: str, value) -> None:
+        if name in self.FIELDS:
+            # ✅ Lets `arrays.x += arrays.dx` write through instead of shadowing the field
+            self._data[name][:self.count] = value
+        else:
+            super().__setattr__(name, value)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def get(self, slot: int, name: str):
+        """One record's value for a field, as a Python number."""
+        return self._data[name][slot].item()
+
+    def set(self, slot: int, values: Dict[str, float]) -> None:
+        """Overwrites some of one record's fields."""
+        for name, value in values.items():
+            self._data[name][slot] = value
+
+    def append(self, values: Dict[str, float]) -> int:
+        if self.count == self._capacity:
+            self._capacity *= 2
+            for name, array in self._data.items():
+                grown = np.zeros(self._capacity, dtype=array.dtype)
+                grown[:self.count] = array[:self.count]
+                self._data[name] = grown
+        slot = self.count
+        for name, array in self._data.items():
+            array[slot] = values.get(name, 0)
+        self.count += 1
+        return slot
+
+
+class MotionField:
+    """
+    A creature attribute that lives in its tank's motion arrays while it is in a tank, and on the object before.
+
+    Creatures are views: reading creature.x gives where step() last put it, and setting it moves the creature.
+    """
+
+    def __init__(self, field: str, to_array: Callable[[Any], float] = float,
+                 from_array: Callable[[float], Any] = float) -> None:
+        self.field = field
+        self.to_array = to_array
+        self.from_array = from_array
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = '_' + name  # Where the value is kept until the creature has a slot
+
+    def __get__(self, creature, owner: Optional[type] = None):
+        if creature is None:
+            return self
+        if creature.slot is None:
+            return creature.__dict__[self.name]
+        return self.from_array(creature.tank.motion.get(creature.slot, self.field))
+
+    def __set__(self, creature, value) -> None:
+        if creature.slot is None:
+            creature.__dict__[self.name] = value
+        else:
+            creature.tank.motion.set(creature.slot, {self.field: self.to_array(value)})
+
+
+def step(a: MotionArrays, tank_width: int, tank_height: int, step_ms: float) -> None:
+    """
+    Advances every creature by one fixed step. These are the only movement rules; creature objects just
+    read the results.
+
+    Moves, bounces off the tank walls, picks a facing direction, keeps to the species' vertical band
+    and advances the animation.
+    """
+    a.prev_x = a.x
+    a.prev_y = a.y
+    a.x += a.dx
+    a.y += a.dy
+
+    x, y, dx, dy = a.x, a.y, a.dx, a.dy
+
+    # ✅ Bounce off the walls
+    right_wall = tank_width - a.width
+    hit = x < 0
+    x[hit] = 0
+    dx[hit] = np.abs(dx[hit])
+    hit = ~hit & (x > right_wall)
+    x[hit] = right_wall[hit]
+    dx[hit] = -np.abs(dx[hit])
+
+    floor = tank_height - a.height
+    hit = y < 0
+    y[hit] = 0
+    dy[hit] = np.abs(dy[hit])
+    hit = ~hit & (y > floor)
+    y[hit] = floor[hit]
+    dy[hit] = -np.abs(dy[hit])
+
+    # ✅ Face the way we're mostly heading, before the band below can flip dy
+    a.direction = np.where(np.abs(dx) > np.abs(dy),
+                           np.where(dx > 0, RIGHT, LEFT),
+                           np.where(dy > 0, DOWN, UP))
+
+    # Keep to the species' band of the tank
+    band_min, band_max = a.band_min, a.band_max
+    hit = y >= band_max
+    y[hit] = band_max[hit]
+    dy[hit] = -np.abs(dy[hit])
+    hit = ~hit & (y <= band_min)
+    y[hit] = band_min[hit]
+    dy[hit] = np.abs(dy[hit])
+
+    # Advance the animation
+    timer = a.timer
+    timer += step_ms
+    due = timer >= a.speed
+    timer[due] = 0
+    frame_counts = np.choose(a.direction, (a.frames_down, a.frames_left, a.frames_right, a.frames_up))
+    a.frame[due] = (a.frame[due] + 1) % frame_counts[due]
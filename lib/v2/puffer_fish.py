@@ -10,6 +10,8 @@ class InflationState(Enum):
 
 
 class PufferFish(UDLRAquaticCreature):
+    VARIANT_TOGGLE_CHANCE = .01
+
     def __init__(self, tank: "FishTank", name: str, x: int = None, y: int = None):
         super().__init__(
             tank,
@@ -24,10 +26,8 @@ class PufferFish(UDLRAquaticCreature):
 
         self.inflation_state = random.choice([InflationState.INFLATED, InflationState.DEFLATED])
 
-    def update(self):
-        super().update()
-        if random.random() < .01:
-            self.toggle_inflation_state()
+    def toggle_variant(self):
+        self.toggle_inflation_state()
 
     def toggle_inflation_state(self):
         if self.inflation_state == InflationState.INFLATED:
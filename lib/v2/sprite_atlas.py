@@ -0,0 +1,66 @@
+import pygame
+from typing import Dict, Tuple
+
+Animations = Dict[str, Tuple[pygame.Surface, ...]]
+
+
+class SpriteAtlas:
+    """
+    Decodes each sprite sheet once and hands out the same frames to every creature that asks.
+
+    Frames are subsurfaces of the shared sheet, so they cost no pixel memory of their own.
+    Everything returned here is shared between creatures and must not be modified.
+    """
+
+    def __init__(self) -> None:
+        self._sheets: Dict[str, pygame.Surface] = {}
+        self._frames: Dict[tuple, Tuple[pygame.Surface, ...]] = {}
+        self._animations: Dict[tuple, Animations] = {}
+
+    def sheet(self, path: str) -> pygame.Surface:
+        """The decoded sheet at path. Needs the display to be set up, as convert_alpha() does."""
+        sheet = self._sheets.get(path)
+        if sheet is None:
+            sheet = self._sheets[path] = pygame.image.load(path).convert_alpha()
+        return sheet
+
+    def frame_size(self, path: str, grid_size: Tuple[int, int]) -> Tuple[int, int]:
+        sheet = self.sheet(path)
+        cols, rows = grid_size
+        return sheet.get_width() // cols, sheet.get_height() // rows
+
+    def frames(self, path: str, grid_size: Tuple[int, int], row: int, start_col: int,
+               frame_count: int) -> Tuple[pygame.Surface, ...]:
+        """frame_count frames from a row of the sheet, starting at start_col."""
+        key = (path, grid_size, row, start_col, frame_count)
+        frames = self._frames.get(key)
+        if frames is None:
+            sheet = self.sheet(path)
+            width, height = self.frame_size(path, grid_size)
+            frames = self._frames[key] = tuple(
+                sheet.subsurface(pygame.Rect((start_col + i) * width, row * height, width, height))
+                for i in range(frame_count)
+            )
+        return frames
+
+    def animations(self, path: str, grid_size: Tuple[int, int],
+                   animation_data: Dict[str, Tuple[int, int, int]]) -> Animations:
+        """Frames for each direction in animation_data, which maps directions to (row, start_col, frame_count)."""
+        key = (path, grid_size, tuple(animation_data.items()))
+        animations = self._animations.get(key)
+        if animations is None:
+            animations = self._animations[key] = {
+                direction: self.frames(path, grid_size, row, col, count)
+                for direction, (row, col, count) in animation_data.items()
+            }
+        return animations
+
+    def clear(self) -> None:
+        """Forgets every sheet, e.g. after the display has been recreated."""
+        self._sheets.clear()
+        self._frames.clear()
+        self._animations.clear()
+
+
+# ✅ One atlas for the whole process
+SPRITES = SpriteAtlas()
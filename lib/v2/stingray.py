@@ -1,3 +1,4 @@
+from typing import Tuple
 from lib.v2.udlr_aquatic_creature import UDLRAquaticCreature
 
 
@@ -17,15 +18,7 @@ class Stingray(UDLRAquaticCreature):
             },
         )
 
-    def update(self):
-        super().update()
+    def vertical_band(self) -> Tuple[float, float]:
         min_height = self.tank.height // 6 * 5  # Bottom sixth starts here
         max_height = self.tank.height  # Absolute bottom of the tank
-
-        if self.y >= max_height:
-            self.y = max_height
-            self.dy = -abs(self.dy)  # Move upward
-
-        elif self.y <= min_height:
-            self.y = min_height
-            self.dy = abs(self.dy)  # Move downward
+        return min_height, max_height
@@ -1,10 +1,17 @@
 import pygame
 from lib.v2.aquatic_creature import AquaticCreature
-from typing import Dict, List, Tuple
+from lib.v2.motion import DIRECTIONS, MotionField
+from lib.v2.sprite_atlas import SPRITES
+from typing import Dict, Tuple
 import math
 
 class UDLRAquaticCreature(AquaticCreature):
     FRAME_SEQUENCE = [0, 1, 2, 1]  # Cyclic animation pattern
+    VARIANT_TOGGLE_CHANCE = 0.0  # Chance per step of calling toggle_variant()
+
+    direction = MotionField('direction', to_array=DIRECTIONS.index, from_array=DIRECTIONS.__getitem__)
+    frame_index = MotionField('frame', from_array=int)
+    animation_timer = MotionField('timer')
 
     def __init__(
             self,
@@ -29,9 +36,11 @@ class UDLRAquaticCreature(AquaticCreature):
         """
         super().__init__(tank, name, x, y)
 
-        self.sprite_sheet = pygame.image.load(sprite_sheet_path).convert_alpha()
+        # ✅ Decoded once per process and shared by every creature using the same sheet
+        self.sprite_sheet_path = sprite_sheet_path
+        self.sprite_sheet = SPRITES.sheet(sprite_sheet_path)
         self.cols, self.rows = sprite_grid_size
-        self.frame_size = (self.sprite_sheet.get_width() // self.cols, self.sprite_sheet.get_height() // self.rows)
+        self.frame_size = SPRITES.frame_size(sprite_sheet_path, sprite_grid_size)
 
         self.animation_data = animation_data or {
             "down": (4, 0, 3),  # Row 5, starts at col 0, 3 frames
@@ -50,86 +59,22 @@ class UDLRAquaticCreature(AquaticCreature):
 
     def reload_animations(self):
         self.animations = self.load_animations()
+        if self.slot is not None:
+            self.tank.animations_changed(self)
 
-    def load_animations(self) -> Dict[str, List[pygame.Surface]]:
-        """Extracts animation frames from the sprite sheet based on (start_row, start_col, frame_count)."""
-        return {
-            direction: self.extract_frames(row, col, count)
-            for direction, (row, col, count) in self.animation_data.items()
-        }
-
-    def extract_frames(self, row: int, start_col: int, frame_count: int) -> List[pygame.Surface]:
-        """Extracts a variable number of frames from a given row in the sprite sheet."""
-        frames = []
-        for i in range(frame_count):
-            x, y = (start_col + i) * self.frame_size[0], row * self.frame_size[1]
-            frame = self.sprite_sheet.subsurface(pygame.Rect(x, y, *self.frame_size))
-            frames.append(frame)
-        return frames
-
-    def update(self):
-        """Handles movement and direction updates."""
-        self.x += self.dx
-        self.y += self.dy
-
-        creature_width, creature_height = self.frame_size
-
-        # Keep within horizontal bounds
-        if self.x < 0:
-            self.x = 0
-            self.dx = abs(self.dx)  # Move right
-
-        elif self.x > self.tank.width - creature_width:
-            self.x = self.tank.width - creature_width
-            self.dx = -abs(self.dx)  # Move left
-
-        # Keep within vertical bounds
-        if self.y < 0:
-            self.y = 0
-            self.dy = abs(self.dy)  # Move down
-
-        elif self.y > self.tank.height - creature_height:
-            self.y = self.tank.height - creature_height
-            self.dy = -abs(self.dy)  # Move up
-
-        self.update_direction()
-
-
-        # Handle animation timing
-        self.animation_timer += self.tank.clock.get_time()
-        if self.animation_timer >= self.animation_speed:
-            self.animation_timer = 0
-            self.frame_index = (self.frame_index + 1) % len(self.animations[self.direction])
-
-    def update_direction(self):
-        """Updates the facing direction based on movement."""
-        if abs(self.dx) > abs(self.dy):  # Prioritize horizontal movement
-            self.direction = "right" if self.dx > 0 else "left"
-        else:
-            self.direction = "down" if self.dy > 0 else "up"
-
-    def render(self):
-        """Draws the creature using the appropriate animation frame."""
-        current_frame = self.animations[self.direction][self.frame_index]
-        self.tank.screen.blit(current_frame, (self.x, self.y))
-
-    def apply_boundaries(self):
-        """Prevents the creature from leaving the fish tank."""
-        creature_width, creature_height = self.frame_size
+    def load_animations(self) -> Dict[str, Tuple[pygame.Surface, ...]]:
+        """Looks up animation frames from the sprite sheet based on (start_row, start_col, frame_count)."""
+        # ✅ Cached in the atlas, so switching between variants is a dictionary lookup
+        return SPRITES.animations(self.sprite_sheet_path, (self.cols, self.rows), self.animation_data)
 
-        # Left & right boundaries
-        if self.x < 0:
-            self.x = 0
-            self.dx = abs(self.dx)  # Move right
-        elif self.x > self.tank.width - creature_width:
-            self.x = self.tank.width - creature_width
-            self.dx = -abs(self.dx)  # Move left
+    def extract_frames(self, row: int, start_col: int, frame_count: int) -> Tuple[pygame.Surface, ...]:
+        """Looks up a variable number of frames from a given row in the sprite sheet."""
+        return SPRITES.frames(self.sprite_sheet_path, (self.cols, self.rows), row, start_col, frame_count)
 
-        # Top & bottom boundaries
-        if self.y < 0:
-            self.y = 0
-            self.dy = abs(self.dy)  # Move down
-        elif self.y > self.tank.height - creature_height:
-            self.y = self.tank.height - creature_height
-            self.dy = -abs(self.dy)  # Move up
+    def vertical_band(self) -> Tuple[float, float]:
+        """The (top, bottom) of the band of the tank this creature keeps to. The whole tank by default."""
+        return -math.inf, math.inf
 
+    def toggle_variant(self):
+        """Switches to another look, for species that have one."""
+        pass
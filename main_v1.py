@@ -1,44 +1,72 @@
-import time
+import argparse
+import asyncio
+import os
+from lib.v1.autosave import Autosaver
 from lib.v1.bowl import Bowl
-import keyboard
+from lib.v1.keys import KeyReader
+from lib.v1.recording import Recorder
+from lib.v1.runtime import BowlRuntime
+from lib.v1.terminal import TerminalRenderer
 
-def main() -> None:
-    tank_width = 73
-    tank_height = 30
-    bowl = Bowl(width=tank_width, height=tank_height, save_file="tank_states/tank_state_v1.json")
+LEGACY_SAVE_FILE = "tank_states/tank_state_v1.json"
 
-    # ✅ Load saved state if it exists
-    bowl.load_state()
+def parse_args():
+    parser = argparse.ArgumentParser(description="Run the terminal fish bowl.")
+    parser.add_argument("--tick-rate", type=float, default=1 / 0.3, help="Simulation ticks per second")
+    parser.add_argument("--fps", type=float, default=10.0,
+                        help="Most frames drawn per second; frames are dropped if the terminal can't keep up")
+    parser.add_argument("--record", help="Record the session here, to replay later with replay_v1.py")
+    parser.add_argument("--seed", type=int, help="Seed for the recorded session (default: a random one)")
+    parser.add_argument("--profile", action="store_true",
+                        help="Time each phase of a tick and show the numbers under the activity log (o toggles)")
+    parser.add_argument("--metrics", help="Append a JSON line of profiler metrics to this file every --metrics-interval")
+    parser.add_argument("--metrics-interval", type=float, default=10.0, help="Seconds between metrics lines")
+    return parser.parse_args()
 
-    try:
-        while True:
-            # ✅ Check if there's a key event (non-blocking)
-            if keyboard.is_pressed("p"):
-                bowl.toggle_pause()
-                time.sleep(0.3)  # Prevent repeat keypresses
 
-            if keyboard.is_pressed("s"):
-                bowl.spawn_creature()
-                time.sleep(0.3)  # Prevent repeat keypresses
+def main() -> None:
+    args = parse_args()
+    tank_width = 73
+    tank_height = 30
+    bowl = Bowl(width=tank_width, height=tank_height, save_file="tank_states/tank_state_v1.tank")
+    renderer = TerminalRenderer()
+    if args.profile or args.metrics:
+        bowl.profiler.enabled = True
+        bowl.show_profiler = args.profile
+    if args.metrics:
+        bowl.profiler.dump_to(args.metrics, args.metrics_interval)
 
-            if keyboard.is_pressed("k"):
-                bowl.kill_random_creature()
-                time.sleep(0.3)  # Prevent repeat keypresses
+    # ✅ Load saved state if it exists, picking up tanks saved before snapshots existed
+    if not os.path.exists(bowl.save_file) and os.path.exists(LEGACY_SAVE_FILE):
+        bowl.load_state(LEGACY_SAVE_FILE)
+    else:
+        bowl.load_state()
 
-            if keyboard.is_pressed("f"):
-                bowl.drop_food()
-                time.sleep(0.3)  # Prevent repeat keypresses
+    # ✅ Saves in the background, with a journal of what happened in between, so a crash loses at most a second
+    autosaver = Autosaver(bowl)
+    autosaver.start()
 
-            if not bowl.paused:
-                print(bowl.render())
-                bowl.update()
+    recorder = None
+    if args.record:
+        recorder = Recorder(bowl, args.record, tick_seconds=1 / args.tick_rate, seed=args.seed)
 
-            time.sleep(0.3)
-            print("\033c", end="")  # Clear screen for animation
+    # ✅ Ticks, frames, keys and saves each run at their own pace, so a slow terminal never holds up the tank
+    try:
+        with KeyReader() as keys:
+            runtime = BowlRuntime(bowl, renderer, keys, autosaver, tick_rate=args.tick_rate, fps=args.fps,
+                                  recorder=recorder)
+            asyncio.run(runtime.run())
 
     except KeyboardInterrupt:
+        renderer.close()
+        if recorder is not None:
+            recorder.close()
+            print(f"\n🎞 Recorded {recorder.ticks} ticks to {args.record}")
         print("\nExiting... Saving state.")
-        bowl.save_state()
+        autosaver.stop()
+        print("💾 Tank state saved!")
+    finally:
+        bowl.profiler.close()  # ✅ Flushes the last metrics line and closes --metrics
 
 
 if __name__ == "__main__":
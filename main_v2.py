@@ -1,4 +1,5 @@
 import argparse
+import random
 from lib.v2.fish_tank import FishTank
 from lib.v2.beta_fish import BetaFish
 
@@ -6,13 +7,40 @@ def parse_args():
     parser = argparse.ArgumentParser(description="Run the FishTank simulation.")
     parser.add_argument("--width", type=int, default=800, help="Width of the fish tank window")
     parser.add_argument("--height", type=int, default=600, help="Height of the fish tank window")
-    parser.add_argument("--fps", type=int, default=60, help="Frames per second")
+    parser.add_argument("--fps", type=int, default=60, help="Frames per second (the simulation always steps 60 times a second)")
+    parser.add_argument("--per-species", type=int, default=3, help="Number of creatures of each species")
+    parser.add_argument("--headless", action="store_true",
+                        help="Run the simulation with no display and report how fast it steps")
+    parser.add_argument("--steps", type=int, default=10_000, help="Number of simulation steps to run with --headless")
+    parser.add_argument("--seed", type=int, help="Seed for the random number generator")
+    parser.add_argument("--profile", action="store_true",
+                        help="Time each phase of a frame and show the numbers in the corner (F3 toggles)")
+    parser.add_argument("--metrics", help="Append a JSON line of profiler metrics to this file every --metrics-interval")
+    parser.add_argument("--metrics-interval", type=float, default=10.0, help="Seconds between metrics lines")
     return parser.parse_args()
 
 def main():
     args = parse_args()
-    fish_tank = FishTank(width=args.width, height=args.height, fps=args.fps)
-    fish_tank.run()
+    if args.seed is not None:
+        random.seed(args.seed)
+    fish_tank = FishTank(width=args.width, height=args.height, fps=args.fps, per_species=args.per_species,
+                         headless=args.headless)
+    if args.profile or args.metrics:
+        fish_tank.profiler.enabled = True
+        fish_tank.show_hud = args.profile
+    if args.metrics:
+        fish_tank.profiler.dump_to(args.metrics, args.metrics_interval)
+    try:
+        if args.headless:
+            elapsed = fish_tank.run_headless(args.steps)
+            print(f"Ran {args.steps} steps with {len(fish_tank.creatures)} creatures in {elapsed:.2f}s: "
+                  f"{args.steps / elapsed:.0f} steps/s")
+            if args.profile:
+                print("\n".join(fish_tank.profiler.overlay_lines()))
+            return
+        fish_tank.run()
+    finally:
+        fish_tank.profiler.close()  # ✅ Flushes the last metrics line and closes --metrics
 
 if __name__ == "__main__":
     main()
@@ -1,3 +0,0 @@
-#!/bin/bash
-source ./.venv/bin/activate
-sudo /home/luke/dev/fishbowl/.venv/bin/python "$@"
\ No newline at end of file
@@ -0,0 +1,67 @@
+import argparse
+import sys
+import time
+from lib.v1.headless import state_digest
+from lib.v1.recording import Player, Recording
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Replay a session recorded with main_v1.py --record, headless.")
+    parser.add_argument("recording", help="The recording to replay")
+    parser.add_argument("--until", type=int, help="Stop at this tick instead of the end of the recording")
+    parser.add_argument("--profile-from", type=int,
+                        help="Turn the profiler on at this tick and print its numbers when the replay stops")
+    parser.add_argument("--metrics", help="Append a JSON line of profiler metrics to this file every --metrics-interval")
+    parser.add_argument("--metrics-interval", type=float, default=10.0, help="Seconds between metrics lines")
+    parser.add_argument("--digest-every", type=int,
+                        help="Print the state digest every N ticks, to find where two replays part ways")
+    parser.add_argument("--dump", help="Save the tank here when the replay stops (.json for JSON)")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    recording = Recording.read(args.recording)
+    player = Player(recording)
+    bowl = player.bowl
+    until = recording.ticks if args.until is None else min(args.until, recording.ticks)
+
+    # ✅ Everything the replay stops at along the way, in order
+    stops = {until}
+    if args.profile_from is not None:
+        stops.add(min(args.profile_from, until))
+    if args.digest_every:
+        stops.update(range(args.digest_every, until, args.digest_every))
+
+    wall_start = time.perf_counter()
+    try:
+        for stop in sorted(stops):
+            player.run_until(stop)
+            if stop == args.profile_from:
+                bowl.profiler.enabled = True
+                if args.metrics:
+                    bowl.profiler.dump_to(args.metrics, args.metrics_interval)
+            if args.digest_every and stop % args.digest_every == 0:
+                print(f"Tick {stop}: {state_digest(bowl)}")
+    finally:
+        bowl.profiler.close()  # ✅ Flushes the last metrics line and closes --metrics
+    wall_seconds = time.perf_counter() - wall_start
+
+    print(f"Replayed {player.tick} ticks in {wall_seconds:.2f}s: population {len(bowl.creatures)}, "
+          f"cookies {len(bowl.cookies)}")
+    print(f"State digest: {state_digest(bowl)}")
+    if bowl.profiler.enabled:
+        print("\n".join(bowl.profiler.overlay_lines()))
+    if args.dump:
+        bowl.save_state(args.dump)
+
+    matches = player.matches()
+    if matches is True:
+        print("✅ Matches the recorded session")
+    elif matches is False:
+        print("❌ Differs from the recorded session")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()